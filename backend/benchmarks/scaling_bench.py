@@ -0,0 +1,220 @@
+# backend/benchmarks/scaling_bench.py
+"""
+Scaling Benchmark - Forge Time and Memory Curves over Synthetic Tiers
+
+For each tier (1k / 10k / 100k / 1m products) this:
+1. generates a synthetic source directory (benchmarks/synthetic_catalog.py)
+2. runs a full HalilitCatalog.build() against it in a fresh process, so peak
+   RSS belongs to that tier alone
+3. collects wall time, peak RSS and per-stage totals from build_report.json
+
+Then it fits the log-log slope between consecutive tiers for every stage:
+~1.0 means linear, anything well above flags a super-linear stage (fuzzy
+merge against the brand-site records, relationship discovery) and the tier
+where it starts to break.
+
+The relationship engine is not part of the forge, so it is timed separately
+on the same synthetic records (--relationships), capped because it compares
+every product against every other one.
+
+Generated sources and build outputs live under --workdir; nothing is written
+to data/ or frontend/public/data.
+
+Usage (from backend/):
+    python3 benchmarks/scaling_bench.py --tiers 1k 10k
+    python3 benchmarks/scaling_bench.py --tiers 1k 10k 100k --relationships --report /tmp/scaling_report.json
+"""
+
+import argparse
+import json
+import math
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.synthetic_catalog import SEED, TIERS, generate
+from services.build_profiler import peak_rss_kb
+from services.catalog_writer import dump_json
+from services.product_stream import iter_products
+
+SUPERLINEAR_SLOPE = 1.2  # Log-log slope above which a stage is flagged
+RELATIONSHIP_CAP = 2_000  # Worse than quadratic: cap the products fed to the relationship engine
+
+
+def run_build(source_dir: Path, output_dir: Path) -> Dict[str, Any]:
+    """Full, uncompressed forge build of `source_dir` (runs in the child process)."""
+    import logging
+    import forge_backbone
+
+    logging.getLogger().setLevel(logging.WARNING)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Keep match caches, reports and the manifest next to the benchmark output
+    forge_backbone.MATCH_CACHE_DIR = output_dir / "cache" / "matches"
+    forge_backbone.ASSET_GC_REPORT_PATH = output_dir / "asset_gc_report.json"
+    forge_backbone.BUILD_REPORT_PATH = output_dir / "build_report.json"
+
+    catalog = forge_backbone.HalilitCatalog(full_rebuild=True, compression=[])
+    catalog.source_dir = source_dir
+    catalog.output_dir = output_dir / "data"
+    catalog.manifest.path = output_dir / "build_manifest.json"
+
+    start = time.perf_counter()
+    ok = catalog.build()
+    wall = time.perf_counter() - start
+
+    report_path = forge_backbone.BUILD_REPORT_PATH
+    report = json.loads(report_path.read_text(encoding='utf-8')) if report_path.exists() else {}
+    return {
+        "ok": ok,
+        "wall_s": round(wall, 3),
+        "peak_rss_kb": peak_rss_kb(),
+        "products": catalog.stats["products_total"],
+        "brands": catalog.stats["brands_processed"],
+        "errors": len(catalog.stats["errors"]),
+        "stages": {s["stage"]: s["wall_s"] for s in report.get("stages", [])},
+        "brand_stages": {name: totals["wall_s"] for name, totals in report.get("brand_stage_totals", {}).items()},
+    }
+
+
+def run_tier(tier: str, workdir: Path, seed: int, keep: bool) -> Dict[str, Any]:
+    products = TIERS[tier]
+    source_dir = workdir / tier / "blueprints"
+    output_dir = workdir / tier / "out"
+    shutil.rmtree(workdir / tier, ignore_errors=True)
+
+    start = time.perf_counter()
+    generate(source_dir, products, seed=seed)
+    generate_s = time.perf_counter() - start
+    print(f"🧪 [{tier}] Generated {products} products in {generate_s:.1f}s")
+
+    # Fresh interpreter per tier: ru_maxrss never goes down within a process
+    child = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--child", str(source_dir), str(output_dir)],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if child.returncode != 0:
+        print(f"❌ [{tier}] Build process failed:\n{child.stderr[-2000:]}")
+        return {"tier": tier, "products": products, "ok": False}
+
+    result = json.loads(child.stdout.strip().splitlines()[-1])
+    result.update({"tier": tier, "input_products": products, "generate_s": round(generate_s, 3)})
+    print(f"⏱️  [{tier}] {result['wall_s']:.2f}s wall, {result['peak_rss_kb'] / 1024:.0f} MB peak, "
+          f"{result['products']} products forged")
+
+    if not keep:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return result
+
+
+def time_relationships(source_dir: Path, limit: int) -> Dict[str, Any]:
+    """Relationship discovery over the first `limit` synthetic records."""
+    from services.relationship_engine import ProductRelationshipEngine
+
+    products = []
+    for path in sorted(source_dir.glob("*_blueprint.json")):
+        for product in iter_products(path):
+            # The engine only relates products that carry a SKU
+            product.setdefault("sku", product["id"])
+            products.append(product)
+            if len(products) >= limit:
+                break
+        if len(products) >= limit:
+            break
+
+    start = time.perf_counter()
+    ProductRelationshipEngine().analyze_all_blueprints(products)
+    return {"products": len(products), "wall_s": round(time.perf_counter() - start, 3)}
+
+
+def slope(n1: float, t1: Optional[float], n2: float, t2: Optional[float]) -> Optional[float]:
+    """Log-log growth exponent between two points (1.0 = linear)."""
+    if not t1 or not t2 or t1 <= 0 or t2 <= 0 or n1 == n2:
+        return None
+    return round(math.log(t2 / t1) / math.log(n2 / n1), 2)
+
+
+def scaling_curves(results: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Slope of every measured series between consecutive tiers."""
+    ok = [r for r in results if r.get("ok")]
+    curves: Dict[str, List[Dict[str, Any]]] = {}
+
+    def series(name: str, pick):
+        points = []
+        for before, after in zip(ok, ok[1:]):
+            exponent = slope(before["input_products"], pick(before), after["input_products"], pick(after))
+            points.append({"from": before["tier"], "to": after["tier"], "slope": exponent,
+                           "superlinear": exponent is not None and exponent > SUPERLINEAR_SLOPE})
+        curves[name] = points
+
+    series("total_wall", lambda r: r["wall_s"])
+    series("peak_rss", lambda r: r["peak_rss_kb"])
+    for stage in sorted({s for r in ok for s in r["stages"]}):
+        series(f"stage.{stage}", lambda r, s=stage: r["stages"].get(s))
+    for stage in sorted({s for r in ok for s in r["brand_stages"]}):
+        series(f"brand.{stage}", lambda r, s=stage: r["brand_stages"].get(s))
+    relationship_runs = [r for r in ok if "relationships" in r]
+    if len(relationship_runs) > 1:
+        points = []
+        for before, after in zip(relationship_runs, relationship_runs[1:]):
+            b, a = before["relationships"], after["relationships"]
+            exponent = slope(b["products"], b["wall_s"], a["products"], a["wall_s"])
+            points.append({"from": before["tier"], "to": after["tier"], "slope": exponent,
+                           "superlinear": exponent is not None and exponent > SUPERLINEAR_SLOPE})
+        curves["relationships"] = points
+    return curves
+
+
+def print_curves(curves: Dict[str, List[Dict[str, Any]]]):
+    print("\n📈 Log-log slopes (1.0 = linear)")
+    for name, points in curves.items():
+        cells = "  ".join(
+            f"{p['from']}→{p['to']}: {'n/a' if p['slope'] is None else p['slope']:>5}{' ⚠️' if p['superlinear'] else ''}"
+            for p in points
+        )
+        print(f"   {name:24s} {cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Forge scaling benchmark over synthetic tiers")
+    parser.add_argument("--tiers", nargs="+", choices=list(TIERS), default=["1k", "10k", "100k"])
+    parser.add_argument("--workdir", default="/tmp/hsc_scaling", help="Where sources and build outputs go")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--relationships", action="store_true", help="Also time the relationship engine per tier")
+    parser.add_argument("--relationship-cap", type=int, default=RELATIONSHIP_CAP)
+    parser.add_argument("--keep", action="store_true", help="Keep build outputs (sources are always kept)")
+    parser.add_argument("--report", default=None, help="Report path (default: <workdir>/scaling_report.json)")
+    parser.add_argument("--child", nargs=2, metavar=("SOURCE", "OUTPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_build(Path(args.child[0]), Path(args.child[1]))))
+        return
+
+    workdir = Path(args.workdir)
+    tiers = sorted(args.tiers, key=TIERS.get)
+    results = []
+    for tier in tiers:
+        result = run_tier(tier, workdir, args.seed, args.keep)
+        if args.relationships and result.get("ok"):
+            limit = min(TIERS[tier], args.relationship_cap)
+            result["relationships"] = time_relationships(workdir / tier / "blueprints", limit)
+            print(f"🔗 [{tier}] Relationships over {result['relationships']['products']} products: "
+                  f"{result['relationships']['wall_s']:.2f}s")
+        results.append(result)
+
+    curves = scaling_curves(results)
+    print_curves(curves)
+
+    report_path = Path(args.report) if args.report else workdir / "scaling_report.json"
+    dump_json({"seed": args.seed, "tiers": results, "curves": curves}, report_path, pretty=True)
+    print(f"\n💾 Report: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+# backend/benchmarks/synthetic_catalog.py
+"""
+Synthetic Catalog Generator - Deterministic Forge Inputs at Any Scale
+
+Writes a data/blueprints-shaped source directory with N products spread over
+Zipf-sized brands, so the largest brand dominates like accessories/roland do:
+
+- <slug>_blueprint.json   Halilit records: prices (ILS, some missing or as
+                          strings), halilit URLs, Hebrew/English name mixes
+- <slug>_brand.json       Brand-site records for most of those products:
+                          English names, model numbers, specs, descriptions
+- <slug>_commercial.json  For a share of brands whose blueprint is empty
+                          (exercises the forge's commercial fallback)
+
+Name collisions are built in: model families share prefixes (FP-30, FP-30X,
+FP-30X BK), brand-site names drop or reorder words, a slice of products
+shares an exact model number / SKU, and some Halilit names are duplicates.
+
+Same seed + size = byte-identical files. Every record is derived from its
+own seeded RNG, so generation streams at constant memory even at 1M products.
+
+Usage (from backend/):
+    python3 benchmarks/synthetic_catalog.py --tier 10k --output /tmp/synthetic/10k
+    python3 benchmarks/synthetic_catalog.py --products 2500 --brands 12 --output /tmp/synthetic/custom
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.catalog_writer import dump_json, dump_json_list
+
+SEED = 1337
+TIERS = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+ZIPF_EXPONENT = 1.1
+BRAND_SITE_SHARE = 0.7  # Halilit products that have a brand-site record
+EXACT_KEY_SHARE = 0.3  # ...of which share an exact SKU / model number
+HEBREW_SHARE = 0.25  # Halilit names with a Hebrew product-type prefix
+HEBREW_ONLY_SHARE = 0.05  # Halilit records that are Hebrew end to end
+DUPLICATE_NAME_SHARE = 0.02  # Halilit records repeating an earlier name
+COMMERCIAL_FALLBACK_SHARE = 0.1  # Brands shipping an empty blueprint + commercial file
+FAMILY_SIZE = 6  # Models per family (shared name prefix)
+
+BRAND_WORDS = ["Aurora", "Basalt", "Cobalt", "Delta", "Ember", "Fjord", "Granite", "Halcyon", "Ion", "Juniper",
+               "Krypton", "Lumen", "Meridian", "Nimbus", "Onyx", "Pulsar", "Quartz", "Radiant", "Sable", "Tundra"]
+BRAND_SUFFIXES = ["Audio", "Instruments", "Sound", "Pro", "Music", "Acoustics", "Labs", "Electronics"]
+
+CATEGORIES = {
+    "Keyboards": ["Digital Piano", "Synthesizer", "Stage Piano", "Arranger", "MIDI Controller"],
+    "Drums": ["Electronic Kit", "Snare", "Cymbal", "Drum Pad", "Percussion"],
+    "Guitars": ["Electric Guitar", "Bass Guitar", "Acoustic Guitar", "Guitar Amp", "Effects Pedal"],
+    "Studio": ["Audio Interface", "Studio Monitor", "Microphone", "Preamp", "Headphones"],
+    "Live Sound": ["Mixer", "PA Speaker", "Wireless System", "Stage Monitor", "Power Amp"],
+    "Accessories": ["Cable", "Stand", "Case", "Power Supply", "Pedalboard"],
+}
+HALILIT_CATEGORIES = ["general", "general", "Keyboards", "Drums", "Guitars", "Studio", "Accessories", "other"]
+HEBREW_TYPES = ["מקלדת", "פסנתר דיגיטלי", "מגבר לגיטרה", "כבל", "סטנד", "תיק", "מיקסר", "מיקרופון", "אוזניות", "תופים"]
+HEBREW_FILLER = ["איכותי", "מקצועי", "חדש", "במלאי", "משלוח", "מהיר", "אחריות", "יבואן", "רשמי"]
+ADJECTIVES = ["compact", "professional", "versatile", "lightweight", "flagship", "rugged", "low-noise", "expressive"]
+COLORS = ["BK", "WH", "RD", "SV"]
+
+
+def brand_names(count: int) -> List[str]:
+    names = []
+    for i in range(count):
+        word = BRAND_WORDS[i % len(BRAND_WORDS)]
+        suffix = BRAND_SUFFIXES[(i // len(BRAND_WORDS)) % len(BRAND_SUFFIXES)]
+        names.append(f"Synth {word} {suffix}" if i < len(BRAND_WORDS) * len(BRAND_SUFFIXES) else f"Synth Brand {i}")
+    return names
+
+
+def brand_sizes(total: int, brands: int) -> List[int]:
+    """Zipf-distributed brand sizes summing to `total` (largest first)."""
+    weights = [1.0 / (rank ** ZIPF_EXPONENT) for rank in range(1, brands + 1)]
+    scale = total / sum(weights)
+    sizes = [int(w * scale) for w in weights]
+    for i in range(total - sum(sizes)):
+        sizes[i % brands] += 1
+    return sizes
+
+
+def default_brand_count(total: int) -> int:
+    return max(5, min(120, total // 250))
+
+
+class SyntheticBrand:
+    """Deterministic product generator for one brand."""
+
+    def __init__(self, name: str, size: int, seed: int):
+        self.name = name
+        self.slug = name.lower().replace(" ", "-")
+        self.size = size
+        self.seed = seed
+        self.prefix = "".join(word[0] for word in name.split()[1:]).upper()
+
+    def _rng(self, kind: str, i: int) -> random.Random:
+        return random.Random(f"{self.seed}:{self.slug}:{kind}:{i}")
+
+    def model(self, i: int) -> Dict:
+        """The 'true' product behind Halilit record i (shared by both sources)."""
+        rng = self._rng("model", i // FAMILY_SIZE)
+        main = rng.choice(sorted(CATEGORIES))
+        sub = rng.choice(CATEGORIES[main])
+        family = f"{self.prefix}-{rng.randint(1, 99) * 10}"
+        variant = i % FAMILY_SIZE
+        # FP-30, FP-30X, FP-30X BK, FP-30X WH ... near-identical names inside a family
+        code = family if variant == 0 else f"{family}X" if variant == 1 else f"{family}X {COLORS[variant % len(COLORS)]}"
+        return {"code": code, "main": main, "sub": sub, "family": family}
+
+    def halilit_record(self, i: int) -> Dict:
+        rng = self._rng("halilit", i)
+        model = self.model(i)
+        name = f"{self.name.split(' ', 1)[1]} {model['code']}"
+        if rng.random() < DUPLICATE_NAME_SHARE and i > 0:
+            name = f"{self.name.split(' ', 1)[1]} {self.model(rng.randrange(i))['code']}"
+
+        roll = rng.random()
+        if roll < HEBREW_ONLY_SHARE:
+            name = f"{rng.choice(HEBREW_TYPES)} {' '.join(rng.sample(HEBREW_FILLER, 2))}"
+            description = " ".join(rng.choice(HEBREW_FILLER) for _ in range(12))
+        elif roll < HEBREW_ONLY_SHARE + HEBREW_SHARE:
+            name = f"{rng.choice(HEBREW_TYPES)} {name}"
+            description = name
+        else:
+            description = f"{name} {model['sub']}"
+
+        price = round(rng.lognormvariate(7.0, 1.2), 0)
+        price_value = None if rng.random() < 0.05 else (str(price) if rng.random() < 0.2 else price)
+        item_id = f"{self.slug}_{i}"
+        record = {
+            "id": item_id,
+            "name": name,
+            "description": description,
+            "category": rng.choice(HALILIT_CATEGORIES),
+            "image_url": f"/data/thumbnails/{item_id}.jpg",
+            "product_url": f"https://www.halilit.com/items/{900000 + i}-{self.slug}",
+            "halilit_url": f"https://www.halilit.com/items/{900000 + i}-{self.slug}",
+            "is_sold": price_value is not None,
+            "price": price_value,
+            "status": "IN_STOCK" if rng.random() < 0.8 else "OUT_OF_STOCK",
+        }
+        if self._rng("key", i).random() < BRAND_SITE_SHARE * EXACT_KEY_SHARE:
+            record["sku"] = model["code"].replace(" ", "-")
+        return record
+
+    def brand_site_record(self, i: int) -> Optional[Dict]:
+        """Official record for Halilit record i, or None if the brand site lacks it."""
+        if self._rng("site", i).random() >= BRAND_SITE_SHARE:
+            return None
+        rng = self._rng("official", i)
+        model = self.model(i)
+        words = [self.name.split(' ', 1)[1], model["code"], model["sub"]]
+        style = rng.random()
+        if style < 0.4:
+            name = model["code"]  # Brand sites often drop the brand name
+        elif style < 0.7:
+            name = " ".join(words)
+        else:
+            name = f"{model['code']} {rng.choice(ADJECTIVES).title()} {model['sub']}"
+        record = {
+            "id": f"{self.slug}-official-{i}",
+            "name": name,
+            "description": f"The {name} is a {rng.choice(ADJECTIVES)} {model['sub'].lower()} "
+                           f"from the {model['family']} series. " * rng.randint(1, 4),
+            "category": model["main"],
+            "subcategory": model["sub"],
+            "image_url": f"https://cdn.example.com/{self.slug}/{model['code'].replace(' ', '_')}.jpg",
+            "specs": {f"spec_{k}": f"{rng.randint(1, 999)} units" for k in range(rng.randint(3, 12))},
+        }
+        if self._rng("key", i).random() < BRAND_SITE_SHARE * EXACT_KEY_SHARE:
+            record["model_number"] = model["code"].replace(" ", "-")
+        return record
+
+    def iter_halilit(self) -> Iterator[Dict]:
+        for i in range(self.size):
+            yield self.halilit_record(i)
+
+    def iter_brand_site(self) -> Iterator[Dict]:
+        for i in range(self.size):
+            record = self.brand_site_record(i)
+            if record:
+                yield record
+
+
+def generate(output_dir: Path, products: int, brands: Optional[int] = None, seed: int = SEED) -> Dict:
+    """
+    Write a synthetic source directory.
+
+    Returns:
+        Summary (also written to <output_dir>/synthetic_manifest.json)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    brands = brands or default_brand_count(products)
+
+    summary = {"seed": seed, "products": products, "brands": []}
+    for name, size in zip(brand_names(brands), brand_sizes(products, brands)):
+        brand = SyntheticBrand(name, size, seed)
+        fallback = random.Random(f"{seed}:{brand.slug}:fallback").random() < COMMERCIAL_FALLBACK_SHARE
+        if fallback:
+            # Empty blueprint: the forge falls back to <slug>_commercial.json
+            dump_json_list([], output_dir / f"{brand.slug}_blueprint.json")
+            dump_json_list(brand.iter_halilit(), output_dir / f"{brand.slug}_commercial.json")
+        else:
+            dump_json_list(brand.iter_halilit(), output_dir / f"{brand.slug}_blueprint.json")
+        site_count = dump_json_list(brand.iter_brand_site(), output_dir / f"{brand.slug}_brand.json")
+        summary["brands"].append({"slug": brand.slug, "products": size, "brand_site": site_count,
+                                  "commercial_fallback": fallback})
+
+    dump_json(summary, output_dir / "synthetic_manifest.json", pretty=True)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deterministic synthetic forge inputs")
+    parser.add_argument("--tier", choices=sorted(TIERS), help="Preset size (1k / 10k / 100k / 1m products)")
+    parser.add_argument("--products", type=int, help="Explicit product count (overrides --tier)")
+    parser.add_argument("--brands", type=int, default=None, help="Brand count (default scales with size)")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", required=True, help="Source directory to write")
+    args = parser.parse_args()
+
+    products = args.products or TIERS.get(args.tier or "1k")
+    summary = generate(Path(args.output), products, args.brands, args.seed)
+    print(f"🧪 Generated {summary['products']} products over {len(summary['brands'])} brands → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
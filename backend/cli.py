@@ -0,0 +1,137 @@
+# backend/cli.py
+"""
+HSC Backend CLI - One Entry Point, Lazy Subcommands
+
+    python3 cli.py forge [--full --watch --daemon ...]   forge_backbone.py
+    python3 cli.py ingest [--mode commercial_sync]       mass_ingest_protocol.py
+    python3 cli.py radar [--brand roland]                 services/global_radar.py
+    python3 cli.py gaps [roland nord ...]                 services/gap_analyzer.py
+    python3 cli.py verify [--workers 8]                   services/catalog_verifier.py
+    python3 cli.py mirror [--per-host 4 --dry-run]        services/image_mirror.py
+    python3 cli.py check-startup [--budget-ms 300]        Import-time budget (CI)
+
+Nothing below a subcommand is imported until that subcommand runs, and the
+entry modules themselves defer their heavy stacks (rembg / onnxruntime / PIL,
+Playwright scrapers, requests) to the code paths that use them. check-startup
+imports each entry module in a fresh interpreter and fails when one is over
+budget or pulls in a heavy dependency at import time.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BACKEND_DIR)
+
+STARTUP_BUDGET_MS = 300
+# Must not be loaded just by importing an entry module
+HEAVY_MODULES = ("rembg", "onnxruntime", "PIL", "playwright", "requests", "bs4", "numpy", "httpx",
+                 "sentence_transformers", "google.genai")
+# Modules behind the subcommands (global_radar is skipped while it does not parse)
+ENTRY_MODULES = ("cli", "forge_backbone", "mass_ingest_protocol", "services.catalog_verifier",
+                 "services.gap_analyzer", "services.forge_daemon", "services.image_mirror")
+
+
+def _radar(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="cli.py radar", description="Map the global product scope of brand sites")
+    parser.add_argument("--brand", default=None, help="Scan one brand (default: compile the full strategic manifest)")
+    args = parser.parse_args(argv)
+
+    from services.global_radar import GlobalRadar
+    radar = GlobalRadar()
+    if args.brand:
+        radar.scan_brand(args.brand, "")
+    else:
+        radar.compile_manifest()
+    return 0
+
+
+def _gaps(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="cli.py gaps", description="Compare radar scans with local blueprints")
+    parser.add_argument("brands", nargs="*", default=["roland"])
+    args = parser.parse_args(argv)
+
+    from services.gap_analyzer import GapAnalyzer
+    analyzer = GapAnalyzer()
+    for brand in args.brands:
+        analyzer.run_analysis(brand)
+    return 0
+
+
+def measure_import(module: str) -> Dict:
+    """Import `module` in a fresh interpreter: {"module", "ms", "heavy": [...]} or {"module", "error"}."""
+    probe = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'ms': round(elapsed, 1), 'heavy': heavy}))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=BACKEND_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        error = (result.stderr.strip().splitlines() or ["import failed"])[-1]
+        return {"module": module, "error": error}
+    return {"module": module, **json.loads(result.stdout.strip().splitlines()[-1])}
+
+
+def _check_startup(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="cli.py check-startup", description="Import-time budget for the entry modules")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("modules", nargs="*", default=list(ENTRY_MODULES))
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for module in args.modules:
+        row = measure_import(module)
+        if "error" in row:
+            print(f"❌ {module:30s} import failed: {row['error']}")
+            failed += 1
+        elif row["heavy"]:
+            print(f"❌ {module:30s} {row['ms']:7.1f} ms, loads {', '.join(row['heavy'])} at import")
+            failed += 1
+        elif row["ms"] > args.budget_ms:
+            print(f"❌ {module:30s} {row['ms']:7.1f} ms (budget {args.budget_ms:.0f} ms)")
+            failed += 1
+        else:
+            print(f"✅ {module:30s} {row['ms']:7.1f} ms")
+    return 1 if failed else 0
+
+
+# name -> ("module:function" or callable taking argv, help)
+COMMANDS: Dict[str, Tuple[Union[str, Callable[[List[str]], int]], str]] = {
+    "forge": ("forge_backbone:main", "Build the static catalog into frontend/public/data"),
+    "ingest": ("mass_ingest_protocol:main", "Scrape official brand sites or sync Halilit"),
+    "radar": (_radar, "Map the global product scope of brand sites"),
+    "gaps": (_gaps, "Find globally listed products missing from the local blueprints"),
+    "verify": ("services.catalog_verifier:main", "Verify a generated catalog"),
+    "mirror": ("services.image_mirror:main", "Download remote catalog images and rewrite catalogs to local paths"),
+    "check-startup": (_check_startup, "Fail when an entry module imports slowly or loads heavy dependencies"),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help") or argv[0] not in COMMANDS:
+        print("usage: cli.py <command> [args...]\n\ncommands:")
+        for name, (_, help_text) in COMMANDS.items():
+            print(f"  {name:14s} {help_text}")
+        if argv and argv[0] not in ("-h", "--help"):
+            print(f"\n❌ Unknown command {argv[0]!r}")
+            return 2
+        return 0
+
+    target, _ = COMMANDS[argv[0]]
+    if isinstance(target, str):
+        module_name, function = target.split(":")
+        target = getattr(importlib.import_module(module_name), function)
+    return target(argv[1:]) or 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -9,30 +9,55 @@ This script runs offline to build verified, static catalog data that the fronten
 No runtime API calls. No database queries. Just pristine JSON.
 
 Usage:
-    python3 forge_backbone.py
+    python3 forge_backbone.py           # Incremental (unchanged brands are reused)
+    python3 forge_backbone.py --full    # Rebuild every brand from scratch
+    python3 forge_backbone.py --executor process --workers 16   # Scale across cores
+    python3 forge_backbone.py --pretty  # Indented output for debugging
+    python3 forge_backbone.py --zstd --zstd-dict  # Add dictionary-trained .zst sidecars
+    python3 forge_backbone.py --deterministic     # Hashed brand files + asset-manifest.json
+    python3 forge_backbone.py --mirror-images     # Download remote product images to data/mirror/ while forging
+    python3 forge_backbone.py --watch   # Build, then re-forge only the brands whose sources change
+    python3 forge_backbone.py --daemon  # Warm forge on data/cache/forge.sock (see services/forge_daemon.py)
     
 Result:
     frontend/public/data/ is populated with:
     - index.json (The Spine - Master Catalog Index)
     - <brand>.json (Individual Brand Catalogs)
+    - lists/<brand>/<n>.json (Slim paginated product lists for grids)
+    - details/<brand>/<n>.json (Full product detail shards, loaded on demand)
+    - *.json.gz / *.json.br (Precompressed sidecars for static hosting)
+    data/reports/ (not deployed) gets build_report.json (per-stage and per-brand
+    wall/CPU/RSS/I/O costs), compression_report.json and asset_gc_report.json.
 """
 
+import argparse
+import importlib
 import json
 import os
+import shutil
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 import logging
-import requests
-import urllib.request
-import urllib.error
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from io import BytesIO
-import base64
-from services.visual_factory import VisualFactory
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+# Heavy optional stacks (requests, rembg/onnxruntime/PIL via VisualFactory) are imported on first use
 from models.taxonomy_registry import TaxonomyRegistry, get_registry
-from services.catalog_verifier import CatalogVerifier
+from services.catalog_verifier import CatalogVerifier, verify_brand_file
+from services.build_manifest import BuildManifest, hash_file, fingerprint
+from services.entity_resolver import EntityResolver
+from services.match_cache import MatchCache
+from services.catalog_writer import CatalogStreamWriter, ShardedListWriter, dump_json
+from services.artifact_compressor import ArtifactCompressor, train_zstd_dictionary, ZSTD_DICT_NAME
+from services.build_profiler import BuildProfiler, StageTimer
+from services.product_stream import ProductStream
+from services.source_registry import SourceRegistry, BrandSources, brand_key
+from services.forge_watcher import SourceWatcher, POLL_INTERVAL, DEBOUNCE
+from services.asset_gc import AssetGarbageCollector
+from services.asset_index import AssetIndex
+from services.image_mirror import ImageMirror
+from services.language_filter import has_hebrew, strip_hebrew, ascii_only
 
 # --- SETUP LOGGING ---
 logging.basicConfig(
@@ -45,6 +70,32 @@ logger = logging.getLogger(__name__)
 SOURCE_DIR = Path("data/blueprints")  # Where scraper outputs live (Data Vault)
 PUBLIC_DATA_PATH = Path("../frontend/public/data")  # The "Live" destination
 LOGOS_DIR = PUBLIC_DATA_PATH / "logos"  # Logo destination
+MANIFEST_PATH = Path("data/cache/forge_manifest.json")  # Incremental build state
+ASSET_MANIFEST_NAME = "asset-manifest.json"  # Deterministic mode: slug -> hashed file + timestamps
+BUILD_REPORT_PATH = Path("data/reports/build_report.json")  # Per-stage / per-brand wall, CPU, RSS and I/O
+# Written into the public tree by earlier builds; removed so they stop being deployed
+LEGACY_PUBLIC_REPORTS = ("build_report.json", "compression_report.json")
+LIST_PAGE_SIZE = 500  # Products per slim list page (first paint)
+DETAIL_CHUNK_SIZE = 50  # Products per detail shard (lazy loaded)
+MATCH_CACHE_DIR = Path("data/cache/matches")  # Remembered commercial ↔ brand-site pairings
+ASSET_GC_REPORT_PATH = Path("data/reports/asset_gc_report.json")  # Orphaned image / thumbnail listing
+COMPRESSION_REPORT_PATH = Path("data/reports/compression_report.json")  # Raw vs .gz/.br/.zst sizes per artifact
+COMPRESSION_STATE_PATH = Path("data/cache/compression_state.json")  # Source hash each sidecar was made from
+MATCH_OVERRIDES_PATH = Path("data/match_overrides.json")  # Manual pairing corrections
+BRAND_MAPS_PATH = Path("config/brand_maps.py")  # Watched in --watch mode (official logo URLs)
+# Forge modules whose code shapes every brand file: an edit invalidates the build manifest
+FINGERPRINTED_MODULES = (
+    "models/taxonomy_registry.py",
+    "services/catalog_verifier.py",
+    "services/catalog_writer.py",
+    "services/entity_resolver.py",
+    "services/image_mirror.py",
+    "services/language_filter.py",
+    "services/match_cache.py",
+    "services/product_stream.py",
+    "services/source_registry.py",
+)
+THREAD_WORKERS = 8  # Default for the thread executor (I/O bound logo downloads)
 CATALOG_VERSION = "3.9.0"
 
 # Brand color themes (WCAG AA compliant)
@@ -125,14 +176,42 @@ BRAND_THEMES = {
 class HalilitCatalog:
     """The Halilit Catalog System - Transforms raw data into production-ready static JSON catalogs."""
     
-    def __init__(self):
+    def __init__(self, full_rebuild: bool = False, executor: str = "thread", max_workers: Optional[int] = None,
+                 pretty: bool = False, compression: Optional[List[str]] = None, zstd_dict: bool = False,
+                 deterministic: bool = False, asset_gc: str = "report", mirror_images: bool = False):
         self.source_dir = SOURCE_DIR
         self.output_dir = PUBLIC_DATA_PATH
-        # Initialize Visual Factory
-        self.visual_factory = VisualFactory()
+        self.full_rebuild = full_rebuild
+        # Compact, key-sorted JSON in production; indented with --pretty
+        self.pretty = pretty
+        # Precompressed sidecar formats (empty list disables the stage)
+        self.compression = ["gzip", "brotli"] if compression is None else compression
+        self.zstd_dict = zstd_dict
+        # Deterministic mode: no timestamps inside catalogs, sorted brands and
+        # content-hashed brand filenames (roland.3fa2c1d9e0.json) for immutable caching
+        self.deterministic = deterministic
+        # Orphaned product_images / thumbnails: "report", "delete", "quarantine" or "off"
+        self.asset_gc = asset_gc
+        # Download remote product images into data/mirror/ and point the catalogs at them
+        self.mirror_images = mirror_images
+        self._image_mirror: Optional[ImageMirror] = None
+        # "thread" shares this instance; "process" forges brands in worker processes
+        # (JSON parsing, fuzzy merging and refinement are GIL-bound)
+        self.executor = executor
+        self.max_workers = max_workers
+        # Visual Factory (rembg + onnxruntime) loads on first use, see visual_factory
+        self._visual_factory = None
         # Initialize Taxonomy Registry for category validation
         self.taxonomy_registry = get_registry()
-        
+        # Daemon mode: parsed brand-site records kept between builds, keyed by path
+        # (None = one-shot build, records are read per brand and released)
+        self.content_cache: Optional[Dict[Path, Tuple[Tuple[int, int], List[Dict]]]] = None
+        self.lock = threading.Lock()
+        self.manifest = BuildManifest(MANIFEST_PATH, self._config_fingerprint())
+        self._reset_build_state()
+    
+    def _reset_build_state(self):
+        """Per-build results; the registries, visual factory and caches above outlive a build."""
         # Flat structure matching Frontend Interface (MasterIndex)
         self.master_index = {
             "version": CATALOG_VERSION,
@@ -145,11 +224,59 @@ class HalilitCatalog:
         }
         self.stats = {
             "brands_processed": 0,
+            "brands_reused": 0,
             "products_total": 0,
             "images_verified": 0,
             "errors": []
         }
-        self.lock = threading.Lock()
+        # Snapshot of logos / images under frontend/public, taken once per build
+        self._asset_index: Optional[AssetIndex] = None
+        # Per-brand verifier results (stats + issues), collected while brands are forged
+        self.brand_verification: Dict[str, Dict[str, Any]] = {}
+        self.profiler = BuildProfiler()
+    
+    def _config_fingerprint(self) -> str:
+        """Fingerprint of every global input that shapes all brand files."""
+        try:
+            from config.brand_maps import BRAND_MAPS
+            brand_logos = {slug: cfg.get('logo_url') for slug, cfg in BRAND_MAPS.items()}
+        except Exception:
+            brand_logos = {}
+        
+        registry = self.taxonomy_registry
+        return fingerprint(
+            CATALOG_VERSION,
+            BRAND_THEMES,
+            brand_logos,
+            {cat_id: cat.label for cat_id, cat in registry.UNIVERSAL_CATEGORIES.items()},
+            registry.BRAND_TAXONOMIES,
+            registry.GLOBAL_KEYWORD_RULES,
+            hash_file(Path(__file__)),
+            {module: hash_file(Path(__file__).parent / module) for module in FINGERPRINTED_MODULES},
+            {"pretty": self.pretty, "deterministic": self.deterministic, "mirror_images": self.mirror_images},
+        )
+    
+    @property
+    def visual_factory(self):
+        """Image pipeline; importing it loads rembg, onnxruntime and PIL, so only when a stage needs it."""
+        if self._visual_factory is None:
+            from services.visual_factory import VisualFactory
+            self._visual_factory = VisualFactory()
+        return self._visual_factory
+    
+    @property
+    def image_mirror(self) -> ImageMirror:
+        """Shared by the brand threads; its manifest makes reruns skip finished downloads."""
+        with self.lock:
+            if self._image_mirror is None:
+                self._image_mirror = ImageMirror(self.output_dir)
+        return self._image_mirror
+    
+    @property
+    def asset_index(self) -> AssetIndex:
+        if self._asset_index is None:
+            self._asset_index = AssetIndex(self.output_dir.parent)
+        return self._asset_index
     
     def _download_logo(self, logo_url: str, brand_slug: str) -> str:
         """
@@ -176,7 +303,7 @@ class HalilitCatalog:
         
         for filename in known_logo_files:
             local_file = assets_logo_dir / filename
-            if local_file.exists():
+            if self.asset_index.exists(local_file):
                 logger.info(f"       ⭐ Using local VIP logo for {brand_slug}: {filename}")
                 return f"/assets/logos/{filename}"
         
@@ -206,16 +333,18 @@ class HalilitCatalog:
             local_path = logos_dir / f"{brand_slug}_logo{ext}"
             
             # Skip if already downloaded
-            if local_path.exists():
+            if self.asset_index.exists(local_path):
                 return f"/data/logos/{brand_slug}_logo{ext}"
             
             # Download with timeout (Standardized via requests)
+            import requests
             headers = {'User-Agent': 'Mozilla/5.0 (Halilit Catalog Builder)'}
             response = requests.get(logo_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 with open(local_path, 'wb') as f:
                     f.write(response.content)
+                self.asset_index.add(local_path)
                 logger.info(f"      ✓ Downloaded logo: {brand_slug} ({len(response.content)} bytes)")
                 return f"/data/logos/{brand_slug}_logo{ext}"
             else:
@@ -227,12 +356,6 @@ class HalilitCatalog:
             # Fallback: return original URL and let browser fetch it
             return logo_url or f"/assets/logos/{brand_slug}_logo.png"
     
-    def _strip_hebrew(self, text: str) -> str:
-        """Remove Hebrew characters from text."""
-        if not text:
-            return ""
-        return ''.join(char for char in text if not ("\u0590" <= char <= "\u05FF"))
-
     def _enforce_naming_convention(self, name: str) -> str:
         """
         Enforce Halilit Naming Standards:
@@ -246,7 +369,7 @@ class HalilitCatalog:
         
         # 0. Strip Hebrew Characters (Bilingual Cleanup)
         # Often Halilit has "תיק לגיטרה Boss CB-20" -> We want "Boss CB-20"
-        name = self._strip_hebrew(name)
+        name = strip_hebrew(name)
         
         # 1. Clean spaces
         clean_name = " ".join(name.split())
@@ -280,22 +403,38 @@ class HalilitCatalog:
         logger.info(f"📚 [CATALOG] Building Halilit Catalog v{CATALOG_VERSION}...")
         logger.info(f"   Source: {self.source_dir.absolute()}")
         logger.info(f"   Output: {self.output_dir.absolute()}")
+        # Same instance may build repeatedly (daemon mode)
+        self._reset_build_state()
         
         try:
             # 1. Prepare Workspace
-            self._prepare_workspace()
+            with self.profiler.stage("prepare_workspace"):
+                self._prepare_workspace()
             
             # 2. Export Taxonomy Registry (before processing brands)
-            self._export_taxonomy()
+            with self.profiler.stage("export_taxonomy"):
+                self._export_taxonomy()
             
             # 3. Process Each Brand
-            self._forge_brands()
+            with self.profiler.stage("forge_brands"):
+                self._forge_brands()
             
             # 4. Finalize Catalog
-            self._finalize_catalog()
+            with self.profiler.stage("finalize"):
+                self._finalize_catalog()
+                self.manifest.save()
+            
+            # 4.2 Precompress artifacts for static hosting
+            with self.profiler.stage("compress"):
+                self._compress_artifacts()
             
             # 5. Verification
-            self._verify_output()
+            with self.profiler.stage("verify"):
+                self._verify_output()
+            
+            # 5.5 Orphaned asset collection (needs the final index)
+            with self.profiler.stage("asset_gc"):
+                self._collect_orphaned_assets()
             
             # 6. Report
             self._report()
@@ -311,7 +450,7 @@ class HalilitCatalog:
         """Export taxonomy registry to frontend for category navigation."""
         logger.info("   [1.5/5] Exporting Taxonomy Registry...")
         taxonomy_path = self.output_dir / "taxonomy.json"
-        self.taxonomy_registry.export_to_frontend(taxonomy_path)
+        self.taxonomy_registry.export_to_frontend(taxonomy_path, include_timestamp=not self.deterministic)
         logger.info(f"      ✓ Taxonomy exported: {len(self.taxonomy_registry.get_all_brands())} brands")
     
     def _prepare_workspace(self):
@@ -322,6 +461,9 @@ class HalilitCatalog:
             self.output_dir.mkdir(parents=True)
             logger.info(f"      Created {self.output_dir}")
         
+        # One directory walk answers every logo / image existence check of this build
+        self._asset_index = AssetIndex(self.output_dir.parent)
+        
         logger.info(f"      ✓ Catalog workspace ready")
     
     def _forge_brands(self):
@@ -338,290 +480,581 @@ class HalilitCatalog:
                 logger.warning("      No source data found. Using empty catalog.")
                 return
         
-        catalog_files = list(self.source_dir.glob("*.json"))
+        # One scan: blueprint / commercial / brand-site files grouped per brand
+        registry = SourceRegistry(self.source_dir).scan()
+        brand_sources = registry.forgeable()
         
-        if not catalog_files:
+        if not brand_sources:
             logger.warning(f"      No JSON files found in {self.source_dir}")
             return
+        logger.info(f"      🗂️  {len(brand_sources)} brands from {sum(len(s.files) for s in brand_sources)} source files")
+        
+        # --- INCREMENTAL: Reuse brands whose inputs are unchanged ---
+        if not self.full_rebuild:
+            self.manifest.load()
+        
+        pending = []
+        for cf in brand_sources:
+            input_hashes = self._hash_brand_inputs(cf)
+            cached = None if self.full_rebuild else self.manifest.lookup(cf.name, input_hashes, self.output_dir)
+            if cached:
+                self._register_brand(cached["entry"], cached["search_rows"], cached.get("verification"))
+                self.profiler.add_reused(cached["entry"]["slug"])
+                self.stats["brands_reused"] += 1
+            else:
+                pending.append((cf, input_hashes))
+        
+        self.manifest.prune(cf.name for cf in brand_sources)
+        logger.info(f"      ♻️  {self.stats['brands_reused']} unchanged brands reused, {len(pending)} to rebuild")
+        
+        if not pending:
+            return
         
-        # Filter out "-brand.json" and "_brand.json" files to avoid duplicates (only process catalogs)
-        catalog_files = [f for f in catalog_files if not ('_brand.json' in f.name or '-brand.json' in f.name)]
+        # Largest inputs first, so big catalogs (accessories, roland) don't end up as the long tail
+        pending.sort(key=lambda item: self._input_size(item[1]), reverse=True)
         
-        MAX_WORKERS = 8 # Parallel processing
-        logger.info(f"      🚀 Accelerating with {MAX_WORKERS} concurrent workers...")
+        if self.executor == "process":
+            max_workers = self.max_workers or os.cpu_count() or 1
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_forge_worker,
+                initargs=(str(self.source_dir), str(self.output_dir), self.pretty, self.deterministic,
+                          self.mirror_images)
+            )
+            submit = lambda cf: executor.submit(_forge_brand_in_worker, cf)
+        else:
+            max_workers = self.max_workers or THREAD_WORKERS
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            submit = lambda cf: executor.submit(self._process_brand, cf)
+        
+        logger.info(f"      🚀 Accelerating with {max_workers} concurrent {self.executor} workers...")
         
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            future_to_file = {executor.submit(self._process_brand, cf): cf for cf in catalog_files}
+        with executor:
+            future_to_file = {submit(cf): (cf, hashes) for cf, hashes in pending}
             
             for future in as_completed(future_to_file):
-                cf = future_to_file[future]
+                cf, input_hashes = future_to_file[future]
                 try:
-                    future.result()
+                    result = future.result()
+                    if self.executor == "process":
+                        # Worker instances keep their own stats; fold their errors back in
+                        with self.lock:
+                            self.stats["errors"].extend(result["errors"])
+                        result = result["result"]
+                    if result:
+                        self._register_brand(result["entry"], result["search_rows"], result["verification"])
+                        self.manifest.record(cf.name, input_hashes, result["entry"], result["search_rows"],
+                                             result["verification"])
+                        self.profiler.add_brand(result["entry"]["slug"], cf.name, result["entry"]["product_count"], result["profile"])
                 except Exception as e:
                     logger.error(f"      ❌ Failed: {cf.name} - {e}")
                     with self.lock:
                         self.stats["errors"].append(str(e))
     
-    def _process_brand(self, catalog_file: Path):
-        """Process a single brand catalog."""
+    def _input_size(self, input_hashes: Dict[str, str]) -> int:
+        """Total bytes of a brand's source files (scheduling weight)."""
+        total = 0
+        for name in input_hashes:
+            try:
+                total += (self.source_dir / name).stat().st_size
+            except OSError:
+                pass
+        return total
+    
+    def _hash_brand_inputs(self, sources: BrandSources) -> Dict[str, str]:
+        """Content hashes of a brand's source files and its match overrides."""
+        hashes = {path.name: hash_file(path) for path in sources.files}
         
-        try:
-            with open(catalog_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
-            
-            # Extract Brand Info
-            if isinstance(raw_data, list):
-                # Blueprint Format (List of products)
-                # Cleanup filename: "cordoba-guitars_blueprint" -> "Cordoba Guitars"
-                brand_name = catalog_file.stem.replace('_blueprint', '').replace('-', ' ').replace('_', ' ').title()
-                
-                # FALLBACK: If blueprint is empty, try to load commercial data instead
-                if len(raw_data) == 0:
-                    base_slug = catalog_file.stem.replace('_blueprint', '')
-                    commercial_file = self.source_dir / f"{base_slug}_commercial.json"
-                    if commercial_file.exists():
-                        logger.info(f"      🔄 Blueprint empty, using commercial data: {base_slug}")
-                        with open(commercial_file, 'r', encoding='utf-8') as f:
-                            raw_data = json.load(f)
-                        if not isinstance(raw_data, list):
-                            raw_data = raw_data.get('products', [])
-                
-                # NORMALIZE: Convert list to expected dictionary structure
-                # This prevents "list indices must be integers" error later when doing raw_data['products'] = ...
-                # or when passing to _refine_brand_data
-                normalized_data = {
-                    "brand_name": brand_name,
-                    "products": raw_data,
-                    "generated_at": datetime.utcnow().isoformat()
-                }
-                raw_data = normalized_data
-                products = raw_data['products']
-            else:
-                # Legacy Format (Dict with products key)
-                brand_name = raw_data.get('brand_name') or raw_data.get('name') or catalog_file.stem.replace('_', ' ').title()
-                products = raw_data.get('products', [])
+        if MATCH_OVERRIDES_PATH.exists():
+            try:
+                with open(MATCH_OVERRIDES_PATH, 'r', encoding='utf-8') as f:
+                    overrides = json.load(f)
+                slug = sources.key.lower().replace(" ", "-").replace(".", "").replace("&", "and")
+                if overrides.get(slug):
+                    hashes[MATCH_OVERRIDES_PATH.name] = fingerprint(overrides[slug])
+            except Exception as e:
+                logger.debug(f"      ℹ️ Could not read match overrides: {e}")
+        return hashes
+    
+    def _register_brand(self, entry: Dict, search_rows: List[Dict], verification: Optional[Dict] = None):
+        """Merge one brand's index entry and search rows into the master index."""
+        with self.lock:
+            self.master_index["brands"].append(entry)
+            if verification is not None:
+                self.brand_verification[entry["slug"]] = verification
+            self.master_index["search_graph"].extend(search_rows)
+            self.stats["brands_processed"] += 1
+            self.stats["products_total"] += entry.get("product_count", 0)
 
-            # Remove "Catalog" or "Brand" suffix from brand name for slug
-            brand_name_clean = brand_name.replace(' Catalog', '').replace(' Brand', '').strip()
-            safe_slug = brand_name_clean.lower().replace(" ", "-").replace(".", "").replace("&", "and")
+    def _replace_brand(self, old_slugs: Iterable[str], entry: Optional[Dict] = None, search_rows: Iterable[Dict] = (),
+                       verification: Optional[Dict] = None):
+        """
+        Swap brands in the master index for a re-forged one (or just drop them
+        when `entry` is None). The new entry and its search rows take the place
+        of the old ones, so index.json only changes where the brand did.
+        """
+        old_slugs = set(old_slugs)
+        with self.lock:
+            brands = self.master_index["brands"]
+            graph = self.master_index["search_graph"]
+            brand_pos = next((i for i, b in enumerate(brands) if b["slug"] in old_slugs), len(brands))
+            row_pos = next((i for i, r in enumerate(graph) if r.get("brand") in old_slugs), len(graph))
+            removed = [b for b in brands if b["slug"] in old_slugs]
+            brands[:] = [b for b in brands if b["slug"] not in old_slugs]
+            graph[:] = [r for r in graph if r.get("brand") not in old_slugs]
+            for slug in old_slugs:
+                self.brand_verification.pop(slug, None)
+            self.stats["brands_processed"] -= len(removed)
+            self.stats["products_total"] -= sum(b.get("product_count", 0) for b in removed)
 
-            # --- MERGE: Halilit (commercial) with Brand Website Data (global) ---
-            # Strategy: Price & SKU from Halilit, description & specs from brand website
-            raw_data = self._merge_with_global_data(raw_data, safe_slug, catalog_file.stem)
-            products = raw_data.get('products', [])
+            if entry is not None:
+                brands.insert(brand_pos, entry)
+                graph[row_pos:row_pos] = list(search_rows)
+                if verification is not None:
+                    self.brand_verification[entry["slug"]] = verification
+                self.stats["brands_processed"] += 1
+                self.stats["products_total"] += entry.get("product_count", 0)
 
-            # --- SAMPLING LOGIC (Hybrid: 100% Halilit, 20% Real) ---
-            commercial_products = []
-            real_products = []
-            
-            # Helper to detect Hebrew content (indicative of Halilit data)
-            def has_hebrew(text):
-                if not text: return False
-                return any("\u0590" <= char <= "\u05FF" for char in text)
+    def rebuild_brands(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Re-forge only the given brands (source keys, e.g. "roland") on top of the
+        last build, then rewrite index.json and the touched sidecars.
 
-            for p in products:
-                # Data Repair: Ensure pricing object exists (Fixes "0 price" issue)
-                if not p.get('pricing'):
-                    p['pricing'] = {}
-                
-                # Map flat 'price' to pricing object if missing
-                if p.get('price') and not p['pricing'].get('regular_price'):
-                     try:
-                         val = float(p['price'])
-                         if val > 0:
-                             p['pricing']['regular_price'] = val
-                             p['pricing']['original_price'] = val
-                             logger.info(f"Fixed price for {p.get('name')}: {val}")
-                     except Exception as e:
-                         logger.warning(f"Failed to fix price for {p.get('name')}: {e}")
+        Used by watch mode: needs the master index and manifest of a previous
+        build() in this process. A brand whose sources are gone is dropped; one
+        that fails to forge (e.g. a half-saved JSON file) keeps its previous output.
 
-                # 1. Commercial Validity: Has Price OR Halilit ID/URL
-                is_commercial_valid = (
-                    p.get('halilit_url') is not None or 
-                    p.get('halilit_id') is not None or
-                    (p.get('pricing') and p['pricing'].get('regular_price') is not None)
-                )
-                
-                # 2. Content Source: Hebrew = Halilit (Commercial Source)
-                is_hebrew_content = has_hebrew(p.get('name', '')) or has_hebrew(p.get('description', ''))
-                
-                if is_hebrew_content:
-                    # STRICT FILTER: User requested NO Hebrew data in UI.
-                    # We skip these products entirely.
+        Returns:
+            {"rebuilt": [slugs], "removed": [slugs], "failed": [keys],
+             "profiles": {slug: {stage: costs}}, "wall_s": float}
+        """
+        start = time.perf_counter()
+        result = {"rebuilt": [], "removed": [], "failed": [], "profiles": {}}
+        forgeable = {s.key: s for s in SourceRegistry(self.source_dir).scan().forgeable()}
+        touched: List[Path] = []
+        # Logos / images added or removed since the last build (re-walked only if a directory changed)
+        if self._asset_index is None:
+            self._asset_index = AssetIndex(self.output_dir.parent)
+        else:
+            self._asset_index.revalidate()
+
+        for key in sorted(set(keys)):
+            # Manifest records are keyed by the brand's primary source filename
+            previous = {name: record["entry"]["slug"] for name, record in self.manifest.brands.items()
+                        if brand_key(name) == key and record.get("entry")}
+            sources = forgeable.get(key)
+            if sources is None:
+                if previous:
+                    self._replace_brand(previous.values())
+                    for name in previous:
+                        self._remove_brand_outputs(self.manifest.brands.pop(name)["entry"])
+                    result["removed"].extend(previous.values())
+                    logger.info(f"      🗑️  {key}: sources removed, dropped {', '.join(previous.values())}")
+                continue
+
+            input_hashes = self._hash_brand_inputs(sources)
+            forged = self._process_brand(sources)
+            if not forged:
+                result["failed"].append(key)
+                logger.warning(f"      ⚠️ {key}: forge failed, previous output kept")
+                continue
+
+            entry = forged["entry"]
+            self._replace_brand(set(previous.values()) | {entry["slug"]}, entry, forged["search_rows"],
+                                forged["verification"])
+            for name in previous:
+                self.manifest.brands.pop(name, None)
+            self.manifest.record(sources.name, input_hashes, entry, forged["search_rows"], forged["verification"])
+            result["rebuilt"].append(entry["slug"])
+            result["profiles"][entry["slug"]] = forged["profile"]
+            touched.append(self.output_dir / entry["file"])
+            touched.extend(self.output_dir / name for name in entry.get("list_files", []) + entry.get("detail_files", []))
+
+            stats = forged["verification"]["stats"]
+            if stats.get("errors") or stats.get("warnings"):
+                logger.warning(f"      ⚠️  {entry['slug']}: {stats.get('errors', 0)} verification errors, "
+                               f"{stats.get('warnings', 0)} warnings")
+
+        if result["rebuilt"] or result["removed"]:
+            self._finalize_catalog()
+            self.manifest.save()
+            if self.compression:
+                compressor = ArtifactCompressor(self.compression, root=self.output_dir, state_path=COMPRESSION_STATE_PATH)
+                compressor.compress([self.output_dir / "index.json"] + touched)
+                compressor.prune(self.output_dir, ("lists", "details"))
+
+        result["wall_s"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def _remove_brand_outputs(self, entry: Dict):
+        """
+        Unlink a dropped brand's deployed files: brand file, list pages and
+        detail shards (whole shard directories, so earlier --deterministic
+        generations go too). Sidecars are left to ArtifactCompressor.prune.
+        """
+        slug = entry["slug"]
+        (self.output_dir / entry["file"]).unlink(missing_ok=True)
+        if self.deterministic:
+            for stale in self.output_dir.glob(f"{slug}.*.json"):
+                stale.unlink()
+        for shard_root in ("lists", "details"):
+            shutil.rmtree(self.output_dir / shard_root / slug, ignore_errors=True)
+
+    def reload_brand_maps(self) -> List[str]:
+        """
+        Re-import config/brand_maps.py after an edit.
+
+        Returns the source keys of forged brands whose BRAND_MAPS entry changed
+        in a way the forge uses (the logo URL), and moves the manifest to the new
+        configuration fingerprint.
+        """
+        def logos(brand_maps) -> Dict[str, Any]:
+            return {slug: cfg.get('logo_url') for slug, cfg in brand_maps.BRAND_MAPS.items()}
+
+        try:
+            import config.brand_maps as brand_maps
+            before = logos(brand_maps)
+            after = logos(importlib.reload(brand_maps))
+        except Exception as e:
+            logger.warning(f"      ⚠️ config/brand_maps.py not reloaded: {e}")
+            return []
+
+        changed = {slug for slug in before.keys() | after.keys() if before.get(slug) != after.get(slug)}
+        self.manifest.config_fingerprint = self._config_fingerprint()
+        return sorted({brand_key(name) for name, record in self.manifest.brands.items()
+                       if record.get("entry", {}).get("slug") in changed})
+
+    def forget_brands(self, keys: Iterable[str]):
+        """Drop the build manifest records of source keys (e.g. from reload_brand_maps) so the next build re-forges them."""
+        keys = set(keys)
+        self.manifest.forget([name for name in self.manifest.brands if brand_key(name) in keys])
+
+    def watch(self, interval: float = POLL_INTERVAL, debounce: float = DEBOUNCE, stop: Optional[threading.Event] = None):
+        """
+        Watch mode: after a build, re-forge only the brands whose blueprint /
+        commercial / brand-site files (or BRAND_MAPS entries) change.
+        """
+        watcher = SourceWatcher([self.source_dir], [BRAND_MAPS_PATH], interval=interval, debounce=debounce)
+        logger.info(f"👀 [WATCH] Watching {self.source_dir} and {BRAND_MAPS_PATH} (Ctrl+C to stop)")
+        try:
+            for changed in watcher.changes(stop):
+                keys = {brand_key(path.name) for path in changed if path != BRAND_MAPS_PATH}
+                if BRAND_MAPS_PATH in changed:
+                    keys.update(self.reload_brand_maps())
+                if not keys:
                     continue
-                else:
-                    # It is English/International. Treat as "Real" (Brand Source).
-                    # (Even if it has a price, if it's English, we treat it as high-quality Real data).
-                    # Actually, we should probably keep price if it has it, but put it in Real bucket?
-                    # The user wants "Real" data displayed.
-                    real_products.append(p)
 
-            # Include 100% of all data (Real + Commercial)
-            # Real: English/Brand website data (full specs, descriptions)
-            # Commercial: Hebrew/Halilit data (pricing, availability, SKU)
-            # Merge with intelligent deduplication
-            real_count = len(real_products)
-            commercial_count = len(commercial_products)
-            
-            # Build product ID set from real products to detect duplicates
-            real_ids = {p.get('id', p.get('name', '').lower().replace(' ', '-')) for p in real_products}
-            
-            # Include only commercial products that aren't already in real products
-            unique_commercial = []
-            for p in commercial_products:
-                prod_id = p.get('id', p.get('name', '').lower().replace(' ', '-'))
-                if prod_id not in real_ids:
-                    unique_commercial.append(p)
-            
-            # Merge: Real First (Good content), then Unique Commercial (Pricing/Inventory)
-            merged_products = real_products + unique_commercial
-            raw_data['products'] = merged_products
-            product_count = len(merged_products)
+                logger.info(f"🔁 [WATCH] {', '.join(sorted(p.name for p in changed))} changed")
+                result = self.rebuild_brands(keys)
+                logger.info(f"⚡ [WATCH] {len(result['rebuilt'])} rebuilt, {len(result['removed'])} removed, "
+                            f"{len(result['failed'])} failed in {result['wall_s']:.2f}s")
+        except KeyboardInterrupt:
+            logger.info("👋 [WATCH] Stopped")
+
+    def _process_brand(self, sources: BrandSources) -> Optional[Dict[str, Any]]:
+        """
+        Process a single brand from all its source files (see SourceRegistry).
+        
+        Products stream through load → merge → refine → index → verify → write one at a
+        time, so peak memory does not grow with the catalog (only the brand-site
+        records used as match targets are held in memory).
+        
+        Ownership: a record parsed from the source catalog belongs to this
+        build; every stage mutates it in place and passes it on (no copies).
+        Brand-site records (match targets) are shared and read-only: values
+        are taken from them, never edited on them.
+        
+        Returns:
+            {"entry": <master index entry>, "search_rows": [...], "profile": {stage: costs}}
+            or None on failure
+        """
+        
+        timer = StageTimer()
+        try:
+            catalog_file = sources.commerce()
+            # FALLBACK: Empty (or brand-site only) blueprint, sell from the commercial feed
+            if sources.blueprint is not None and catalog_file != sources.blueprint:
+                logger.info(f"      🔄 Blueprint empty or brand-site only, using commercial data: {sources.key}")
+            stream = ProductStream(catalog_file)
+            products = iter(stream)
             
-            logger.info(f"      📊 [100% FULL DATA] {brand_name}: {commercial_count} Halilit + {real_count} Brand Website - {len(commercial_products) - len(unique_commercial)} duplicates = {product_count} Total")
+            # Extract Brand Info
+            if stream.is_list:
+                # Blueprint Format (List of products)
+                # Cleanup brand key: "cordoba-guitars" -> "Cordoba Guitars"
+                brand_name = sources.key.replace('-', ' ').replace('_', ' ').title()
+                
+                # NORMALIZE: Blueprint lists carry no metadata, start the brand header here
+                raw_data = {"brand_name": brand_name}
+                if not self.deterministic:
+                    raw_data["generated_at"] = datetime.utcnow().isoformat()
+            else:
+                # Legacy Format (Dict with products key): metadata now, products streamed later
+                raw_data = stream.header()
+                brand_name = raw_data.get('brand_name') or raw_data.get('name') or sources.key.replace('_', ' ').title()
             
-            logger.info(f"      🔨 {brand_name:20s} ({product_count:3d} products) → {safe_slug}.json")
+            # Remove "Catalog" or "Brand" suffix from brand name for slug
+            brand_name_clean = brand_name.replace(' Catalog', '').replace(' Brand', '').strip()
+            safe_slug = brand_name_clean.lower().replace(" ", "-").replace(".", "").replace("&", "and")
             
-            # --- REFINEMENT LAYER ---
-            # Ensure data quality: IDs, images, structure
+            # --- REFINEMENT LAYER (brand identity, logo, taxonomy) ---
             refined_data = self._refine_brand_data(raw_data, brand_name, safe_slug)
+            timer.lap("header")
             
-            # --- BUILD SEARCH GRAPH ---
-            # Build search index for instant search
-            self._index_for_search(refined_data, safe_slug)
+            # --- STREAMING CHAIN ---
+            # MERGE: Halilit (commercial) with Brand Website Data (global)
+            # Strategy: Price & SKU from Halilit, description & specs from brand website
+            sampling = {"kept": 0, "hebrew_skipped": 0}
+            products = timer.wrap("load", products)
+            products = timer.wrap("merge", self._filter_products(
+                self._merge_with_global_data(products, safe_slug, sources.content(catalog_file)), sampling))
+            # REFINE: Ensure data quality: IDs, images, taxonomy, hierarchy
+            products = timer.wrap("refine", self._refine_products(products, refined_data, safe_slug))
+            # MIRROR: Local copies of remote images, before anything is written or content-hashed
+            if self.mirror_images:
+                products = timer.wrap("mirror", self.image_mirror.mirror_stream(products))
+            # SEARCH GRAPH: Build search index for instant search
+            search_rows = []
+            products = timer.wrap("index", self._index_for_search(products, safe_slug, brand_name, search_rows))
+            # VERIFY: Quality rules on the final records as they are written (no re-read of the output)
+            verifier = CatalogVerifier(self.output_dir)
+            products = timer.wrap("verify", verifier.verify_products(products, safe_slug))
             
-            # --- WRITE BRAND FILE ---
-            # This is lazy-loaded when user clicks the brand
+            # --- WRITE BRAND FILE + LIST / DETAIL SHARDS ---
+            # The brand file is lazy-loaded when user clicks the brand; grids render
+            # from the slim list pages and details load per shard on demand
             output_file = self.output_dir / f"{safe_slug}.json"
-            with open(output_file, 'w', encoding='utf-8') as out:
-                json.dump(refined_data, out, indent=2, ensure_ascii=False)
+            details, pages = self._shard_writers(safe_slug)
+            with CatalogStreamWriter(output_file, pretty=self.pretty) as writer, details, pages:
+                product_count = writer.write_items('products', self._tee_shards(products, details, pages))
+                # Header last: taxonomy stats and hierarchy are complete once the products are through
+                for key, value in refined_data.items():
+                    writer.write_field(key, value)
+            
+            output_name = self._content_address(output_file)
+            if not self.deterministic:
+                self._prune_shards(safe_slug, pages.files + details.files)
+            timer.lap("write", products=product_count)
+            
+            logger.info(f"      📊 [100% FULL DATA] {brand_name}: {sampling['kept']} kept, {sampling['hebrew_skipped']} Hebrew-only skipped")
+            logger.info(f"      🔨 {brand_name:20s} ({product_count:3d} products) → {output_name}")
             
             # --- UPDATE MASTER INDEX ---
             brand_identity = refined_data.get('brand_identity', {})
             brand_colors = brand_identity.get('brand_colors', {})
             
-            with self.lock:
-                self.master_index["brands"].append({
-                    "id": safe_slug,
-                    "name": brand_name,
-                    "slug": safe_slug,
-                    "count": product_count,
-                    # Frontend expects:
-                    "brand_color": brand_colors.get('primary'),
-                    "logo_url": brand_identity.get('logo_url'),
-                    "file": f"{safe_slug}.json",
-                    "data_file": f"{safe_slug}.json",
-                    "product_count": product_count,
-                    "verified_count": product_count,
-                    "last_updated": datetime.now(timezone.utc).isoformat()
-                })
-                
-                # --- UPDATE STATS ---
-                self.stats["brands_processed"] += 1
-                self.stats["products_total"] += product_count
+            entry = {
+                "id": safe_slug,
+                "name": brand_name,
+                "slug": safe_slug,
+                "count": product_count,
+                # Frontend expects:
+                "brand_color": brand_colors.get('primary'),
+                "logo_url": brand_identity.get('logo_url'),
+                "file": output_name,
+                "data_file": output_name,
+                "product_count": product_count,
+                "verified_count": product_count,
+                "list_files": pages.files,
+                "list_page_size": LIST_PAGE_SIZE,
+                "detail_files": details.files,
+                "detail_chunk_size": DETAIL_CHUNK_SIZE,
+            }
+            if not self.deterministic:
+                entry["last_updated"] = datetime.now(timezone.utc).isoformat()
+            return {"entry": entry, "search_rows": search_rows, "verification": verifier.brand_report(),
+                    "profile": timer.stages}
             
         except json.JSONDecodeError as e:
-            logger.error(f"      ❌ Invalid JSON in {catalog_file.name}: {e}")
-            self.stats["errors"].append(f"JSON error in {catalog_file.name}")
+            logger.error(f"      ❌ Invalid JSON in {sources.name}: {e}")
+            with self.lock:
+                self.stats["errors"].append(f"JSON error in {sources.name}")
         except Exception as e:
-            logger.error(f"      ❌ Error processing {catalog_file.name}: {e}")
-            self.stats["errors"].append(str(e))
+            logger.error(f"      ❌ Error processing {sources.name}: {e}")
+            with self.lock:
+                self.stats["errors"].append(str(e))
+        return None
+    
+    def _load_content_records(self, content_file: Path) -> List[Dict]:
+        """Brand-site records of one brand (read-only match targets), from the daemon cache when unchanged."""
+        if self.content_cache is None:
+            # Products only (list or {"products": [...]}), brand metadata is never materialized
+            return list(ProductStream(content_file))
+        
+        st = content_file.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self.content_cache.get(content_file)
+        if cached and cached[0] == signature:
+            return cached[1]
+        records = list(ProductStream(content_file))
+        self.content_cache[content_file] = (signature, records)
+        return records
     
-    def _merge_with_global_data(self, commercial_data: Dict, slug: str, stem: str) -> Dict:
+    def _filter_products(self, products: Iterable[Dict], sampling: Dict[str, int]) -> Iterator[Dict]:
+        """
+        Sampling logic: repair pricing, drop Hebrew (Halilit-only) records.
+        Counts kept / skipped products into `sampling`.
+        """
+        for p in products:
+            # Data Repair: Ensure pricing object exists (Fixes "0 price" issue)
+            if not p.get('pricing'):
+                p['pricing'] = {}
+            
+            # Map flat 'price' to pricing object if missing
+            if p.get('price') and not p['pricing'].get('regular_price'):
+                 try:
+                     val = float(p['price'])
+                     if val > 0:
+                         p['pricing']['regular_price'] = val
+                         p['pricing']['original_price'] = val
+                         logger.info(f"Fixed price for {p.get('name')}: {val}")
+                 except Exception as e:
+                     logger.warning(f"Failed to fix price for {p.get('name')}: {e}")
+            
+            # Content Source: Hebrew = Halilit (Commercial Source, indicative of Halilit data)
+            if has_hebrew(p.get('name', '')) or has_hebrew(p.get('description', '')):
+                # STRICT FILTER: User requested NO Hebrew data in UI.
+                # We skip these products entirely.
+                sampling["hebrew_skipped"] += 1
+                continue
+            
+            # English/International: treat as "Real" (Brand Source), keep price if it has one
+            sampling["kept"] += 1
+            yield p
+    
+    def _content_address(self, path: Path) -> str:
+        """
+        Deterministic mode renames `name.json` to `name.<sha256[:10]>.json`, so
+        unchanged content keeps its URL (and cache entries) forever.
+        
+        Returns:
+            The published path relative to the output directory
+        """
+        if self.deterministic:
+            hashed = path.with_name(f"{path.stem}.{hash_file(path)[:10]}.json")
+            os.replace(path, hashed)
+            path = hashed
+        return path.relative_to(self.output_dir).as_posix()
+    
+    @staticmethod
+    def _list_row(product: Dict, chunk: int) -> Dict:
+        """Slim product summary for brand grids."""
+        images = product.get('images')
+        image = product.get('image_url') or product.get('image')
+        if isinstance(images, dict):
+            image = images.get('thumbnail') or images.get('main') or image
+        pricing = product.get('pricing') or {}
+        return {
+            "id": product.get('id'),
+            "name": product.get('name'),
+            "image": image,
+            "price": pricing.get('regular_price') or product.get('price'),
+            "category": product.get('main_category') or product.get('category'),
+            "chunk": chunk,  # Detail shard holding the full record
+        }
+    
+    def _shard_writers(self, slug: str) -> Tuple[ShardedListWriter, ShardedListWriter]:
+        """
+        Writers for one brand's detail shards (details/<slug>/<n>.json, full
+        records) and slim list pages (lists/<slug>/<n>.json, at least one page).
+        """
+        details = ShardedListWriter(
+            self.output_dir / "details" / slug, DETAIL_CHUNK_SIZE, pretty=self.pretty,
+            header=lambda n: {"brand": slug, "chunk": n},
+            publish=self._content_address,
+        )
+        pages = ShardedListWriter(
+            self.output_dir / "lists" / slug, LIST_PAGE_SIZE, pretty=self.pretty,
+            header=lambda n: {"brand": slug, "page": n},
+            # Known only once the next product arrives, so written after the rows
+            trailer=lambda n, last: {"next_page": None if last else n + 1},
+            publish=self._content_address,
+            write_empty=True,
+        )
+        return details, pages
+    
+    def _tee_shards(self, products: Iterable[Dict], details: ShardedListWriter,
+                    pages: ShardedListWriter) -> Iterator[Dict]:
+        """Copy each product into its detail shard and list page on the way to the brand file."""
+        for product in products:
+            pages.write(self._list_row(product, details.current))
+            details.write(product)
+            yield product
+    
+    def _prune_shards(self, slug: str, current: List[str]):
+        """
+        Drop pages/shards left over from a larger previous build (deterministic
+        mode keeps the previous generation; see _write_asset_manifest).
+        """
+        current = set(current)
+        for shard_root in ("lists", "details"):
+            shard_dir = self.output_dir / shard_root / slug
+            for entry in os.scandir(shard_dir):
+                rel = f"{shard_root}/{slug}/{entry.name.split('.json')[0]}.json"
+                if rel not in current:
+                    os.unlink(entry.path)
+    
+    def _merge_with_global_data(self, products: Iterable[Dict], slug: str, content_file: Optional[Path]) -> Iterator[Dict]:
         """
         Merges Halilit data (commercial) with brand website data (global).
         
         Strategy:
         - Halilit is source for: price, SKU, halilit_id, halilit_url, availability
         - Brand website is source for: description, specs, category, images, logo
-        - Product matching: fuzzy name matching (>0.6 similarity threshold)
+        - Product matching: exact SKU/model join, then fuzzy name matching (>0.6 similarity threshold)
         - Language handling: prefer English content from brand site over Hebrew from Halilit
         
+        Commercial products stream through one at a time and are enriched in
+        place; only the brand-site records (the match targets) are held in memory.
+        
         Args:
-            commercial_data: Dict with products from Halilit blueprint
+            products: Halilit blueprint products (freshly parsed, owned by this build)
             slug: Brand slug (e.g., "cordoba-guitars")
-            stem: Original filename stem (e.g., "cordoba-guitars_blueprint")
+            content_file: The brand's brand-site source (BrandSources.content), or None
             
-        Returns:
-            Merged data dict with enhanced product information
+        Yields:
+            Merged products with enhanced information
         """
-        if 'products' not in commercial_data:
-            return commercial_data
-        
-        # Try to load global/brand website data if it exists
+        # Load global/brand website data if the brand has any
         global_data = []
         
-        # Patterns to check for global/brand data files
-        patterns = [
-            f"data/blueprints/{slug}_brand.json",
-            f"data/blueprints/{slug}-brand.json",
-            f"data/blueprints/{stem}_brand.json",  # If stem is different
-            f"data/blueprints/{stem}_commercial.json",  # Alternative source
-            f"data/blueprints/{slug}_commercial.json",  # Alternative source
-        ]
-        
-        for pattern in patterns:
+        if content_file is not None:
             try:
-                if Path(pattern).exists():
-                    with open(pattern, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            global_data = data
-                        elif isinstance(data, dict) and 'products' in data:
-                            global_data = data['products']
-                        logger.info(f"      📖 Loaded global data: {len(global_data)} products from {pattern}")
-                        break
+                global_data = self._load_content_records(content_file)
+                logger.info(f"      📖 Loaded global data: {len(global_data)} products from {content_file}")
             except Exception as e:
-                logger.debug(f"      ℹ️ Global data not found at {pattern}: {e}")
+                logger.debug(f"      ℹ️ Global data unreadable at {content_file}: {e}")
         
         if not global_data:
             logger.debug(f"      ℹ️ No brand website data found for {slug}, using Halilit-only")
-            return commercial_data
-        
-        # Merge: Use fuzzy matching on product names
-        from difflib import SequenceMatcher
+            yield from products
+            return
         
-        def has_hebrew(text):
-            """Check if text contains Hebrew characters"""
-            if not text:
-                return False
-            return any("\u0590" <= char <= "\u05FF" for char in text)
+        # Merge: Exact SKU/model join, then fuzzy name matching on indexed candidates
+        match_cache = MatchCache(slug, MATCH_CACHE_DIR, MATCH_OVERRIDES_PATH)
+        resolver = EntityResolver(global_data, cache=match_cache)
         
-        merged_products = []
         matched_global_indices = set()
         
-        for comm_idx, comm_item in enumerate(commercial_data.get('products', [])):
-            final_item = comm_item.copy()
+        for comm_item in products:
+            final_item = comm_item  # Streamed record: enrich in place, no copy
             
             # Find best match in global data (preferring products not yet matched)
-            best_match = None
-            best_score = 0.0
-            best_match_idx = -1
             comm_name = comm_item.get('name', '').lower().strip()
             
             # Extract English part of name if Hebrew+English mixed
             if comm_name and has_hebrew(comm_name):
                 # Try to extract English part
-                english_part = ''.join(char for char in comm_name if ord(char) < 128)
+                english_part = ascii_only(comm_name)
                 if english_part:
                     comm_name = english_part.lower().strip()
             
-            if comm_name:
-                for glob_idx, glob_item in enumerate(global_data):
-                    # Skip if already matched to avoid duplicates
-                    if glob_idx in matched_global_indices:
-                        continue
-                    
-                    glob_name = glob_item.get('name', '').lower().strip()
-                    if glob_name:
-                        ratio = SequenceMatcher(None, comm_name, glob_name).ratio()
-                        if ratio > best_score:
-                            best_score = ratio
-                            best_match = glob_item
-                            best_match_idx = glob_idx
+            # Skip already matched products to avoid duplicates
+            best_match_idx, best_score = resolver.match(comm_item, name=comm_name, exclude=matched_global_indices)
+            best_match = global_data[best_match_idx] if best_match_idx >= 0 else None
             
-            # If we found a good match (>0.6 similarity), overlay global content
-            if best_match and best_score > 0.6:
+            # If we found a good match (exact key or >0.6 similarity), overlay global content
+            if best_match:
                 matched_global_indices.add(best_match_idx)
                 
                 # PRIORITY 1: BRAND WEBSITE DATA (preferred for content)
@@ -680,26 +1113,28 @@ class HalilitCatalog:
                 except (ValueError, TypeError):
                     pass
             
-            merged_products.append(final_item)
+            yield final_item
         
-        commercial_data['products'] = merged_products
-        return commercial_data
+        match_cache.save()
+        logger.info(f"      🔗 Matched {resolver.stats['exact']} by SKU/model, {resolver.stats['fuzzy']} by name ({resolver.stats['comparisons']} comparisons), "
+                    f"{resolver.stats['cached']} from cache, {resolver.stats['overridden']} overridden")
     
     def _refine_brand_data(self, raw_data: Dict, brand_name: str, slug: str) -> Dict:
         """
-        Refinement Layer: Ensure data quality AND build hierarchy
-        - Ensure all products have IDs
-        - Validate image structure
-        - Add missing fields
-        - Build hierarchical category structure (main → sub → products)
+        Refinement Layer (brand level): the header of the brand file
         - Enrich brand_identity with theme colors
         - Download brand logos locally
+        - Attach the brand's taxonomy categories
+        
+        Products are refined by _refine_products as they stream through;
+        it completes `taxonomy_stats` and `hierarchy` on this header.
         """
         
-        refined = raw_data.copy()
+        refined = raw_data  # Freshly parsed header, owned by this build
         refined['brand_name'] = brand_name
         refined['brand_slug'] = slug
-        refined['refined_at'] = datetime.now(timezone.utc).isoformat()
+        if not self.deterministic:
+            refined['refined_at'] = datetime.now(timezone.utc).isoformat()
         
         # Enrich brand_identity with theme colors and download logo
         if 'brand_identity' not in refined:
@@ -736,159 +1171,6 @@ class HalilitCatalog:
         if resolved_logo:
             refined['brand_identity']['logo_url'] = resolved_logo
         
-        # First pass: Ensure product quality and TAXONOMY VALIDATION
-        taxonomy_stats = {"validated": 0, "normalized": 0, "uncategorized": 0}
-        
-        if 'products' in refined:
-            # Get brand logo URL for all products
-            brand_logo_url = refined['brand_identity'].get('logo_url')
-            
-            for idx, product in enumerate(refined['products']):
-                # Ensure ID
-                if not product.get('id'):
-                    product['id'] = f"{slug}-product-{idx}"
-
-                # --- FIX: Ensure Brand Name is present (Required by Schema) ---
-                if not product.get('brand'):
-                    product['brand'] = brand_name
-                
-                # Add brand logo to every product (for TierBar and SpectrumModule rendering)
-                if brand_logo_url and not product.get('logo_url'):
-                    product['logo_url'] = brand_logo_url
-                
-                # --- NAMING STANDARDIZATION ---
-                # Apply Title Case and Cleanup before any other processing
-                original_name = product.get('name', '')
-                standardized_name = self._enforce_naming_convention(original_name)
-                if standardized_name != original_name:
-                    # logger.info(f"      ✨ Renamed: {original_name} -> {standardized_name}")
-                    product['name'] = standardized_name
-
-                # --- DESCRIPTION CLEANUP ---
-                # Remove Hebrew from description as well
-                original_desc = product.get('description', '')
-                if original_desc:
-                    cleaned_desc = self._strip_hebrew(original_desc)
-                    # Clean spaces
-                    cleaned_desc = " ".join(cleaned_desc.split())
-                    if cleaned_desc != original_desc:
-                         product['description'] = cleaned_desc
-
-                # --- TAXONOMY VALIDATION CHECKPOINT ---
-                raw_category = product.get('main_category') or product.get('category')
-                raw_subcategory = product.get('subcategory')
-                
-                # Normalize main category using taxonomy registry
-                normalized_category = self.taxonomy_registry.normalize_category(slug, raw_category)
-                
-                if normalized_category:
-                    product['main_category'] = normalized_category
-                    product['category'] = normalized_category
-                    taxonomy_stats["validated"] += 1
-                elif raw_category:
-                    # Category exists but not in taxonomy - keep but mark
-                    product['main_category'] = raw_category
-                    product['category'] = raw_category
-                    product['_taxonomy_warning'] = f"Category '{raw_category}' not in official taxonomy"
-                    taxonomy_stats["normalized"] += 1
-                else:
-                    product['main_category'] = 'Uncategorized'
-                    product['category'] = 'Uncategorized'
-                    taxonomy_stats["uncategorized"] += 1
-                
-                # Normalize subcategory if present
-                if raw_subcategory:
-                    normalized_sub = self.taxonomy_registry.normalize_category(slug, raw_subcategory)
-                    if normalized_sub:
-                        product['subcategory'] = normalized_sub
-
-                # Ensure images are lists
-                if 'images' in product and isinstance(product['images'], dict):
-                    product['images'] = [product['images']]
-                elif 'images' not in product:
-                    product['images'] = []
-                
-                # Ensure category_hierarchy
-                if 'category_hierarchy' not in product:
-                    product['category_hierarchy'] = [product.get('category', 'Uncategorized')]
-                    if product.get('subcategory'):
-                        product['category_hierarchy'].append(product['subcategory'])
-                
-                # --- NEW: VISUAL FACTORY INTEGRATION ---
-                # Process Main Image into Thumbnail + Inspection Asset
-                main_img_url = product.get('image_url') or product.get('image')
-                if not main_img_url and product.get('images') and len(product['images']) > 0:
-                    first_img = product['images'][0]
-                    main_img_url = first_img.get('url') if isinstance(first_img, dict) else first_img
-
-                # Handle pre-seeded local paths (Mock Data)
-                if main_img_url and main_img_url.startswith('/data/'):
-                     product['images'] = {
-                        "main": main_img_url,
-                        "thumbnail": main_img_url,
-                        "high_res": main_img_url.replace('_thumb', '_main'),
-                        "original": main_img_url
-                    }
-                     logger.info(f"      ⏩ Skipping visuals for local seed path: {main_img_url}")
-
-                elif main_img_url and not main_img_url.startswith('http://localhost'): # Skip if already local (unlikely in forge)
-                    # Prepare Output Path
-                    # frontend/public/data/product_images/<brand>/<product_id>
-                    img_output_dir = self.output_dir / "product_images" / slug
-                    img_output_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    img_base_path = str(img_output_dir / f"{product['id']}")
-                    
-                    # Run Visual Factory (This is heavy, maybe we cache check?)
-                    # For now, we run it to ensure "Visual Intelligence" is active
-                    logger.info(f"      🎨 Processing visuals for {product.get('name')}...")
-                    # BYPASS VISUAL FACTORY - RAW HARVEST MODE
-                    # try:
-                    #     visual_assets = self.visual_factory.process_product_asset(main_img_url, img_base_path)
-                    
-                    #     if visual_assets:
-                    #         # Update product with new optimized local assets
-                    #         # Convert absolute path to relative URL for frontend
-                    #         # frontend/public/data/... -> /data/...
-                    #         thumb_rel = f"/data/product_images/{slug}/{product['id']}_thumb.webp"
-                    #         inspect_rel = f"/data/product_images/{slug}/{product['id']}_inspect.webp"
-                            
-                    #         product['images'] = {
-                    #             "main": thumb_rel,          # Used by TierBar and default view
-                    #             "thumbnail": thumb_rel,     # Explicit thumbnail
-                    #             "high_res": inspect_rel,    # Used by InspectionLens through 'main' or separate field
-                    #             "original": main_img_url    # Keep reference
-                    #         }
-                            
-                    #         # Set primary image for legacy compatibility
-                    #         product['image'] = thumb_rel
-                    #         product['image_url'] = thumb_rel
-                            
-                    #         self.stats['images_verified'] += 1
-                    # except Exception as e:
-                    #      logger.warning(f"      ⚠️ Visual Factory failed for {product.get('name')}: {e}")
-                    
-                    # Fallback to remote URL if no local processing
-                    if main_img_url:
-                        product['image'] = main_img_url
-                        product['image_url'] = main_img_url
-
-                # --- NEW: DOWNLOAD INNER LOGOS (series_logo) ---
-                if product.get('series_logo'):
-                    # Create a unique name: roland-fantom-06-series.png
-                    logo_name = f"{slug}-{product.get('id', idx)}-series"
-                    local_path = self._download_logo(product['series_logo'], logo_name)
-                    product['series_logo'] = local_path
-                    logger.info(f"      ⬇️  Downloaded inner logo for {product.get('name')}")
-                
-                # Data quality ensured - no unused AI layers
-        
-        # Log taxonomy validation stats
-        logger.info(f"      📊 Taxonomy: {taxonomy_stats['validated']} validated, {taxonomy_stats['normalized']} normalized, {taxonomy_stats['uncategorized']} uncategorized")
-        
-        # Add taxonomy stats to brand_identity for frontend reference
-        refined['brand_identity']['taxonomy_stats'] = taxonomy_stats
-        
         # Add available categories from taxonomy registry for this brand
         brand_taxonomy = self.taxonomy_registry.get_brand(slug)
         if brand_taxonomy:
@@ -903,61 +1185,216 @@ class HalilitCatalog:
                 for cat in brand_taxonomy.get_root_categories()
             ]
         
-        # Second pass: Build hierarchical category tree
-        refined['hierarchy'] = self._build_category_hierarchy(refined.get('products', []))
+        # Taxonomy stats (for frontend reference) and the category tree are filled per product
+        refined['brand_identity']['taxonomy_stats'] = {"validated": 0, "normalized": 0, "uncategorized": 0}
+        refined['hierarchy'] = {}
         
         return refined
     
-    def _build_category_hierarchy(self, products: List[Dict]) -> Dict:
+    def _refine_products(self, products: Iterable[Dict], refined: Dict, slug: str) -> Iterator[Dict]:
+        """
+        Refinement Layer (product level), one product at a time:
+        - Ensure all products have IDs
+        - Validate image structure
+        - Add missing fields
+        - Build hierarchical category structure (main → sub → product indices), same pass
+        
+        Taxonomy stats and the hierarchy land on the `refined` header once the
+        stream is exhausted.
+        """
+        brand_name = refined['brand_name']
+        taxonomy_stats = refined['brand_identity']['taxonomy_stats']
+        hierarchy = refined['hierarchy']
+        
+        # Get brand logo URL for all products
+        brand_logo_url = refined['brand_identity'].get('logo_url')
+        
+        # Ensure product quality and TAXONOMY VALIDATION
+        for idx, product in enumerate(products):
+            # Ensure ID
+            if not product.get('id'):
+                product['id'] = f"{slug}-product-{idx}"
+
+            # --- FIX: Ensure Brand Name is present (Required by Schema) ---
+            if not product.get('brand'):
+                product['brand'] = brand_name
+            
+            # Add brand logo to every product (for TierBar and SpectrumModule rendering)
+            if brand_logo_url and not product.get('logo_url'):
+                product['logo_url'] = brand_logo_url
+            
+            # --- NAMING STANDARDIZATION ---
+            # Apply Title Case and Cleanup before any other processing
+            original_name = product.get('name', '')
+            standardized_name = self._enforce_naming_convention(original_name)
+            if standardized_name != original_name:
+                # logger.info(f"      ✨ Renamed: {original_name} -> {standardized_name}")
+                product['name'] = standardized_name
+
+            # --- DESCRIPTION CLEANUP ---
+            # Remove Hebrew from description as well
+            original_desc = product.get('description', '')
+            if original_desc:
+                cleaned_desc = strip_hebrew(original_desc)
+                # Clean spaces
+                cleaned_desc = " ".join(cleaned_desc.split())
+                if cleaned_desc != original_desc:
+                     product['description'] = cleaned_desc
+
+            # --- TAXONOMY VALIDATION CHECKPOINT ---
+            raw_category = product.get('main_category') or product.get('category')
+            raw_subcategory = product.get('subcategory')
+            
+            # Normalize main category using taxonomy registry
+            normalized_category = self.taxonomy_registry.normalize_category(slug, raw_category)
+            
+            if normalized_category:
+                product['main_category'] = normalized_category
+                product['category'] = normalized_category
+                taxonomy_stats["validated"] += 1
+            elif raw_category:
+                # Category exists but not in taxonomy - keep but mark
+                product['main_category'] = raw_category
+                product['category'] = raw_category
+                product['_taxonomy_warning'] = f"Category '{raw_category}' not in official taxonomy"
+                taxonomy_stats["normalized"] += 1
+            else:
+                product['main_category'] = 'Uncategorized'
+                product['category'] = 'Uncategorized'
+                taxonomy_stats["uncategorized"] += 1
+            
+            # Normalize subcategory if present
+            if raw_subcategory:
+                normalized_sub = self.taxonomy_registry.normalize_category(slug, raw_subcategory)
+                if normalized_sub:
+                    product['subcategory'] = normalized_sub
+
+            # Ensure images are lists
+            if 'images' in product and isinstance(product['images'], dict):
+                product['images'] = [product['images']]
+            elif 'images' not in product:
+                product['images'] = []
+            
+            # Ensure category_hierarchy
+            if 'category_hierarchy' not in product:
+                product['category_hierarchy'] = [product.get('category', 'Uncategorized')]
+                if product.get('subcategory'):
+                    product['category_hierarchy'].append(product['subcategory'])
+            
+            # --- NEW: VISUAL FACTORY INTEGRATION ---
+            # Process Main Image into Thumbnail + Inspection Asset
+            main_img_url = product.get('image_url') or product.get('image')
+            if not main_img_url and product.get('images') and len(product['images']) > 0:
+                first_img = product['images'][0]
+                main_img_url = first_img.get('url') if isinstance(first_img, dict) else first_img
+
+            # Handle pre-seeded local paths (Mock Data)
+            if main_img_url and main_img_url.startswith('/data/'):
+                 product['images'] = {
+                    "main": main_img_url,
+                    "thumbnail": main_img_url,
+                    "high_res": main_img_url.replace('_thumb', '_main'),
+                    "original": main_img_url
+                }
+                 logger.info(f"      ⏩ Skipping visuals for local seed path: {main_img_url}")
+
+            elif main_img_url and not main_img_url.startswith('http://localhost'): # Skip if already local (unlikely in forge)
+                # Prepare Output Path
+                # frontend/public/data/product_images/<brand>/<product_id>
+                img_output_dir = self.output_dir / "product_images" / slug
+                img_output_dir.mkdir(parents=True, exist_ok=True)
+                
+                img_base_path = str(img_output_dir / f"{product['id']}")
+                
+                # Run Visual Factory (This is heavy, maybe we cache check?)
+                # For now, we run it to ensure "Visual Intelligence" is active
+                logger.info(f"      🎨 Processing visuals for {product.get('name')}...")
+                # BYPASS VISUAL FACTORY - RAW HARVEST MODE
+                # try:
+                #     visual_assets = self.visual_factory.process_product_asset(main_img_url, img_base_path)
+                
+                #     if visual_assets:
+                #         # Update product with new optimized local assets
+                #         # Convert absolute path to relative URL for frontend
+                #         # frontend/public/data/... -> /data/...
+                #         thumb_rel = f"/data/product_images/{slug}/{product['id']}_thumb.webp"
+                #         inspect_rel = f"/data/product_images/{slug}/{product['id']}_inspect.webp"
+                        
+                #         product['images'] = {
+                #             "main": thumb_rel,          # Used by TierBar and default view
+                #             "thumbnail": thumb_rel,     # Explicit thumbnail
+                #             "high_res": inspect_rel,    # Used by InspectionLens through 'main' or separate field
+                #             "original": main_img_url    # Keep reference
+                #         }
+                        
+                #         # Set primary image for legacy compatibility
+                #         product['image'] = thumb_rel
+                #         product['image_url'] = thumb_rel
+                        
+                #         self.stats['images_verified'] += 1
+                # except Exception as e:
+                #      logger.warning(f"      ⚠️ Visual Factory failed for {product.get('name')}: {e}")
+                
+                # Fallback to remote URL if no local processing
+                if main_img_url:
+                    product['image'] = main_img_url
+                    product['image_url'] = main_img_url
+
+            # --- NEW: DOWNLOAD INNER LOGOS (series_logo) ---
+            if product.get('series_logo'):
+                # Create a unique name: roland-fantom-06-series.png
+                logo_name = f"{slug}-{product.get('id', idx)}-series"
+                local_path = self._download_logo(product['series_logo'], logo_name)
+                product['series_logo'] = local_path
+                logger.info(f"      ⬇️  Downloaded inner logo for {product.get('name')}")
+            
+            # Category tree entry (taxonomy is final at this point)
+            self._add_to_hierarchy(hierarchy, idx, product)
+            
+            # Data quality ensured - no unused AI layers
+            yield product
+        
+        # Log taxonomy validation stats
+        logger.info(f"      📊 Taxonomy: {taxonomy_stats['validated']} validated, {taxonomy_stats['normalized']} normalized, {taxonomy_stats['uncategorized']} uncategorized")
+    
+    @staticmethod
+    def _add_to_hierarchy(hierarchy: Dict, idx: int, product: Dict):
         """
-        Build a tree structure: Category → Subcategory → Products
+        Add one product to the tree: Category → Subcategory → product indices
+        
+        Nodes reference positions in the brand's `products` array (the detail
+        shard is `idx // detail_chunk_size`) instead of copying product data.
         
         Structure:
         {
           "Electronics": {
-            "Keyboards": [product1, product2],
-            "Drums": [product3]
-          },
-          "Accessories": {
-            "Cables": [product4]
+            "count": 3,
+            "subcategories": {
+              "Keyboards": {"count": 2, "products": [0, 4]},
+              "Drums": {"count": 1, "products": [7]}
+            }
           }
         }
         """
-        hierarchy = {}
+        main_cat = product.get('main_category', 'Uncategorized')
+        sub_cat = product.get('subcategory', 'General')
         
-        for product in products:
-            main_cat = product.get('main_category', 'Uncategorized')
-            sub_cat = product.get('subcategory', 'General')
-            
-            # Ensure category exists
-            if main_cat not in hierarchy:
-                hierarchy[main_cat] = {}
-            
-            # Ensure subcategory exists
-            if sub_cat not in hierarchy[main_cat]:
-                hierarchy[main_cat][sub_cat] = []
-            
-            # Add product to subcategory (include full product data)
-            hierarchy[main_cat][sub_cat].append({
-                "id": product.get('id'),
-                "name": product.get('name'),
-                "description": product.get('short_description', product.get('description', '')),
-                "images": product.get('images', []),
-                "model_number": product.get('model_number'),
-                "sku": product.get('sku')
-            })
-        
-        return hierarchy
+        main_node = hierarchy.setdefault(main_cat, {"count": 0, "subcategories": {}})
+        sub_node = main_node["subcategories"].setdefault(sub_cat, {"count": 0, "products": []})
+        
+        main_node["count"] += 1
+        sub_node["count"] += 1
+        sub_node["products"].append(idx)
     
-    def _index_for_search(self, brand_data: Dict, slug: str):
+    def _index_for_search(self, products: Iterable[Dict], slug: str, brand_name: str, rows: List[Dict]) -> Iterator[Dict]:
         """
-        Build lightweight search graph entry for Halilit Catalog.
+        Build lightweight search graph entries for Halilit Catalog.
         This is what the navigator uses for instant suggestions.
-        """
         
-        brand_name = brand_data.get('brand_name', slug)
+        Appends one row per product to `rows` while passing the products through.
+        """
         
-        for product in brand_data.get('products', []):
+        for product in products:
             entry = {
                 "id": product.get('id'),
                 "label": product.get('name', ''),
@@ -968,7 +1405,8 @@ class HalilitCatalog:
                 "keywords": product.get('features', [])[:5] if product.get('features') else [],
                 "description": product.get('description', '')[:100] if product.get('description') else ''
             }
-            self.master_index["search_graph"].append(entry)
+            rows.append(entry)
+            yield product
     
     def _finalize_catalog(self):
         """Write the master index (The Spine of the Halilit Catalog)."""
@@ -979,21 +1417,139 @@ class HalilitCatalog:
         self.master_index["total_products"] = self.stats["products_total"]
         self.master_index["total_verified"] = self.stats["products_total"] # Assuming all generated items are verified
         
+        if self.deterministic:
+            self._write_asset_manifest()
+        
         # Write index.json (The Master Catalog File)
         index_file = self.output_dir / "index.json"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(self.master_index, f, indent=2, ensure_ascii=False)
+        with CatalogStreamWriter(index_file, pretty=self.pretty) as writer:
+            for key, value in self.master_index.items():
+                if key == 'search_graph':
+                    writer.write_items(key, value)
+                else:
+                    writer.write_field(key, value)
         
-        logger.info(f"      ✓ Master Catalog Index: {index_file.name}")
+        logger.info(f"      ✓ Master Catalog Index: {index_file.name} ({writer.bytes_written / 1024:.1f} KB)")
         logger.info(f"      ✓ {len(self.master_index['brands'])} brands")
         logger.info(f"      ✓ {self.master_index['total_products']} products")
         logger.info(f"      ✓ {len(self.master_index['search_graph'])} search entries")
     
+    def _write_asset_manifest(self):
+        """
+        Deterministic mode: order the index independent of worker completion,
+        keep all timestamps in asset-manifest.json and drop superseded hashed files
+        (brand files, list pages and detail shards).
+        """
+        self.master_index["brands"].sort(key=lambda b: b["slug"])
+        # Stable sort: products keep their catalog order within each brand
+        self.master_index["search_graph"].sort(key=lambda row: row["brand"])
+        
+        manifest_path = self.output_dir / ASSET_MANIFEST_NAME
+        previous = {}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    previous = json.load(f).get("brands", {})
+            except Exception as e:
+                logger.warning(f"      ⚠️ Previous asset manifest unreadable: {e}")
+        
+        now = datetime.now(timezone.utc).isoformat()
+        brands = {}
+        for entry in self.master_index["brands"]:
+            prev = previous.get(entry["slug"], {})
+            shards = entry.get("list_files", []) + entry.get("detail_files", [])
+            unchanged = prev.get("file") == entry["file"] and prev.get("shards", []) == shards
+            brands[entry["slug"]] = {
+                "file": entry["file"],
+                "shards": shards,
+                "last_updated": prev.get("last_updated", now) if unchanged else now,
+                # Previous generation stays on disk for clients holding an older index.json
+                "previous_file": prev.get("previous_file") if unchanged else prev.get("file"),
+                "previous_shards": prev.get("previous_shards", []) if unchanged else prev.get("shards", []),
+            }
+        
+        # Content-derived: only moves when some brand actually changed
+        self.master_index["build_timestamp"] = max((b["last_updated"] for b in brands.values()), default=now)
+        
+        for slug, asset in brands.items():
+            keep = {asset["file"], asset["previous_file"]}
+            for stale in self.output_dir.glob(f"{slug}.*.json*"):
+                if stale.name.split('.json')[0] + '.json' not in keep:
+                    stale.unlink()
+            keep_shards = set(asset["shards"]) | set(asset["previous_shards"] or [])
+            for shard_root in ("lists", "details"):
+                shard_dir = self.output_dir / shard_root / slug
+                if not shard_dir.is_dir():
+                    continue
+                for stale in shard_dir.iterdir():
+                    rel = f"{shard_root}/{slug}/{stale.name.split('.json')[0]}.json"
+                    if rel not in keep_shards:
+                        stale.unlink()
+        
+        dump_json({
+            "version": CATALOG_VERSION,
+            "build_timestamp": self.master_index["build_timestamp"],
+            "brands": brands,
+        }, manifest_path, pretty=True)
+        logger.info(f"      ✓ Asset manifest: {len(brands)} content-hashed brand files")
+    
+    def _compress_artifacts(self):
+        """Write .gz/.br (and optional .zst) sidecars for every forged JSON artifact."""
+        if not self.compression:
+            return
+        
+        logger.info("   [4.2/5] Precompressing artifacts...")
+        artifacts = [self.output_dir / "index.json", self.output_dir / "taxonomy.json", self.output_dir / "search_index.json"]
+        brand_files = [self.output_dir / brand["file"] for brand in self.master_index["brands"]]
+        artifacts.extend(brand_files)
+        for brand in self.master_index["brands"]:
+            artifacts.extend(self.output_dir / name for name in brand.get("list_files", []) + brand.get("detail_files", []))
+        
+        trained = None
+        if "zstd" in self.compression and self.zstd_dict:
+            trained = train_zstd_dictionary(brand_files, self.output_dir / ZSTD_DICT_NAME)
+        
+        compressor = ArtifactCompressor(self.compression, zstd_dict=trained, refresh=["zstd"] if trained else [],
+                                        root=self.output_dir, state_path=COMPRESSION_STATE_PATH)
+        report = compressor.compress(artifacts)
+        # Sidecars of pruned shards / superseded hashed files / dropped brands
+        report["pruned"] = compressor.prune(self.output_dir, ("lists", "details"))
+        compressor.write_report(report, COMPRESSION_REPORT_PATH)
+        compressor.log_report(report)
+    
+    def _collect_orphaned_assets(self):
+        """Report (and optionally delete / quarantine) images no brand file references."""
+        if self.asset_gc == "off":
+            return
+        
+        logger.info("   [4.6/5] Collecting orphaned assets...")
+        collector = AssetGarbageCollector(self.output_dir)
+        report = collector.collect(self.asset_gc)
+        # Full orphan list stays with the backend reports, out of the deployed tree
+        collector.write_report(report, ASSET_GC_REPORT_PATH)
+        collector.log_report(report)
+        self.stats["asset_gc"] = report["totals"]
+    
     def _verify_output(self):
-        """Run post-generation verification"""
+        """
+        Run post-generation verification.
+        
+        Product rules already ran inside each brand's stream; this only checks
+        that the indexed files exist and merges the per-brand results. Brands
+        without a recorded result (manifest written by an older forge) are
+        streamed from disk.
+        """
         logger.info("   [4.5/5] Verifying catalog integrity...")
         verifier = CatalogVerifier(self.output_dir)
-        report = verifier.verify()
+        verifier.check_index()
+        for brand in self.master_index["brands"]:
+            if not verifier.check_brand_file(brand):
+                continue
+            brand_report = self.brand_verification.get(brand["slug"])
+            if brand_report is None:
+                brand_report = verify_brand_file(self.output_dir, brand)
+            verifier.merge(brand_report)
+        report = verifier.finalize()
         
         # Merge verifier stats into build stats
         self.stats["verification"] = report["stats"]
@@ -1006,11 +1562,12 @@ class HalilitCatalog:
         
         if len(report['issues']) > 5:
              logger.warning(f"      ... and {len(report['issues']) - 5} more issues.")
+        return report
 
     def _report(self):
         """Print final catalog build report."""
         logger.info("   [4/4] Catalog Build Report")
-        logger.info(f"      📊 Brands Processed:   {self.stats['brands_processed']}")
+        logger.info(f"      📊 Brands Processed:   {self.stats['brands_processed']} ({self.stats['brands_reused']} reused)")
         logger.info(f"      📊 Total Products:     {self.stats['products_total']}")
         logger.info(f"      📊 Search Entries:     {len(self.master_index['search_graph'])}")
         
@@ -1021,13 +1578,78 @@ class HalilitCatalog:
         else:
             logger.info(f"      ✅ Zero Errors")
         
+        # Machine-readable cost breakdown for regression tracking
+        report = self.profiler.write(BUILD_REPORT_PATH)
+        self.profiler.log_report(report)
+        for name in LEGACY_PUBLIC_REPORTS:
+            (self.output_dir / name).unlink(missing_ok=True)
+        
         logger.info("")
         logger.info("🎯 HALILIT CATALOG IS READY")
         logger.info(f"   Frontend can now fetch /data/index.json")
         logger.info(f"   Each brand lazy-loads from /data/<slug>.json")
 
 
-if __name__ == "__main__":
-    catalog = HalilitCatalog()
+# --- PROCESS POOL WORKERS ---
+# Each worker process owns one HalilitCatalog (registries, visual factory) for its lifetime.
+_WORKER_CATALOG: Optional[HalilitCatalog] = None
+
+
+def _init_forge_worker(source_dir: str, output_dir: str, pretty: bool, deterministic: bool, mirror_images: bool = False):
+    global _WORKER_CATALOG
+    _WORKER_CATALOG = HalilitCatalog(pretty=pretty, deterministic=deterministic, mirror_images=mirror_images)
+    _WORKER_CATALOG.source_dir = Path(source_dir)
+    _WORKER_CATALOG.output_dir = Path(output_dir)
+
+
+def _forge_brand_in_worker(sources: BrandSources) -> Dict[str, Any]:
+    """
+    Forge one brand inside a worker process.
+    
+    Returns the brand's index entry and search rows (merged by the parent)
+    plus any errors the worker recorded while processing it.
+    """
+    errors = _WORKER_CATALOG.stats["errors"]
+    errors_before = len(errors)
+    result = _WORKER_CATALOG._process_brand(sources)
+    return {"result": result, "errors": errors[errors_before:]}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Halilit Catalog Forge")
+    parser.add_argument("--full", action="store_true", help="Ignore the build manifest and rebuild every brand")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread", help="Brand forging executor")
+    parser.add_argument("--workers", type=int, default=None, help="Worker count (default: 8 threads / one process per core)")
+    parser.add_argument("--pretty", action="store_true", help="Write indented JSON (debug) instead of compact output")
+    parser.add_argument("--no-compress", action="store_true", help="Skip the .gz/.br sidecars")
+    parser.add_argument("--zstd", action="store_true", help="Also write .zst sidecars")
+    parser.add_argument("--zstd-dict", action="store_true", help="Train a zstd dictionary on the brand catalogs and use it for .zst")
+    parser.add_argument("--deterministic", action="store_true", help="Timestamp-free, sorted output with content-hashed brand filenames")
+    parser.add_argument("--gc", choices=["report", "delete", "quarantine", "off"], default="report",
+                        help="Orphaned product_images / thumbnails: report only, delete, or move to data/quarantine/assets")
+    parser.add_argument("--mirror-images", action="store_true",
+                        help="Download remote product images into data/mirror/ and reference the local copies")
+    parser.add_argument("--watch", action="store_true",
+                        help="After the build, re-forge single brands when data/blueprints or config/brand_maps.py change")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep the forge warm and serve rebuild / rebuild-brand / verify over a Unix socket")
+    parser.add_argument("--socket", default=None, help="Daemon socket path (default: data/cache/forge.sock)")
+    args = parser.parse_args(argv)
+    
+    compression = [] if args.no_compress else ["gzip", "brotli"] + (["zstd"] if args.zstd else [])
+    catalog = HalilitCatalog(full_rebuild=args.full, executor=args.executor, max_workers=args.workers, pretty=args.pretty,
+                             compression=compression, zstd_dict=args.zstd_dict, deterministic=args.deterministic,
+                             asset_gc=args.gc, mirror_images=args.mirror_images)
+    if args.daemon:
+        from services.forge_daemon import ForgeDaemon, DEFAULT_SOCKET_PATH
+        ForgeDaemon(catalog, Path(args.socket) if args.socket else DEFAULT_SOCKET_PATH).serve()
+        return 0
+    
     success = catalog.build()
-    exit(0 if success else 1)
+    if args.watch and success:
+        catalog.watch()
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -3,12 +3,12 @@ import argparse
 from services.raw_collector import RawCollector
 from services.genesis_builder import GenesisBuilder
 from services.delta_auditor import DeltaAuditor
+from services.catalog_writer import dump_json
 # We will import processors dynamically or statically after we create them
 # For now, let's assume RolandProcessor will be available
 import sys
 import os
 import asyncio
-import json
 
 # Add backend to path for imports to work if running as script from backend/
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -85,8 +85,7 @@ class MassIngestProtocol:
             bp_path = f"backend/data/blueprints/{brand_name.lower().replace(' ', '_')}_blueprint.json"
             os.makedirs(os.path.dirname(bp_path), exist_ok=True)
             
-            with open(bp_path, 'w', encoding='utf-8') as f:
-                json.dump(processed_blueprints, f, indent=2, ensure_ascii=False)
+            dump_json(processed_blueprints, bp_path, pretty=True)
             print(f"💾 [SAVED] {len(processed_blueprints)} blueprints to {bp_path}")
 
         print(f"✅ [COMPLETE] {brand_name} Official Pipeline Finished.")
@@ -111,30 +110,36 @@ class MassIngestProtocol:
         except ImportError:
             print("❌ HalilitDirectScraper not found.")
 
-if __name__ == "__main__":
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Mass Ingestion Protocol")
     parser.add_argument("--mode", choices=["official_only", "commercial_sync"], default="official_only", help="Ingestion Mode")
-    args = parser.parse_args()
-
-    from services.roland_scraper import RolandScraper
-    from services.processors.roland_processor import RolandProcessor
-    from services.nord_scraper import NordScraper
-    from services.processors.nord_processor import NordProcessor
-    from services.moog_scraper import MoogScraper
-    from services.processors.moog_processor import MoogProcessor
-    
+    args = parser.parse_args(argv)
+
     protocol = MassIngestProtocol(mode=args.mode)
     try:
         if args.mode == "official_only":
+            # Brand scrapers pull in Playwright: only the official pipeline pays for them
+            from services.nord_scraper import NordScraper
+            from services.processors.nord_processor import NordProcessor
+            from services.moog_scraper import MoogScraper
+            from services.processors.moog_processor import MoogProcessor
+            
             # Run Moog
             protocol.run_brand_pipeline("Moog", MoogScraper, MoogProcessor)
             # Run Nord
             protocol.run_brand_pipeline("Nord", NordScraper, NordProcessor)
             # Run Roland (if needed, commented in original but good to have)
+            # from services.roland_scraper import RolandScraper
+            # from services.processors.roland_processor import RolandProcessor
             # protocol.run_brand_pipeline("Roland", RolandScraper, RolandProcessor)
         elif args.mode == "commercial_sync":
             protocol.run_commercial_sync()
         
     except Exception as e:
         print(f"Pipeline Failed: {e}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
 
@@ -198,11 +198,10 @@ class TaxonomyRegistry:
         """Get all registered brands"""
         return list(self.brands.keys())
     
-    def export_to_frontend(self, output_path: Path):
+    def export_to_frontend(self, output_path: Path, include_timestamp: bool = True):
         """Export taxonomy to frontend JSON"""
         taxonomy_data = {
             "version": "1.0",
-            "exported_at": datetime.now(timezone.utc).isoformat(),
             "universal_categories": [
                 {
                     "id": cat.id,
@@ -214,6 +213,8 @@ class TaxonomyRegistry:
             ],
             "brand_mappings": self.BRAND_TAXONOMIES,
         }
+        if include_timestamp:
+            taxonomy_data["exported_at"] = datetime.now(timezone.utc).isoformat()
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w') as f:
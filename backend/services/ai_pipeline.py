@@ -25,6 +25,8 @@ from enum import Enum
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from services.asset_index import get_asset_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,6 +74,8 @@ class DataCheckpoint:
     def __init__(self, images_dir: Path, catalogs_dir: Path):
         self.images_dir = images_dir
         self.catalogs_dir = catalogs_dir
+        # "/data/..." paths resolve under images_dir.parent; one snapshot instead of a stat per image
+        self.assets = get_asset_index(images_dir.parent.parent)
     
     def validate_catalog(self, catalog_path: Path) -> ValidationReport:
         """
@@ -86,6 +90,8 @@ class DataCheckpoint:
         6. ✅ Brand identity is complete
         """
         issues = []
+        # Images may have been added or removed since the last catalog was checked
+        self.assets.revalidate()
         
         with open(catalog_path, 'r', encoding='utf-8') as f:
             catalog = json.load(f)
@@ -164,7 +170,7 @@ class DataCheckpoint:
             relative_path = image_url.replace('/data/', '')
             full_path = self.images_dir.parent / relative_path
             
-            if not full_path.exists():
+            if not self.assets.exists(full_path):
                 issues.append(ValidationIssue(
                     field='image_url',
                     product_id=product_id,
@@ -182,7 +188,7 @@ class DataCheckpoint:
                     relative_path = img_path.replace('/data/', '')
                     full_path = self.images_dir.parent / relative_path
                     
-                    if not full_path.exists():
+                    if not self.assets.exists(full_path):
                         issues.append(ValidationIssue(
                             field=f'images.{key}',
                             product_id=product_id,
@@ -0,0 +1,231 @@
+# backend/services/artifact_compressor.py
+"""
+Artifact Compressor - Precompressed Sidecars for Static Hosting
+
+Writes `<file>.gz`, `<file>.br` and optionally `<file>.zst` next to each forged
+JSON artifact at maximum compression level, so static hosts (nginx
+gzip_static/brotli_static, Caddy precompressed, CDNs) serve the bytes as-is
+with zero CPU at request time.
+
+- gzip: stdlib, always available
+- brotli: `brotli` package (skipped with a warning if missing)
+- zstd: `zstandard` package, opt-in; can use a dictionary trained on the
+  brand catalogs (small brand files compress far better with one)
+
+Compression runs in a thread pool; zlib, brotli and zstd release the GIL.
+With a state file, each sidecar is recorded with the SHA-256 of the source
+it was made from and left alone while that hash holds, so incremental builds
+only recompress what changed (mtimes are not trusted: copies, checkouts and
+same-second rewrites all break them). prune() removes sidecars whose source
+file is gone.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from services.catalog_writer import dump_json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ZSTD_LEVEL = 22
+ZSTD_DICT_SIZE = 112 * 1024
+ZSTD_DICT_NAME = "catalog.zstd-dict"
+DEFAULT_STATE_PATH = Path("data/cache/compression_state.json")  # source path -> hash the sidecars were made from
+
+
+def _gzip(data: bytes, zstd_dict=None) -> bytes:
+    # mtime=0 keeps the output byte-identical across builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli(data: bytes, zstd_dict=None) -> bytes:
+    return brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+
+def _zstd(data: bytes, zstd_dict=None) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zstd_dict).compress(data)
+
+
+CODECS = {
+    "gzip": (".gz", _gzip),
+    "brotli": (".br", _brotli),
+    "zstd": (".zst", _zstd),
+}
+
+
+def available_formats(requested: Iterable[str]) -> List[str]:
+    """Drop formats whose optional dependency is not installed."""
+    formats = []
+    for fmt in requested:
+        if fmt == "brotli" and brotli is None:
+            logger.warning("      ⚠️ brotli not installed, skipping .br sidecars (pip install brotli)")
+        elif fmt == "zstd" and zstandard is None:
+            logger.warning("      ⚠️ zstandard not installed, skipping .zst sidecars (pip install zstandard)")
+        else:
+            formats.append(fmt)
+    return formats
+
+
+def train_zstd_dictionary(samples: Iterable[Path], output_path: Path, dict_size: int = ZSTD_DICT_SIZE):
+    """
+    Train a zstd dictionary on catalog files and save it next to the artifacts.
+    Clients decoding the `.zst` sidecars need the same dictionary.
+    """
+    if zstandard is None:
+        return None
+
+    sample_bytes = [Path(p).read_bytes() for p in samples]
+    if len(sample_bytes) < 8:
+        logger.warning("      ⚠️ Too few catalogs to train a zstd dictionary")
+        return None
+
+    try:
+        trained = zstandard.train_dictionary(dict_size, sample_bytes, level=ZSTD_LEVEL)
+    except zstandard.ZstdError as e:
+        logger.warning(f"      ⚠️ zstd dictionary training failed: {e}")
+        return None
+
+    output_path.write_bytes(trained.as_bytes())
+    logger.info(f"      📚 Trained zstd dictionary: {output_path.name} ({len(trained.as_bytes()) / 1024:.1f} KB)")
+    return trained
+
+
+class ArtifactCompressor:
+    """
+    Compress a set of artifacts into sidecar files and report the savings.
+    """
+
+    def __init__(self, formats: Iterable[str] = ("gzip", "brotli"), max_workers: Optional[int] = None,
+                 zstd_dict=None, refresh: Iterable[str] = (), root: Optional[Path] = None,
+                 state_path: Optional[Path] = None):
+        self.formats = available_formats(formats)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.zstd_dict = zstd_dict
+        # Formats to recompress even when the sidecar is up to date (e.g. a new zstd dictionary)
+        self.refresh = set(refresh)
+        # Report file names relative to this directory (shards share base names)
+        self.root = Path(root) if root else None
+        # Without a state file every sidecar is rewritten (nothing proves it current)
+        self.state_path = Path(state_path) if state_path else None
+        self._state: Dict[str, Dict] = self._load_state()
+        self._state_lock = threading.Lock()
+
+    def _load_state(self) -> Dict[str, Dict]:
+        if self.state_path is None:
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(self._state, self.state_path)
+
+    def _compress_one(self, path: Path) -> Dict:
+        name = path.relative_to(self.root).as_posix() if self.root else path.name
+        data = path.read_bytes()
+        row = {"file": name, "raw": len(data)}
+        key = os.path.abspath(path)
+        digest = hashlib.sha256(data).hexdigest()
+        known = self._state.get(key, {})
+        made_from = known.get("formats", {}) if known.get("sha256") == digest else {}
+
+        for fmt in self.formats:
+            suffix, codec = CODECS[fmt]
+            sidecar = path.with_name(path.name + suffix)
+            if fmt not in self.refresh and fmt in made_from and sidecar.exists():
+                row[fmt] = sidecar.stat().st_size
+                continue
+
+            compressed = codec(data, self.zstd_dict)
+            tmp = sidecar.with_name(sidecar.name + '.tmp')
+            tmp.write_bytes(compressed)
+            os.replace(tmp, sidecar)
+            row[fmt] = len(compressed)
+
+        with self._state_lock:
+            self._state[key] = {"sha256": digest, "formats": {fmt: row[fmt] for fmt in self.formats}}
+        return row
+
+    def compress(self, paths: Iterable[Path]) -> Dict:
+        """
+        Compress every existing path in parallel.
+
+        Returns:
+            {"formats": [...], "files": [per-file sizes], "totals": {...}}
+        """
+        paths = [Path(p) for p in paths if Path(p).exists()]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            rows = list(executor.map(self._compress_one, paths))
+        self._save_state()
+
+        rows.sort(key=lambda r: r["raw"], reverse=True)
+        totals = {"raw": sum(r["raw"] for r in rows)}
+        for fmt in self.formats:
+            totals[fmt] = sum(r.get(fmt, 0) for r in rows)
+
+        return {"formats": self.formats, "files": rows, "totals": totals}
+
+    def prune(self, directory: Path, subdirs: Iterable[str] = ()) -> int:
+        """
+        Delete sidecars whose source file no longer exists, in `directory`
+        itself and the `subdirs` trees below it (asset folders holding thousands
+        of images are never walked); returns the count.
+        """
+        suffixes = tuple(suffix for suffix, _ in CODECS.values())
+        removed = 0
+        top = next(os.walk(directory), None)
+        walks = ([top] if top else []) + [w for sub in subdirs for w in os.walk(os.path.join(directory, sub))]
+        for dirpath, _, filenames in walks:
+            for filename in filenames:
+                if not filename.endswith(suffixes):
+                    continue
+                source = os.path.join(dirpath, filename.rsplit('.', 1)[0])
+                if not os.path.exists(source):
+                    os.unlink(os.path.join(dirpath, filename))
+                    self._state.pop(os.path.abspath(source), None)
+                    removed += 1
+        # Forget sources deleted together with their sidecars
+        root = os.path.abspath(directory) + os.sep
+        forgotten = [key for key in self._state if key.startswith(root) and not os.path.exists(key)]
+        for key in forgotten:
+            del self._state[key]
+        if removed or forgotten:
+            self._save_state()
+        return removed
+
+    @staticmethod
+    def write_report(report: Dict, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(report, path, pretty=True)
+
+    @staticmethod
+    def log_report(report: Dict):
+        totals = report["totals"]
+        raw = totals["raw"] or 1
+        logger.info(f"      📦 {len(report['files'])} artifacts, {totals['raw'] / 1024:.1f} KB raw")
+        for fmt in report["formats"]:
+            logger.info(f"      📦 {fmt:7s} {totals[fmt] / 1024:.1f} KB ({100 * totals[fmt] / raw:.1f}%)")
+        if report.get("pruned"):
+            logger.info(f"      🧹 {report['pruned']} sidecars without a source removed")
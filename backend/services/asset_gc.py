@@ -0,0 +1,292 @@
+# backend/services/asset_gc.py
+"""
+Asset GC - Orphaned Product Image / Thumbnail Collector
+
+Product images and thumbnails outlive the catalogs that referenced them:
+renamed brands, dropped products and old image pipelines leave files behind
+in frontend/public/data that still get deployed and uploaded.
+
+The collector:
+1. builds the set of referenced asset paths from index.json and every brand
+   file it lists (raw text scan for "/data/<asset dir>/..." strings, no JSON
+   parse); a responsive variant set (<base>_variants.json and the files it
+   lists, see services/image_variants.py) is kept whole while any of its
+   files is referenced
+2. walks the asset directories in parallel with os.scandir
+3. reports unreferenced files and bytes, and optionally deletes them or moves
+   them to a quarantine directory (same relative layout, easy to restore)
+
+Nothing is removed when the reference set is incomplete (missing index or
+unreadable brand file): the run degrades to a report.
+
+    gc = AssetGarbageCollector(Path("../frontend/public/data"))
+    report = gc.collect(mode="report")        # or "delete" / "quarantine"
+"""
+
+import json
+import logging
+import os
+import posixpath
+import re
+import shutil
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.catalog_writer import dump_json
+
+logger = logging.getLogger(__name__)
+
+ASSET_DIRS = ("product_images", "thumbnails")
+PUBLIC_PREFIX = "/data/"
+MODES = ("report", "delete", "quarantine")
+DEFAULT_QUARANTINE_DIR = Path("data/quarantine/assets")
+# Extra catalog files (besides the brand files) that may point at assets
+INDEX_FILES = ("index.json", "taxonomy.json", "search_index.json")
+# services/image_variants.py: <base>_variants.json lists every width / format of an asset set
+VARIANT_MANIFEST_SUFFIX = "_variants.json"
+LEGACY_ASSET_SUFFIXES = ("_thumb.webp", "_inspect.webp")  # Full-size files of a VisualFactory asset set
+
+
+def _scan_dir(path: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """One directory level: ([(file path, size)], [subdirectory paths])."""
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    files.append((entry.path, entry.stat(follow_symlinks=False).st_size))
+    except OSError as e:
+        logger.warning(f"      ⚠️ Cannot scan {path}: {e}")
+    return files, subdirs
+
+
+class AssetGarbageCollector:
+    """
+    Find (and optionally remove) asset files no catalog references.
+    """
+
+    def __init__(self, data_path: Path, asset_dirs: Iterable[str] = ASSET_DIRS, max_workers: Optional[int] = None,
+                 quarantine_dir: Path = DEFAULT_QUARANTINE_DIR):
+        self.data_path = Path(data_path)
+        self.asset_dirs = list(asset_dirs)
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.quarantine_dir = Path(quarantine_dir)
+        dirs = "|".join(re.escape(d) for d in self.asset_dirs)
+        # "/data/thumbnails/x.jpg" -> "thumbnails/x.jpg" (query strings / fragments dropped)
+        self._reference = re.compile(rf'"{re.escape(PUBLIC_PREFIX)}((?:{dirs})/(?:[^"\\?#]|\\.)+)')
+
+    # --- References ---
+
+    def _catalog_files(self) -> Tuple[List[Path], bool]:
+        """Files to scan for references, and whether that list is complete."""
+        index_path = self.data_path / "index.json"
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except Exception as e:
+            logger.warning(f"      ⚠️ index.json unreadable, references incomplete: {e}")
+            return [], False
+
+        paths = [self.data_path / name for name in INDEX_FILES if (self.data_path / name).exists()]
+        complete = True
+        for brand in index.get("brands", []):
+            path = self.data_path / brand.get("file", "")
+            if brand.get("file") and path.exists():
+                paths.append(path)
+            else:
+                logger.warning(f"      ⚠️ Brand file missing for {brand.get('slug')}, references incomplete")
+                complete = False
+        return paths, complete
+
+    def _references_in(self, path: Path) -> Optional[Set[str]]:
+        try:
+            text = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"      ⚠️ Cannot read {path.name}: {e}")
+            return None
+        refs = set()
+        for match in self._reference.finditer(text):
+            ref = match.group(1)
+            refs.add(json.loads(f'"{ref}"') if '\\' in ref else ref)
+        return refs
+
+    def referenced(self) -> Tuple[Set[str], bool]:
+        """Referenced asset paths relative to data_path, and whether every catalog could be read."""
+        paths, complete = self._catalog_files()
+        refs: Set[str] = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for found in executor.map(self._references_in, paths):
+                if found is None:
+                    complete = False
+                else:
+                    refs |= found
+        return refs, complete
+
+    def _variant_set(self, manifest: str) -> Set[str]:
+        """Files of the asset set behind a variant manifest (relative to data_path, manifest included)."""
+        base = manifest[:-len(VARIANT_MANIFEST_SUFFIX)]
+        members = {manifest} | {base + suffix for suffix in LEGACY_ASSET_SUFFIXES}
+        try:
+            with open(self.data_path / manifest, 'r', encoding='utf-8') as f:
+                variants = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"      ⚠️ Cannot read {manifest}: {e}")
+            return members
+        directory = posixpath.dirname(manifest)
+        for tier in variants.values():
+            for entry in tier.values() if isinstance(tier, dict) else ():
+                for f in entry.get("files", []) if isinstance(entry, dict) else ():
+                    members.add(posixpath.join(directory, posixpath.basename(unquote(f["src"]))))
+        return members
+
+    def variant_references(self, refs: Set[str], files: Iterable[str]) -> Set[str]:
+        """Every file of each variant set that has at least one referenced file."""
+        kept: Set[str] = set()
+        for name in files:
+            if name.endswith(VARIANT_MANIFEST_SUFFIX):
+                members = self._variant_set(name)
+                if members & refs:
+                    kept |= members
+        return kept
+
+    # --- Filesystem ---
+
+    def scan(self) -> List[Tuple[str, int]]:
+        """Every file under the asset directories as (path relative to data_path, size), walked in parallel."""
+        roots = [str(self.data_path / d) for d in self.asset_dirs if (self.data_path / d).is_dir()]
+        found: List[Tuple[str, int]] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(_scan_dir, root) for root in roots}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    found.extend(files)
+                    pending |= {executor.submit(_scan_dir, d) for d in subdirs}
+
+        base = str(self.data_path) + os.sep
+        return sorted((path[len(base):].replace(os.sep, '/'), size) for path, size in found)
+
+    # --- Collection ---
+
+    def collect(self, mode: str = "report") -> Dict:
+        """
+        Compare files on disk with catalog references and act on the orphans.
+
+        Returns:
+            {"mode", "complete", "referenced", "totals", "by_dir", "orphans": [{"file", "bytes"}]}
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown asset GC mode {mode!r} (expected one of {MODES})")
+
+        refs, complete = self.referenced()
+        files = self.scan()
+        # Catalogs reference one file of an asset set; its other widths / formats go with it
+        names = {name for name, _ in files}
+        refs |= self.variant_references(refs, names) & names
+        orphans = [(name, size) for name, size in files if name not in refs]
+
+        by_dir: Dict[str, Dict[str, int]] = {}
+        for name, size in files:
+            row = by_dir.setdefault(name.split('/', 1)[0], {"files": 0, "bytes": 0, "orphan_files": 0, "orphan_bytes": 0})
+            row["files"] += 1
+            row["bytes"] += size
+            if name not in refs:
+                row["orphan_files"] += 1
+                row["orphan_bytes"] += size
+
+        applied = mode
+        if mode != "report" and not complete:
+            logger.warning("      ⚠️ Catalog references incomplete, not removing anything")
+            applied = "report"
+        elif mode == "delete":
+            self._delete(name for name, _ in orphans)
+        elif mode == "quarantine":
+            self._quarantine(name for name, _ in orphans)
+
+        return {
+            "mode": applied,
+            "complete": complete,
+            "referenced": len(refs),
+            "missing": len(refs - names),
+            "totals": {
+                "files": len(files),
+                "bytes": sum(size for _, size in files),
+                "orphan_files": len(orphans),
+                "orphan_bytes": sum(size for _, size in orphans),
+            },
+            "by_dir": by_dir,
+            "orphans": [{"file": name, "bytes": size} for name, size in sorted(orphans, key=lambda o: -o[1])],
+        }
+
+    def _delete(self, names: Iterable[str]):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda name: (self.data_path / name).unlink(missing_ok=True), names))
+        self._prune_empty_dirs()
+
+    def _quarantine(self, names: Iterable[str]):
+        target_root = self.quarantine_dir / datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+        def move(name: str):
+            target = target_root / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(self.data_path / name), str(target))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(move, names))
+        self._prune_empty_dirs()
+        logger.info(f"      🧳 Quarantined orphans under {target_root}")
+
+    def _prune_empty_dirs(self):
+        """Remove directories left empty (deepest first); the asset roots themselves stay."""
+        for asset_dir in self.asset_dirs:
+            root = self.data_path / asset_dir
+            if not root.is_dir():
+                continue
+            for dirpath, _, _ in sorted(os.walk(root), key=lambda w: -len(w[0])):
+                if dirpath != str(root) and not os.listdir(dirpath):
+                    os.rmdir(dirpath)
+
+    @staticmethod
+    def write_report(report: Dict, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(report, path, pretty=True)
+
+    @staticmethod
+    def log_report(report: Dict):
+        totals = report["totals"]
+        logger.info(f"      🧹 {totals['files']} asset files ({totals['bytes'] / 1024 / 1024:.1f} MB), "
+                    f"{report['referenced']} referenced")
+        for name, row in sorted(report["by_dir"].items()):
+            logger.info(f"      🧹 {name:15s} {row['orphan_files']} orphaned, {row['orphan_bytes'] / 1024 / 1024:.1f} MB "
+                        f"of {row['bytes'] / 1024 / 1024:.1f} MB")
+        if report["missing"]:
+            logger.warning(f"      ⚠️ {report['missing']} referenced assets are not on disk")
+        verb = {"report": "reclaimable", "delete": "deleted", "quarantine": "quarantined"}[report["mode"]]
+        logger.info(f"      🧹 {totals['orphan_files']} files, {totals['orphan_bytes'] / 1024 / 1024:.1f} MB {verb}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find / remove product images and thumbnails no catalog references")
+    parser.add_argument("--data", default="../frontend/public/data", help="Catalog directory (contains index.json)")
+    parser.add_argument("--mode", choices=MODES, default="report")
+    parser.add_argument("--quarantine-dir", default=str(DEFAULT_QUARANTINE_DIR))
+    parser.add_argument("--report", default=None, help="Write the full JSON report (with every orphan) here")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    collector = AssetGarbageCollector(Path(args.data), quarantine_dir=Path(args.quarantine_dir))
+    result = collector.collect(args.mode)
+    collector.log_report(result)
+    if args.report:
+        collector.write_report(result, Path(args.report))
@@ -0,0 +1,177 @@
+# backend/services/asset_index.py
+"""
+Asset Index - One Directory Walk Instead of Thousands of stat() Calls
+
+Logo resolution and image validation used to probe the filesystem per brand
+and per product (up to 10 exists() calls plus a listdir for a logo, one stat
+per image path). AssetIndex takes a single os.scandir snapshot of the asset
+directories under frontend/public and answers from memory:
+
+- exists(path) / has_url("/data/thumbnails/x.jpg")   set lookup
+- find_prefix(directory, "roland")                    dict lookup (built per
+                                                      directory on first use)
+
+Paths outside the indexed directories fall back to the filesystem, so the
+answers are never wrong, only slower. Files written during the run are
+registered with add(). Long-lived processes call revalidate(): it stats only
+the indexed directories (whose mtimes change when files are added or
+removed) and re-walks when one changed; get_asset_index() does this for the
+shared index, at most once per REVALIDATE_INTERVAL.
+
+    index = get_asset_index(Path("../frontend/public"))
+    if index.has_url("/assets/logos/roland_logo.svg"): ...
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# Relative to the public root (frontend/public)
+INDEXED_DIRS = ("assets/logos", "data/logos", "data/product_images", "data/thumbnails")
+REVALIDATE_INTERVAL = 2.0  # Seconds between directory mtime checks of a shared index
+
+
+class AssetIndex:
+    """
+    Snapshot of the asset directories under one public root.
+    """
+
+    def __init__(self, public_root: Path, directories: Iterable[str] = INDEXED_DIRS):
+        self.root = os.path.abspath(public_root)
+        self.directories = [d.strip('/') for d in directories]
+        # Absolute directory -> file names directly inside it
+        self._files: Dict[str, Set[str]] = {}
+        # Absolute directory -> {lowercase prefix: first file name (sorted) starting with it}
+        self._prefixes: Dict[str, Dict[str, str]] = {}
+        # Directory as given by callers -> absolute key (abspath costs a getcwd() per call)
+        self._dir_keys: Dict[str, str] = {}
+        # Absolute directory -> mtime_ns when walked (None: did not exist)
+        self._mtimes: Dict[str, Optional[int]] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Re-walk the indexed directories (one scandir per directory)."""
+        files: Dict[str, Set[str]] = {}
+        mtimes: Dict[str, Optional[int]] = {}
+        pending = [os.path.join(self.root, d) for d in self.directories]
+        while pending:
+            directory = pending.pop()
+            names = files.setdefault(directory, set())
+            mtimes[directory] = self._mtime(directory)
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            names.add(entry.name)
+            except OSError:
+                continue  # Missing directory: indexed as empty
+        with self._lock:
+            self._files = files
+            self._prefixes = {}
+            self._mtimes = mtimes
+            self._checked_at = time.monotonic()
+        logger.debug(f"      🗂️  Asset index: {sum(len(n) for n in files.values())} files in {len(files)} directories")
+
+    @staticmethod
+    def _mtime(directory: str) -> Optional[int]:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def is_stale(self) -> bool:
+        """Whether a file or directory was added or removed in an indexed directory since the walk."""
+        return any(self._mtime(directory) != mtime for directory, mtime in list(self._mtimes.items()))
+
+    def revalidate(self, max_age: float = 0.0) -> bool:
+        """Re-walk when the snapshot is stale (checked at most every `max_age` seconds); True if refreshed."""
+        now = time.monotonic()
+        if now - self._checked_at < max_age:
+            return False
+        self._checked_at = now
+        if not self.is_stale():
+            return False
+        self.refresh()
+        return True
+
+    def _dir_key(self, directory: str) -> str:
+        key = self._dir_keys.get(directory)
+        if key is None:
+            key = self._dir_keys[directory] = os.path.abspath(directory)
+        return key
+
+    def _covered(self, directory: str) -> bool:
+        return directory in self._files or any(
+            directory.startswith(os.path.join(self.root, d) + os.sep) for d in self.directories
+        )
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """os.path.exists() for a filesystem path, answered from the snapshot when indexed."""
+        directory, name = os.path.split(os.fspath(path))
+        directory = self._dir_key(directory)
+        names = self._files.get(directory)
+        if names is not None:
+            return name in names
+        if self._covered(directory):
+            return False  # Inside an indexed tree but the directory did not exist
+        return os.path.exists(path)
+
+    def has_url(self, url: str) -> bool:
+        """Whether a public URL ("/assets/logos/x.svg", "/data/thumbnails/y.jpg") resolves to a file."""
+        return self.exists(os.path.join(self.root, url.split('?', 1)[0].lstrip('/')))
+
+    def files(self, directory: Union[str, Path]) -> List[str]:
+        """Sorted file names directly inside an indexed directory."""
+        directory = self._dir_key(os.fspath(directory))
+        if directory in self._files:
+            return sorted(self._files[directory])
+        try:
+            return sorted(entry.name for entry in os.scandir(directory) if entry.is_file())
+        except OSError:
+            return []
+
+    def find_prefix(self, directory: Union[str, Path], prefix: str) -> Optional[str]:
+        """First file name (sorted) in `directory` starting with `prefix`, case-insensitive."""
+        directory = self._dir_key(os.fspath(directory))
+        prefixes = self._prefixes.get(directory)
+        if prefixes is None:
+            prefixes = {}
+            for name in self.files(directory):
+                lowered = name.lower()
+                for end in range(1, len(lowered) + 1):
+                    prefixes.setdefault(lowered[:end], name)
+            with self._lock:
+                self._prefixes[directory] = prefixes
+        return prefixes.get(prefix.lower()) if prefix else None
+
+    def add(self, path: Union[str, Path]):
+        """Register a file written after the snapshot (e.g. a downloaded logo)."""
+        directory, name = os.path.split(os.fspath(path))
+        directory = self._dir_key(directory)
+        with self._lock:
+            self._files.setdefault(directory, set()).add(name)
+            self._prefixes.pop(directory, None)
+
+
+_indexes: Dict[str, AssetIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_asset_index(public_root: Path) -> AssetIndex:
+    """The shared AssetIndex for a public root (built on first use, re-walked when its directories change)."""
+    key = os.path.abspath(public_root)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            return _indexes.setdefault(key, AssetIndex(public_root))
+    index.revalidate(REVALIDATE_INTERVAL)
+    return index
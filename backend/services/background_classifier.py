@@ -0,0 +1,156 @@
+# backend/services/background_classifier.py
+"""
+Background Classifier - Skip Neural Background Removal for Clean Pack Shots
+
+Most manufacturer images already sit on a transparent or flat (usually white)
+background. Running rembg / U²-Net on those spends most of the image CPU on
+work a threshold can do. classify_background() looks at a downscaled copy:
+
+- transparent: the border is (almost) fully transparent, the alpha channel is
+  already the matte
+- uniform:     one colour dominates the border (peak of a quantized border
+  histogram covers >= 97% of border pixels) and something differs from it
+- complex:     anything else, including "nothing but background"; goes to rembg
+
+cut_out() is the fast path for the first two. For a uniform background it
+removes only background-coloured pixels connected to the image border (a
+white key on a white background stays), with a soft alpha ramp at the edges.
+
+NumPy is optional: without it every image is "complex" and rembg does the work.
+
+    info = classify_background(image)
+    nobg = cut_out(image, info) if info.kind != COMPLEX else remove(image, session=session)
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TRANSPARENT = "transparent"
+UNIFORM = "uniform"
+COMPLEX = "complex"
+
+ANALYSIS_MAX_DIM = 256  # Classification and connectivity run on a copy this size
+BORDER_FRACTION = 0.03  # Border band width relative to the shorter side (min 2 px)
+HISTOGRAM_BITS = 4  # Border colours quantized to 16 levels per channel
+BORDER_AGREEMENT = 0.97  # Share of border pixels that must agree on the background
+COLOR_TOLERANCE = 12  # Max per-channel distance from the background colour counted as background
+EDGE_RAMP = 36  # Distance over which alpha ramps from 0 to 255 (anti-aliased edges)
+ALPHA_CLEAR = 16  # Alpha below this counts as transparent
+MIN_FOREGROUND = 0.005  # Less than this much non-background: nothing to cut out
+
+
+@dataclass
+class BackgroundInfo:
+    """Classification of one image's background."""
+    kind: str
+    color: Optional[Tuple[int, int, int]] = None
+    border_agreement: float = 0.0
+    foreground: float = 0.0
+
+
+def _analysis_copy(image):
+    """Downscaled RGBA pixels (box reduction first, so full-size images are never converted)."""
+    if image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA")
+    factor = max(image.size) // ANALYSIS_MAX_DIM
+    if factor > 1:
+        image = image.reduce(factor)
+    return np.asarray(image.convert("RGBA"), dtype=np.int16)
+
+
+def _border(pixels) -> "np.ndarray":
+    """Pixels of the outer band, (N, channels)."""
+    height, width = pixels.shape[:2]
+    band = max(2, int(round(min(height, width) * BORDER_FRACTION)))
+    return np.concatenate([
+        pixels[:band].reshape(-1, pixels.shape[2]),
+        pixels[-band:].reshape(-1, pixels.shape[2]),
+        pixels[band:-band, :band].reshape(-1, pixels.shape[2]),
+        pixels[band:-band, -band:].reshape(-1, pixels.shape[2]),
+    ])
+
+
+def _distance(pixels, color) -> "np.ndarray":
+    """Max per-channel distance of every pixel from `color`."""
+    return np.abs(pixels[..., :3] - np.asarray(color, dtype=np.int16)).max(axis=-1)
+
+
+def classify_background(image) -> BackgroundInfo:
+    """Transparent / uniform / complex, from a downscaled copy of `image` (PIL)."""
+    if np is None or min(image.size) < 8:
+        return BackgroundInfo(COMPLEX)
+
+    pixels = _analysis_copy(image)
+    border = _border(pixels)
+    opaque = border[:, 3] >= ALPHA_CLEAR
+
+    clear = 1.0 - opaque.mean()
+    if clear >= BORDER_AGREEMENT:
+        foreground = float((pixels[..., 3] >= ALPHA_CLEAR).mean())
+        kind = TRANSPARENT if foreground >= MIN_FOREGROUND else COMPLEX
+        return BackgroundInfo(kind, border_agreement=round(float(clear), 4), foreground=round(foreground, 4))
+
+    # Dominant border colour: peak of the quantized histogram, refined to the mean of that bin
+    rgb = border[opaque, :3]
+    shift = 8 - HISTOGRAM_BITS
+    bins = ((rgb[:, 0] >> shift) << (2 * HISTOGRAM_BITS)) | ((rgb[:, 1] >> shift) << HISTOGRAM_BITS) | (rgb[:, 2] >> shift)
+    peak = np.bincount(bins).argmax()
+    color = tuple(int(c) for c in rgb[bins == peak].mean(axis=0).round())
+
+    agreement = float((_distance(border, color)[opaque] <= COLOR_TOLERANCE).sum()) / len(border)
+    foreground = float((_distance(pixels, color) > COLOR_TOLERANCE).mean())
+    kind = UNIFORM if agreement >= BORDER_AGREEMENT and foreground >= MIN_FOREGROUND else COMPLEX
+    return BackgroundInfo(kind, color=color, border_agreement=round(agreement, 4), foreground=round(foreground, 4))
+
+
+def _grow(mask) -> "np.ndarray":
+    """`mask` dilated by one cell (4-connected)."""
+    grown = mask.copy()
+    grown[1:] |= mask[:-1]
+    grown[:-1] |= mask[1:]
+    grown[:, 1:] |= mask[:, :-1]
+    grown[:, :-1] |= mask[:, 1:]
+    return grown
+
+
+def _connected_to_border(mask) -> "np.ndarray":
+    """Cells of `mask` reachable from the image border through `mask` (4-connected)."""
+    reach = np.zeros_like(mask)
+    reach[0], reach[-1], reach[:, 0], reach[:, -1] = mask[0], mask[-1], mask[:, 0], mask[:, -1]
+    while True:
+        grown = _grow(reach) & mask
+        if np.array_equal(grown, reach):
+            return reach
+        reach = grown
+
+
+def cut_out(image, info: BackgroundInfo):
+    """RGBA cut-out for a transparent or uniform background (no neural network)."""
+    from PIL import Image
+
+    rgba = image.convert("RGBA")
+    if info.kind == TRANSPARENT:
+        return rgba
+    if info.kind != UNIFORM:
+        raise ValueError(f"No fast path for {info.kind!r} backgrounds")
+
+    # Background connectivity on the small copy, grown by one cell so the scaled-up mask
+    # covers the mixed edge cells; the alpha ramp keeps everything not background-coloured
+    small = _analysis_copy(image)
+    reach = _grow(_connected_to_border(_distance(small, info.color) <= COLOR_TOLERANCE))
+    reach_mask = Image.fromarray(reach.astype(np.uint8) * 255).resize(rgba.size, Image.NEAREST)
+
+    pixels = np.asarray(rgba, dtype=np.int16)
+    distance = _distance(pixels, info.color).astype(np.int32)  # * 255 overflows int16
+    ramp = np.clip((distance - COLOR_TOLERANCE) * 255 // EDGE_RAMP, 0, 255)
+    alpha = np.where(np.asarray(reach_mask) > 0, ramp, 255)
+    alpha = np.minimum(alpha, pixels[..., 3]).astype(np.uint8)
+
+    out = np.asarray(rgba).copy()
+    out[..., 3] = alpha
+    return Image.fromarray(out, "RGBA")
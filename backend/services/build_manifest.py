@@ -0,0 +1,138 @@
+# backend/services/build_manifest.py
+"""
+Build Manifest - Incremental Forge Bookkeeping
+
+Records, per brand, the content hashes of every input that went into
+a forged brand file (blueprint, commercial and brand-site companions) together
+with the index entry and search-graph rows it produced.
+
+On the next run the forge compares fresh hashes against the manifest; brands
+whose inputs are unchanged are not reprocessed, their previous index entry and
+search rows are reused as-is.
+
+The whole manifest is invalidated when the global configuration fingerprint
+(catalog version, BRAND_THEMES, taxonomy rules, forge source) changes.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable SHA-256 over arbitrary JSON-serializable configuration."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class BuildManifest:
+    """
+    Persisted map of source catalog -> {input hashes, index entry, search rows, verifier results}.
+    """
+
+    def __init__(self, path: Path, config_fingerprint: str):
+        self.path = path
+        self.config_fingerprint = config_fingerprint
+        self.brands: Dict[str, Dict[str, Any]] = {}
+        self._seen: set = set()
+
+    def load(self) -> "BuildManifest":
+        """Load the previous manifest, discarding it (and records held from an earlier build) if the configuration changed."""
+        if not self.path.exists():
+            return self
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"      ⚠️ Build manifest unreadable, doing a full build: {e}")
+            self._reset()
+            return self
+
+        if data.get("version") != MANIFEST_VERSION:
+            logger.info("      ℹ️ Build manifest format changed, doing a full build")
+            self._reset()
+        elif data.get("config_fingerprint") != self.config_fingerprint:
+            logger.info("      ℹ️ Catalog configuration changed, doing a full build")
+            self._reset()
+        else:
+            self.brands = data.get("brands", {})
+
+        return self
+
+    def _reset(self):
+        # A warm forge (daemon) still holds the records of its previous build
+        self.brands = {}
+        self._seen = set()
+
+    def forget(self, keys: Iterable[str]):
+        """Drop the records of sources that must be re-forged on the next build."""
+        for key in keys:
+            self.brands.pop(key, None)
+            self._seen.discard(key)
+
+    def lookup(self, key: str, input_hashes: Dict[str, str], output_dir: Path) -> Optional[Dict[str, Any]]:
+        """
+        Return the previous record for `key` if its inputs are unchanged and
+        its output files (brand file, list pages, detail shards) are still on
+        disk, else None.
+        """
+        record = self.brands.get(key)
+        if not record or record.get("inputs") != input_hashes:
+            return None
+
+        entry = record.get("entry") or {}
+        if not entry.get("file"):
+            return None
+        outputs = [entry["file"], *entry.get("list_files", ()), *entry.get("detail_files", ())]
+        if not all((output_dir / name).exists() for name in outputs):
+            return None
+
+        self._seen.add(key)
+        return record
+
+    def record(self, key: str, input_hashes: Dict[str, str], entry: Dict[str, Any], search_rows: List[Dict],
+               verification: Optional[Dict[str, Any]] = None):
+        """Store the outputs produced from a freshly forged source catalog (and its verifier results)."""
+        self.brands[key] = {
+            "inputs": input_hashes,
+            "entry": entry,
+            "search_rows": search_rows,
+        }
+        if verification is not None:
+            self.brands[key]["verification"] = verification
+        self._seen.add(key)
+
+    def prune(self, keep: Optional[Iterable[str]] = None):
+        """Drop records for sources that were not part of this build."""
+        keep_keys = set(keep) if keep is not None else self._seen
+        for key in list(self.brands):
+            if key not in keep_keys:
+                del self.brands[key]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "config_fingerprint": self.config_fingerprint,
+                "brands": self.brands,
+            }, f, ensure_ascii=False)
+        tmp_path.replace(self.path)
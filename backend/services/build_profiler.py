@@ -0,0 +1,254 @@
+# backend/services/build_profiler.py
+"""
+Build Profiler - Per-Stage Cost Accounting for the Forge
+
+Records wall time, CPU time, peak RSS and bytes read / written for every
+stage of HalilitCatalog.build() and for each brand's load / merge / refine /
+index / verify / write steps, and writes them to a machine-readable build_report.json
+so regressions between releases show up as numbers, not hunches.
+
+Accounting rules:
+- Build stages use process-wide counters. CPU includes reaped child
+  processes (process executor workers are reaped when the pool shuts down).
+- Brand stages use the calling thread's own counters (thread CPU time,
+  /proc/thread-self/io), so concurrent brands in the thread pool don't blur
+  into each other.
+- Streaming brand stages (load / merge / refine / index / verify run one product at a
+  time, interleaved) are timed per step with upstream time excluded; their
+  I/O is part of the enclosing lap (the write stage that drives the stream).
+- Peak RSS is the high-water mark at the end of the stage (ru_maxrss).
+- Counters that the platform cannot provide are reported as null.
+"""
+
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from services.catalog_writer import dump_json
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+REPORT_VERSION = 1
+
+
+def _read_proc_io(path: str) -> Tuple[Optional[int], Optional[int]]:
+    """(rchar, wchar) from a Linux /proc io file, or (None, None)."""
+    try:
+        with open(path, 'r') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return int(fields['rchar']), int(fields['wchar'])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def process_io() -> Tuple[Optional[int], Optional[int]]:
+    """Bytes read / written by this process so far (including cache hits)."""
+    if psutil is not None:
+        try:
+            counters = psutil.Process().io_counters()
+            return (getattr(counters, 'read_chars', counters.read_bytes),
+                    getattr(counters, 'write_chars', counters.write_bytes))
+        except (psutil.Error, AttributeError):
+            pass
+    return _read_proc_io('/proc/self/io')
+
+
+def thread_io() -> Tuple[Optional[int], Optional[int]]:
+    """Bytes read / written by the calling thread so far (Linux only)."""
+    return _read_proc_io('/proc/thread-self/io')
+
+
+def peak_rss_kb(children: bool = False) -> Optional[int]:
+    """High-water resident set size in KB (of this process, or its largest child)."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+
+
+def _children_cpu() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _delta(after: Optional[int], before: Optional[int]) -> Optional[int]:
+    return None if after is None or before is None else after - before
+
+
+class StageTimer:
+    """
+    Per-brand lap clock, driven from inside the worker thread or process.
+    Each lap() closes the stage that started at the previous lap; wrap()
+    times a generator stage of a streaming pipeline:
+
+        timer = StageTimer()
+        header = load_header(...)
+        timer.lap("header")
+        products = timer.wrap("merge", merge(stream))
+        write(timer.wrap("refine", refine(products)))
+        timer.lap("write")      # excludes the time spent in merge / refine
+        result["profile"] = timer.stages
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._mark = self._snapshot()
+        # [child wall, child cpu] per active wrap() step, innermost last
+        self._stack: List[List[float]] = []
+        # Time spent in wrapped stages since the last lap
+        self._wrapped = [0.0, 0.0]
+
+    @staticmethod
+    def _snapshot() -> Tuple[float, float, Optional[int], Optional[int]]:
+        return (time.perf_counter(), time.thread_time(), *thread_io())
+
+    def lap(self, name: str, **extra: Any) -> Dict[str, Any]:
+        """Close stage `name`; `extra` adds stage-specific figures (e.g. product counts)."""
+        wall, cpu, read, written = self._snapshot()
+        wall_before, cpu_before, read_before, written_before = self._mark
+        record = {
+            "wall_s": round(wall - wall_before - self._wrapped[0], 4),
+            "cpu_s": round(cpu - cpu_before - self._wrapped[1], 4),
+            "peak_rss_kb": peak_rss_kb(),
+            "bytes_read": _delta(read, read_before),
+            "bytes_written": _delta(written, written_before),
+            **extra,
+        }
+        self.stages[name] = record
+        self._wrapped = [0.0, 0.0]
+        self._mark = self._snapshot()
+        return record
+
+    def wrap(self, name: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Yield from `iterable`, charging the time of each step to stage `name`.
+        Time spent inside wrapped upstream stages is charged to them instead.
+        """
+        record = self.stages.setdefault(name, {
+            "wall_s": 0.0, "cpu_s": 0.0, "peak_rss_kb": None,
+            "bytes_read": None, "bytes_written": None, "items": 0,
+        })
+        iterator = iter(iterable)
+        while True:
+            self._stack.append([0.0, 0.0])
+            wall_before, cpu_before = time.perf_counter(), time.thread_time()
+            done = False
+            try:
+                item = next(iterator)
+            except StopIteration:
+                done = True
+            finally:
+                wall = time.perf_counter() - wall_before
+                cpu = time.thread_time() - cpu_before
+                child_wall, child_cpu = self._stack.pop()
+                record["wall_s"] += wall - child_wall
+                record["cpu_s"] += cpu - child_cpu
+                parent = self._stack[-1] if self._stack else self._wrapped
+                parent[0] += wall
+                parent[1] += cpu
+            if done:
+                record["wall_s"] = round(record["wall_s"], 4)
+                record["cpu_s"] = round(record["cpu_s"], 4)
+                record["peak_rss_kb"] = peak_rss_kb()
+                return
+            record["items"] += 1
+            yield item
+
+
+class BuildProfiler:
+    """
+    Collects build stages and per-brand profiles, then writes build_report.json.
+    """
+
+    def __init__(self):
+        self.stages: List[Dict[str, Any]] = []
+        self.brands: Dict[str, Dict[str, Any]] = {}
+        self.reused: List[str] = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Dict[str, Any]]:
+        record: Dict[str, Any] = {"stage": name}
+        read_before, written_before = process_io()
+        wall_before = time.perf_counter()
+        cpu_before = time.process_time() + _children_cpu()
+        try:
+            yield record
+        finally:
+            read_after, written_after = process_io()
+            children_rss = peak_rss_kb(children=True)
+            own_rss = peak_rss_kb()
+            record.update({
+                "wall_s": round(time.perf_counter() - wall_before, 4),
+                "cpu_s": round(time.process_time() + _children_cpu() - cpu_before, 4),
+                "peak_rss_kb": None if own_rss is None else max(own_rss, children_rss or 0),
+                "bytes_read": _delta(read_after, read_before),
+                "bytes_written": _delta(written_after, written_before),
+            })
+            self.stages.append(record)
+
+    def add_brand(self, slug: str, source: str, products: int, stages: Dict[str, Dict[str, Any]]):
+        """Record the stage profile of one freshly forged brand."""
+        self.brands[source] = {"brand": slug, "source": source, "products": products, "stages": stages}
+
+    def add_reused(self, slug: str):
+        self.reused.append(slug)
+
+    def report(self) -> Dict[str, Any]:
+        """Stages in build order, brands sorted by cost (wall time, then CPU)."""
+        brands = []
+        for profile in self.brands.values():
+            stages = profile["stages"].values()
+            brands.append({
+                **profile,
+                "wall_s": round(sum(s["wall_s"] for s in stages), 4),
+                "cpu_s": round(sum(s["cpu_s"] for s in stages), 4),
+            })
+        brands.sort(key=lambda b: (b["wall_s"], b["cpu_s"]), reverse=True)
+
+        # Which step dominates across all brands
+        stage_totals: Dict[str, Dict[str, float]] = {}
+        for brand in brands:
+            for name, stage in brand["stages"].items():
+                totals = stage_totals.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0})
+                totals["wall_s"] = round(totals["wall_s"] + stage["wall_s"], 4)
+                totals["cpu_s"] = round(totals["cpu_s"] + stage["cpu_s"], 4)
+
+        return {
+            "version": REPORT_VERSION,
+            "wall_s": round(time.perf_counter() - self._started, 4),
+            "stages": self.stages,
+            "brand_stage_totals": stage_totals,
+            "brands": brands,
+            "reused_brands": sorted(self.reused),
+        }
+
+    def write(self, path: Path) -> Dict[str, Any]:
+        report = self.report()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(report, path, pretty=True)
+        return report
+
+    @staticmethod
+    def log_report(report: Dict[str, Any], top: int = 5):
+        logger.info(f"      ⏱️  Build wall time: {report['wall_s']:.2f}s")
+        for stage in report["stages"]:
+            logger.info(f"      ⏱️  {stage['stage']:18s} {stage['wall_s']:7.2f}s wall {stage['cpu_s']:7.2f}s cpu")
+        for brand in report["brands"][:top]:
+            logger.info(f"      🐢 {brand['brand']:20s} {brand['wall_s']:7.2f}s ({brand['products']} products)")
@@ -4,6 +4,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
 from models.product_hierarchy import ProductCore, ProductCatalog
+from services.catalog_writer import dump_json
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +14,9 @@ class MasterCatalogManager:
     Ensures scraping is ADDITIVE (Update/Merge) rather than destructive.
     """
     
-    def __init__(self, brand_id: str):
+    def __init__(self, brand_id: str, pretty: bool = True):
         self.brand_id = brand_id.lower()
+        self.pretty = pretty  # Master files are human-reviewed; compact on request
         self.file_path = Path(f"backend/data/vault/catalogs_brand/{self.brand_id}.json")
         self.backup_path = Path(f"backend/data/vault/catalogs_brand/backups/{self.brand_id}_{datetime.now().strftime('%Y%m%d')}.json")
         self._ensure_dirs()
@@ -89,8 +91,7 @@ class MasterCatalogManager:
             shutil.copy(self.file_path, self.backup_path)
 
         # Write Master
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(current_catalog.model_dump(mode='json'), f, indent=2, ensure_ascii=False)
+        dump_json(current_catalog.model_dump(mode='json'), self.file_path, pretty=self.pretty)
 
         logger.info(f"💾 Master File Saved: {self.brand_id}")
         logger.info(f"   ➕ Added: {new_count} | 🔄 Updated: {update_count} | 📦 Total: {len(merged_products)}")
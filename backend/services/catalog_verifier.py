@@ -1,9 +1,16 @@
 import json
 import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.product_stream import ProductStream
+
 logger = logging.getLogger(__name__)
 
 class CatalogVerifier:
@@ -13,10 +20,17 @@ class CatalogVerifier:
     1. Taxonomy Compliance (No 'Uncategorized' allowed in production)
     2. Naming Standards (No ALL CAPS, no weird chars)
     3. Structural Integrity (Images, IDs)
+
+    Two ways to run the rules:
+    - Fused (forge): verify_products() wraps the product stream while the brand
+      file is written, merge() folds the per-brand results into the build report.
+    - Standalone: verify() streams every brand file listed in index.json,
+      across `workers` processes when given.
     """
     
-    def __init__(self, public_data_path: Path):
+    def __init__(self, public_data_path: Path, workers: Optional[int] = None):
         self.data_path = public_data_path
+        self.workers = workers
         self.report = {
             "timestamp": datetime.now().isoformat(),
             "status": "PASS", # or FAIL
@@ -29,8 +43,7 @@ class CatalogVerifier:
         
         # Load Master Index
         index_path = self.data_path / "index.json"
-        if not index_path.exists():
-            self._log_issue("CRITICAL", "General", "index.json missing")
+        if not self.check_index():
             return self._finalize()
             
         try:
@@ -40,27 +53,65 @@ class CatalogVerifier:
             self._log_issue("CRITICAL", "General", f"index.json corrupt: {e}")
             return self._finalize()
 
-        # Check each brand
-        for brand in index.get("brands", []):
-            self._verify_brand_catalog(brand)
+        brands = index.get("brands", [])
+        if self.workers and self.workers > 1 and len(brands) > 1:
+            # Brand files are independent: parse and check them in parallel, merge in index order
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                jobs = [(str(self.data_path), brand.get("slug"), brand.get("file")) for brand in brands]
+                for brand_report in executor.map(_verify_brand_in_worker, jobs):
+                    self.merge(brand_report)
+        else:
+            # Check each brand
+            for brand in brands:
+                self._verify_brand_catalog(brand)
             
         return self._finalize()
 
+    def verify_products(self, products: Iterable[Dict], brand: str) -> Iterator[Dict]:
+        """Streaming stage: check each product as it passes through, unchanged."""
+        for product in products:
+            self._verify_product(product, brand)
+            yield product
+
+    def check_index(self) -> bool:
+        """Structural check: index.json exists."""
+        if (self.data_path / "index.json").exists():
+            return True
+        self._log_issue("CRITICAL", "General", "index.json missing")
+        return False
+
+    def check_brand_file(self, brand_entry: Dict) -> bool:
+        """Structural check without parsing: the brand file listed in the index exists."""
+        filename = brand_entry.get("file")
+        if filename and (self.data_path / filename).exists():
+            return True
+        self._log_issue("ERROR", brand_entry.get("slug"), f"Catalog file {filename} missing")
+        return False
+
+    def brand_report(self) -> Dict[str, Any]:
+        """Stats and issues collected so far (the part merge() consumes)."""
+        return {"stats": dict(self.report["stats"]), "issues": list(self.report["issues"])}
+
+    def merge(self, brand_report: Dict[str, Any]):
+        """Fold a brand's stats and issues (from verify_products or a worker) into this report."""
+        for key, value in brand_report.get("stats", {}).items():
+            self.report["stats"][key] = self.report["stats"].get(key, 0) + value
+        self.report["issues"].extend(brand_report.get("issues", []))
+        if brand_report.get("stats", {}).get("errors"):
+            self.report["status"] = "FAIL"
+
+    def finalize(self) -> Dict[str, Any]:
+        return self._finalize()
+
     def _verify_brand_catalog(self, brand_entry: Dict):
         slug = brand_entry.get("slug")
-        filename = brand_entry.get("file")
-        
-        path = self.data_path / filename
-        if not path.exists():
-            self._log_issue("ERROR", slug, f"Catalog file {filename} missing")
+        if not self.check_brand_file(brand_entry):
             return
 
+        path = self.data_path / brand_entry.get("file")
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            products = data.get("products", [])
-            for p in products:
+            # Streamed: one product in memory at a time
+            for p in ProductStream(path):
                 self._verify_product(p, slug)
                 
         except Exception as e:
@@ -118,3 +169,34 @@ class CatalogVerifier:
             logger.warning(f"      ⚠️  Verification found {self.report['stats']['errors']} errors and {self.report['stats']['warnings']} warnings")
         
         return self.report
+
+
+def verify_brand_file(data_path: Path, brand_entry: Dict) -> Dict[str, Any]:
+    """Verify one brand file on its own; returns its stats and issues for merge()."""
+    verifier = CatalogVerifier(data_path)
+    verifier._verify_brand_catalog(brand_entry)
+    return verifier.brand_report()
+
+
+def _verify_brand_in_worker(job) -> Dict[str, Any]:
+    data_path, slug, filename = job
+    return verify_brand_file(Path(data_path), {"slug": slug, "file": filename})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verify a generated catalog")
+    parser.add_argument("--data", default="../frontend/public/data", help="Catalog directory (contains index.json)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Parallel worker processes (1 = in-process)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = CatalogVerifier(Path(args.data), workers=args.workers).verify()
+    print(f"\n📊 {report['status']}: {report['stats']['verified']} products, "
+          f"{report['stats']['errors']} errors, {report['stats']['warnings']} warnings")
+    return 0 if report["status"] == "PASS" else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,264 @@
+# backend/services/catalog_writer.py
+"""
+Catalog Writer - Shared JSON Serialization for Every Backend Writer
+
+Two output modes:
+- compact (production): no whitespace, sorted keys inside objects, UTF-8
+- pretty (debug / vault files): 2-space indentation, like json.dump(indent=2)
+
+orjson is used when installed (several times faster than the stdlib encoder);
+otherwise the stdlib json module produces the same document.
+
+CatalogStreamWriter writes a top-level object field by field and streams list
+fields (products, search rows) one item at a time, so the fully serialized
+document never has to sit in memory. Files are written to a temporary path
+and atomically renamed, readers never see a half-written catalog.
+
+ShardedListWriter spreads one item stream over numbered files (list pages,
+detail shards); dump_json_list streams a top-level array (blueprint files).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize `obj` to UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if pretty else orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS, default=str)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bit - let the stdlib handle it
+
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), sort_keys=True, ensure_ascii=False, default=str)
+    return text.encode('utf-8')
+
+
+def dump_json(obj: Any, path: Union[str, Path], pretty: bool = False) -> int:
+    """
+    Atomically write `obj` as JSON to `path`.
+
+    Returns:
+        Number of bytes written
+    """
+    data = dumps(obj, pretty)
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def dump_json_list(items: Iterable[Any], path: Union[str, Path], pretty: bool = False) -> int:
+    """
+    Atomically stream `items` as a top-level JSON array to `path`.
+
+    Returns:
+        Number of items written
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    count = 0
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(b'[')
+            for item in items:
+                data = dumps(item, pretty)
+                if pretty:
+                    data = b'\n  ' + data.replace(b'\n', b'\n  ')
+                f.write((b',' if count else b'') + data)
+                count += 1
+            f.write(b'\n]' if pretty and count else b']')
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+    return count
+
+
+class CatalogStreamWriter:
+    """
+    Incrementally writes one JSON object:
+
+        with CatalogStreamWriter(path) as writer:
+            writer.write_field("brand_name", "Roland")
+            writer.write_items("products", iter_products())
+    """
+
+    def __init__(self, path: Union[str, Path], pretty: bool = False):
+        self.path = Path(path)
+        self.pretty = pretty
+        self.bytes_written = 0
+        self._tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self._file = None
+        self._fields = 0
+        self._items: Optional[int] = None
+
+    def __enter__(self) -> "CatalogStreamWriter":
+        self._file = open(self._tmp_path, 'wb')
+        self._write(b'{')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                if self._items is not None:
+                    self.end_list()
+                self._write(b'\n}\n' if self.pretty else b'}')
+        finally:
+            self._file.close()
+        if exc_type is None:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+        return False
+
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self.bytes_written += len(data)
+
+    def _key(self, key: str):
+        prefix = b',' if self._fields else b''
+        if self.pretty:
+            prefix += b'\n  '
+        self._write(prefix + dumps(key) + (b': ' if self.pretty else b':'))
+        self._fields += 1
+
+    def _value(self, value: Any, depth: int) -> bytes:
+        data = dumps(value, self.pretty)
+        if self.pretty:
+            data = data.replace(b'\n', b'\n' + b'  ' * depth)
+        return data
+
+    def write_field(self, key: str, value: Any):
+        """Write one complete `"key": value` pair."""
+        if self._items is not None:
+            self.end_list()
+        self._key(key)
+        self._write(self._value(value, 1))
+
+    def begin_list(self, key: str):
+        """Open a list field; follow with write_item() calls."""
+        if self._items is not None:
+            self.end_list()
+        self._key(key)
+        self._write(b'[')
+        self._items = 0
+
+    def write_item(self, item: Any):
+        prefix = b',' if self._items else b''
+        if self.pretty:
+            prefix += b'\n    '
+        self._write(prefix + self._value(item, 2))
+        self._items += 1
+
+    def end_list(self):
+        if self.pretty and self._items:
+            self._write(b'\n  ')
+        self._write(b']')
+        self._items = None
+
+    def write_items(self, key: str, items: Iterable[Any]) -> int:
+        """Stream an iterable into a list field. Returns the item count."""
+        self.begin_list(key)
+        count = 0
+        for item in items:
+            self.write_item(item)
+            count += 1
+        self.end_list()
+        return count
+
+
+class ShardedListWriter:
+    """
+    Spreads an item stream over `<directory>/0.json`, `1.json`, ... with
+    `size` items per file:
+
+        {**header(n), "<key>": [items], **trailer(n, is_last)}
+
+    A full file stays open until the next item arrives (or close()), so the
+    trailer knows whether it is the last one. `publish(path)` runs on every
+    finished file and returns the name recorded in `files` (e.g. a
+    content-addressed rename).
+    """
+
+    def __init__(self, directory: Union[str, Path], size: int, pretty: bool = False, key: str = "products",
+                 header: Optional[Callable[[int], Dict]] = None,
+                 trailer: Optional[Callable[[int, bool], Dict]] = None,
+                 publish: Optional[Callable[[Path], str]] = None,
+                 write_empty: bool = False):
+        self.directory = Path(directory)
+        self.size = size
+        self.pretty = pretty
+        self.key = key
+        self.header = header or (lambda n: {})
+        self.trailer = trailer or (lambda n, last: {})
+        self.publish = publish or (lambda path: path.name)
+        # Produce one (empty) file even when no item arrives
+        self.write_empty = write_empty
+        self.files: List[str] = []
+        self.count = 0
+        self._writer: Optional[CatalogStreamWriter] = None
+        self._in_file = 0
+
+    def __enter__(self) -> "ShardedListWriter":
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._writer is not None:
+            self._writer.__exit__(exc_type, exc, tb)
+            self._writer = None
+        return False
+
+    @property
+    def current(self) -> int:
+        """Number of the file the next item lands in."""
+        return self.count // self.size
+
+    def _open(self):
+        n = len(self.files)
+        self._writer = CatalogStreamWriter(self.directory / f"{n}.json", pretty=self.pretty).__enter__()
+        for field, value in self.header(n).items():
+            self._writer.write_field(field, value)
+        self._writer.begin_list(self.key)
+        self._in_file = 0
+
+    def _finish(self, last: bool):
+        n = len(self.files)
+        self._writer.end_list()
+        for field, value in self.trailer(n, last).items():
+            self._writer.write_field(field, value)
+        self._writer.__exit__(None, None, None)
+        self.files.append(self.publish(self._writer.path))
+        self._writer = None
+
+    def write(self, item: Any):
+        if self._writer is not None and self._in_file == self.size:
+            self._finish(last=False)
+        if self._writer is None:
+            self._open()
+        self._writer.write_item(item)
+        self._in_file += 1
+        self.count += 1
+
+    def close(self) -> List[str]:
+        if self._writer is None and not self.files and self.write_empty:
+            self._open()
+        if self._writer is not None:
+            self._finish(last=True)
+        return self.files
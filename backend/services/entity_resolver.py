@@ -0,0 +1,195 @@
+# backend/services/entity_resolver.py
+"""
+Entity Resolver - Commercial ↔ Official Product Matching
+
+Shared by the forge (HalilitCatalog._merge_with_global_data) and
+GenesisBuilder._merge_catalogs to pair Halilit records with brand-site records.
+
+Three stages instead of an all-pairs SequenceMatcher scan:
+1. Exact join on normalized SKU / model number
+2. Trigram inverted index picks a handful of candidates per product
+3. SequenceMatcher scoring on those candidates only (same > 0.6 threshold)
+
+With a MatchCache attached, manual overrides and remembered pairings from
+previous builds are consulted before any of the stages run.
+"""
+
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set, Tuple
+
+from services.match_cache import MatchCache, record_fingerprint, set_fingerprint
+
+MATCH_THRESHOLD = 0.6
+MAX_CANDIDATES = 12
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercase + trim, the form SequenceMatcher scores are computed on."""
+    return (name or '').lower().strip()
+
+
+def normalize_key(value) -> str:
+    """Normalize a SKU / model number for exact joins ("FP-30X" == "fp30x")."""
+    if value is None:
+        return ''
+    key = _NON_ALNUM.sub('', str(value).lower())
+    return key if len(key) >= 3 else ''
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class EntityResolver:
+    """
+    Index a list of target records (brand-site products) once, then resolve
+    any number of source records (Halilit products) against it.
+    """
+
+    KEY_FIELDS = ('sku', 'model_number')
+
+    def __init__(self, records: List[Dict], threshold: float = MATCH_THRESHOLD, max_candidates: int = MAX_CANDIDATES,
+                 cache: Optional[MatchCache] = None):
+        self.records = records
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.cache = cache
+        self.names: List[str] = [normalize_name(r.get('name')) for r in records]
+        self.stats = {"exact": 0, "fuzzy": 0, "unmatched": 0, "comparisons": 0, "cached": 0, "overridden": 0}
+
+        if cache is not None:
+            self._fingerprints = [record_fingerprint(r) for r in records]
+            self._by_fingerprint = {fp: idx for idx, fp in reversed(list(enumerate(self._fingerprints)))}
+            self._by_name = {name: idx for idx, name in reversed(list(enumerate(self.names))) if name}
+            self._targets_fp = set_fingerprint(self._fingerprints)
+
+        # Stage 1 index: normalized key -> record indices (in source order)
+        self._keys: Dict[str, List[int]] = defaultdict(list)
+        # Stage 2 index: trigram -> record indices
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._gram_counts: List[int] = []
+
+        for idx, record in enumerate(records):
+            for field in self.KEY_FIELDS:
+                key = normalize_key(record.get(field))
+                if key:
+                    self._keys[key].append(idx)
+            grams = trigrams(self.names[idx]) if self.names[idx] else set()
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(idx)
+
+        # Trigrams shared by most records (e.g. the brand name) carry no signal
+        self._common_df = max(50, len(records) // 2)
+
+    def match(self, record: Dict, name: Optional[str] = None, exclude: Optional[Set[int]] = None) -> Tuple[int, float]:
+        """
+        Find the best target for `record`.
+
+        Args:
+            record: Source product (its sku / model_number feed the exact join)
+            name: Name to score with (defaults to the record's normalized name)
+            exclude: Target indices that may not be matched again
+
+        Returns:
+            (target index, score), or (-1, best score seen) when nothing clears the threshold
+        """
+        exclude = exclude or set()
+        query = normalize_name(record.get('name')) if name is None else name
+
+        if self.cache is None:
+            return self._resolve(record, query, exclude)
+
+        # --- Manual overrides win over everything ---
+        has_override, forced_name = self.cache.override(query)
+        if has_override:
+            self.stats["overridden"] += 1
+            idx = self._by_name.get(forced_name, -1) if forced_name else -1
+            return (idx, 1.0) if idx >= 0 and idx not in exclude else (-1, 0.0)
+
+        # --- Remembered pairing from a previous build ---
+        source_fp = record_fingerprint(record)
+        entry = self.cache.get(query, source_fp)
+        if entry:
+            if entry["target_fp"] is None and entry.get("targets_fp") == self._targets_fp:
+                self.stats["cached"] += 1
+                return -1, entry["score"]
+            idx = self._by_fingerprint.get(entry["target_fp"], -1) if entry["target_fp"] else -1
+            if idx >= 0 and idx not in exclude:
+                self.stats["cached"] += 1
+                return idx, entry["score"]
+
+        idx, score = self._resolve(record, query, exclude)
+        # Remember only answers the claimed targets did not shape; one that depends on
+        # this build's claim order would be wrong in the next build
+        if not exclude or self._unrestricted(record, query) == idx:
+            if idx >= 0:
+                self.cache.put(query, source_fp, self._fingerprints[idx], self.records[idx].get('name'), score, self._targets_fp)
+            else:
+                self.cache.put(query, source_fp, None, None, score, self._targets_fp)
+        return idx, score
+
+    def _unrestricted(self, record: Dict, query: str) -> int:
+        """Target `record` resolves to with nothing claimed (stats untouched)."""
+        stats = dict(self.stats)
+        idx, _ = self._resolve(record, query, set())
+        self.stats = stats
+        return idx
+
+    def _resolve(self, record: Dict, query: str, exclude: Set[int]) -> Tuple[int, float]:
+        # --- Stage 1: exact key join ---
+        for field in self.KEY_FIELDS:
+            key = normalize_key(record.get(field))
+            for idx in self._keys.get(key, ()) if key else ():
+                if idx not in exclude:
+                    self.stats["exact"] += 1
+                    return idx, 1.0
+
+        if not query:
+            self.stats["unmatched"] += 1
+            return -1, 0.0
+
+        # --- Stage 2: candidate blocking ---
+        candidates = self._candidates(query, exclude)
+
+        # --- Stage 3: full similarity on candidates only ---
+        # Candidates are scanned in source order so ties resolve to the
+        # earliest record, exactly like the original linear scan.
+        best_idx, best_score = -1, 0.0
+        for idx in sorted(candidates):
+            matcher = SequenceMatcher(None, query, self.names[idx])
+            if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+                continue
+            self.stats["comparisons"] += 1
+            ratio = matcher.ratio()
+            if ratio > best_score:
+                best_idx, best_score = idx, ratio
+
+        if best_idx >= 0 and best_score > self.threshold:
+            self.stats["fuzzy"] += 1
+            return best_idx, best_score
+
+        self.stats["unmatched"] += 1
+        return -1, best_score
+
+    def _candidates(self, query: str, exclude: Set[int]) -> List[int]:
+        """Top targets by trigram Dice coefficient with the query."""
+        grams = trigrams(query)
+        informative = [g for g in grams if 0 < len(self._postings.get(g, ())) <= self._common_df]
+        if not informative:
+            informative = [g for g in grams if g in self._postings]
+
+        overlap: Dict[int, int] = defaultdict(int)
+        for gram in informative:
+            for idx in self._postings[gram]:
+                if idx not in exclude:
+                    overlap[idx] += 1
+
+        query_grams = len(grams)
+        dice = lambda idx: 2.0 * overlap[idx] / (query_grams + self._gram_counts[idx])
+        return sorted(overlap, key=lambda idx: (-dice(idx), idx))[:self.max_candidates]
@@ -0,0 +1,235 @@
+# backend/services/forge_daemon.py
+"""
+Forge Daemon - Warm Catalog Builds over a Unix Socket
+
+A one-shot forge run pays for interpreter start-up, building the
+TaxonomyRegistry, loading BRAND_MAPS and the build manifest and parsing every
+brand-site file before it forges anything. The daemon pays that once: it keeps
+one HalilitCatalog (registries, build manifest, parsed brand-site records) in
+memory and serves builds from a local control socket.
+
+Protocol: one JSON request line, one JSON response line, then the connection
+closes. Commands run one at a time.
+
+    {"cmd": "rebuild", "full": false}       Incremental build (or --full)
+    {"cmd": "rebuild-brand", "brands": ["roland", "boss"]}
+    {"cmd": "verify"}                       Verification report of the current output
+    {"cmd": "status"}                       Uptime, builds served, last result
+    {"cmd": "shutdown"}
+
+Every build response carries its per-stage timings.
+
+Server (from backend/):
+    python3 forge_backbone.py --daemon [--socket data/cache/forge.sock]
+Client (CI, editor hooks):
+    python3 services/forge_daemon.py rebuild-brand roland
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = Path("data/cache/forge.sock")
+MAX_REQUEST_BYTES = 1024 * 1024
+CLIENT_TIMEOUT = 600.0  # Seconds; a cold full rebuild can take minutes
+ISSUES_IN_RESPONSE = 20
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line or b"{}")
+            response = self.server.forge_daemon.dispatch(request)
+        except json.JSONDecodeError as e:
+            response = {"ok": False, "error": f"Invalid request: {e}"}
+        self.wfile.write(json.dumps(response, ensure_ascii=False, default=str).encode('utf-8') + b"\n")
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ForgeDaemon:
+    """
+    Serves build commands for one long-lived HalilitCatalog.
+    """
+
+    def __init__(self, catalog, socket_path: Path = DEFAULT_SOCKET_PATH):
+        self.catalog = catalog
+        self.socket_path = Path(socket_path)
+        # Parsed brand-site records survive between builds (re-read only when the file changes)
+        if self.catalog.content_cache is None:
+            self.catalog.content_cache = {}
+        self.commands: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "rebuild": self._rebuild,
+            "rebuild-brand": self._rebuild_brand,
+            "verify": self._verify,
+            "status": self._status,
+            "shutdown": self._shutdown,
+        }
+        self._build_lock = threading.Lock()
+        self._server: Optional[_UnixServer] = None
+        self._started = time.time()
+        self.served = 0
+        self.last: Optional[Dict[str, Any]] = None
+
+    # --- Commands ---
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        cmd = request.get("cmd")
+        handler = self.commands.get(cmd)
+        if handler is None:
+            return {"ok": False, "error": f"Unknown command {cmd!r}", "commands": sorted(self.commands)}
+        if cmd in ("status", "shutdown"):
+            return handler(request)
+
+        # Builds share the catalog's state: one at a time
+        with self._build_lock:
+            start = time.perf_counter()
+            try:
+                response = handler(request)
+            except Exception as e:
+                logger.error(f"❌ [DAEMON] {cmd} failed: {e}")
+                response = {"ok": False, "error": str(e)}
+            response["cmd"] = cmd
+            response["wall_s"] = round(time.perf_counter() - start, 3)
+            self.served += 1
+            self.last = {k: response.get(k) for k in ("cmd", "ok", "wall_s")}
+        logger.info(f"📨 [DAEMON] {cmd}: {'ok' if response.get('ok') else 'failed'} in {response['wall_s']:.2f}s")
+        return response
+
+    def _rebuild(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        catalog = self.catalog
+        full = bool(request.get("full"))
+        catalog.full_rebuild, previous = full, catalog.full_rebuild
+        try:
+            # Pick up BRAND_MAPS edits the way a fresh process would (brands whose logo changed are re-forged)
+            catalog.forget_brands(catalog.reload_brand_maps())
+            ok = catalog.build()
+        finally:
+            catalog.full_rebuild = previous
+
+        report = catalog.profiler.report()
+        return {
+            "ok": ok,
+            "brands": catalog.stats["brands_processed"],
+            "reused": catalog.stats["brands_reused"],
+            "products": catalog.stats["products_total"],
+            "errors": catalog.stats["errors"][:ISSUES_IN_RESPONSE],
+            "stages": report["stages"],
+            "brand_stage_totals": report["brand_stage_totals"],
+        }
+
+    def _rebuild_brand(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        brands = request.get("brands") or ([request["brand"]] if request.get("brand") else [])
+        if not brands:
+            return {"ok": False, "error": "rebuild-brand needs \"brands\": [<source key>, ...]"}
+        if not self.catalog.master_index["brands"]:
+            return {"ok": False, "error": "No build in memory yet, send \"rebuild\" first"}
+
+        result = self.catalog.rebuild_brands(brands)
+        return {"ok": not result["failed"], **result}
+
+    def _verify(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        report = self.catalog._verify_output()
+        return {
+            "ok": report["status"] == "PASS",
+            "status": report["status"],
+            "stats": report["stats"],
+            "issues": report["issues"][:ISSUES_IN_RESPONSE],
+        }
+
+    def _status(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self._started, 1),
+            "served": self.served,
+            "brands": len(self.catalog.master_index["brands"]),
+            "cached_content_files": len(self.catalog.content_cache or {}),
+            "last": self.last,
+        }
+
+    def _shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # shutdown() blocks until serve_forever returns: call it off the handler thread
+        threading.Thread(target=self._server.shutdown, daemon=True).start()
+        return {"ok": True}
+
+    # --- Server ---
+
+    def _claim_socket(self):
+        """Remove a stale socket file; refuse to start when another daemon answers on it."""
+        if not self.socket_path.exists():
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            return
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()
+            return
+        raise RuntimeError(f"A forge daemon is already listening on {self.socket_path}")
+
+    def serve(self, warm: bool = True):
+        """Listen until a shutdown command (or Ctrl+C); with `warm`, build once before accepting commands."""
+        self._claim_socket()
+        if warm:
+            logger.info("🔥 [DAEMON] Warm-up build...")
+            self.dispatch({"cmd": "rebuild"})
+
+        self._server = _UnixServer(str(self.socket_path), _RequestHandler)
+        self._server.forge_daemon = self
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"🛰️  [DAEMON] Listening on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            logger.info("👋 [DAEMON] Stopped")
+
+
+def send_command(cmd: str, socket_path: Path = DEFAULT_SOCKET_PATH, timeout: float = CLIENT_TIMEOUT,
+                 **args: Any) -> Dict[str, Any]:
+    """Send one command to a running daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall(json.dumps({"cmd": cmd, **args}).encode('utf-8') + b"\n")
+        with client.makefile('rb') as reply:
+            return json.loads(reply.readline())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Send a command to a running forge daemon")
+    parser.add_argument("cmd", choices=["rebuild", "rebuild-brand", "verify", "status", "shutdown"])
+    parser.add_argument("brands", nargs="*", help="Source keys for rebuild-brand (e.g. roland boss)")
+    parser.add_argument("--full", action="store_true", help="rebuild: ignore the build manifest")
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET_PATH))
+    args = parser.parse_args()
+
+    request: Dict[str, Any] = {}
+    if args.cmd == "rebuild-brand":
+        request["brands"] = args.brands
+    if args.full:
+        request["full"] = True
+    try:
+        response = send_command(args.cmd, Path(args.socket), **request)
+    except OSError as e:
+        print(f"❌ No forge daemon on {args.socket}: {e}")
+        exit(2)
+    print(json.dumps(response, indent=2, ensure_ascii=False))
+    exit(0 if response.get("ok") else 1)
@@ -0,0 +1,98 @@
+# backend/services/forge_watcher.py
+"""
+Forge Watcher - Change Detection for Watch Mode
+
+Polls the blueprint directory and individual config files (one os.scandir /
+stat per poll, no third-party dependency) and reports which files were added,
+changed or removed since the last poll.
+
+Editors save in bursts (temp file, rename, second write), so a change is only
+reported once the watched paths have been quiet for `debounce` seconds; every
+path touched during the burst is returned together.
+
+    watcher = SourceWatcher([Path("data/blueprints")], [Path("config/brand_maps.py")])
+    for changed in watcher.changes():     # blocks between batches
+        rebuild(changed)
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.25  # Seconds between polls
+DEBOUNCE = 0.3  # Quiet period before a burst of edits is reported
+
+Signature = Tuple[int, int]  # (mtime_ns, size)
+
+
+class SourceWatcher:
+    """
+    Poll-based change detector for a set of directories and files.
+    """
+
+    def __init__(self, directories: Iterable[Path] = (), files: Iterable[Path] = (), suffix: str = ".json",
+                 interval: float = POLL_INTERVAL, debounce: float = DEBOUNCE):
+        self.directories = [Path(d) for d in directories]
+        self.files = [Path(f) for f in files]
+        # Only directory entries with this suffix are watched (skips editor swap / temp files)
+        self.suffix = suffix
+        self.interval = interval
+        self.debounce = debounce
+        self._state = self.snapshot()
+
+    def snapshot(self) -> Dict[Path, Signature]:
+        """Current (mtime_ns, size) of every watched file."""
+        state: Dict[Path, Signature] = {}
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(self.suffix) and entry.is_file():
+                            st = entry.stat()
+                            state[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue  # Directory missing (yet): nothing to watch
+        for path in self.files:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def poll(self) -> Set[Path]:
+        """Paths added, changed or removed since the previous poll."""
+        state = self.snapshot()
+        previous, self._state = self._state, state
+        changed = {path for path, sig in state.items() if previous.get(path) != sig}
+        changed.update(path for path in previous if path not in state)
+        return changed
+
+    def wait(self, stop: Optional[threading.Event] = None) -> Set[Path]:
+        """Block until a burst of changes has settled; empty when `stop` is set first."""
+        stop = stop or threading.Event()
+        changed: Set[Path] = set()
+        quiet_since = None
+        while not stop.is_set():
+            found = self.poll()
+            now = time.monotonic()
+            if found:
+                changed |= found
+                quiet_since = now
+            elif changed and now - quiet_since >= self.debounce:
+                return changed
+            stop.wait(self.interval)
+        return set()
+
+    def changes(self, stop: Optional[threading.Event] = None) -> Iterator[Set[Path]]:
+        """Debounced change batches until `stop` is set (or forever)."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            changed = self.wait(stop)
+            if changed:
+                yield changed
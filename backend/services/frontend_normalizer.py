@@ -2,7 +2,7 @@
 from typing import List, Dict, Any, Optional
 from models.product_hierarchy import ProductCore
 from models.category_consolidator import consolidate_category
-import os
+from services.asset_index import get_asset_index
 import glob
 
 class FrontendNormalizer:
@@ -16,30 +16,26 @@ class FrontendNormalizer:
         # Convert brand name to potential filename patterns
         brand_slug = brand.lower().replace(" ", "-").replace("_", "-")
         
-        # Try to find logo in assets/logos directory
+        # Try to find logo in assets/logos directory (one shared snapshot, no per-product stat calls)
+        assets = get_asset_index("frontend/public")
         logos_dir = "frontend/public/assets/logos"
         
         # Try exact match with different extensions
         for ext in ['png', 'svg', 'jpg', 'gif', 'webp']:
             # Try with _logo suffix
             logo_path = f"{logos_dir}/{brand_slug}_logo.{ext}"
-            if os.path.exists(logo_path):
+            if assets.exists(logo_path):
                 return f"/assets/logos/{brand_slug}_logo.{ext}"
             
             # Try without _logo suffix
             logo_path = f"{logos_dir}/{brand_slug}.{ext}"
-            if os.path.exists(logo_path):
+            if assets.exists(logo_path):
                 return f"/assets/logos/{brand_slug}.{ext}"
         
         # Try partial matches (handles brands with slightly different names)
-        try:
-            # List all files and try fuzzy matching
-            if os.path.exists(logos_dir):
-                for filename in os.listdir(logos_dir):
-                    if filename.lower().startswith(brand_slug):
-                        return f"/assets/logos/{filename}"
-        except:
-            pass
+        filename = assets.find_prefix(logos_dir, brand_slug)
+        if filename:
+            return f"/assets/logos/{filename}"
         
         # Fallback to generic logo path
         return f"/assets/logos/{brand_slug}_logo.png"
@@ -12,11 +12,10 @@ The resulting "Skeleton" app is fully browseable with all products visible,
 waiting for heavy scrapers to fill in detailed specs in the background.
 """
 
-import json
 import os
-import requests
 import shutil
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional
 from pathlib import Path
 import sys
 
@@ -29,10 +28,10 @@ except ImportError:
     # Fallback if imports fail (e.g. running script directly)
     def consolidate_category(brand, cat): return "general"
 
-try:
-    from services.relationship_engine import ProductRelationshipEngine
-except ImportError:
-    ProductRelationshipEngine = None
+from services.entity_resolver import EntityResolver
+from services.match_cache import MatchCache
+from services.catalog_writer import CatalogStreamWriter, dump_json
+from services.product_stream import ProductStream
 
 class GenesisBuilder:
 
@@ -53,18 +52,24 @@ class GenesisBuilder:
     # We scrape to Vault, then Forge Backbone refines it to Frontend
     OUTPUT_DIR = os.path.join(BASE_DIR, "data", "vault", "catalogs_brand")
     
+    # Match memory (see services/match_cache.py); own directory, the forge's cache evicts pairings it doesn't use
+    MATCH_CACHE_DIR = os.path.join(BASE_DIR, "data", "cache", "matches", "genesis")
+    MATCH_OVERRIDES_PATH = os.path.join(BASE_DIR, "data", "match_overrides.json")
+    
     # LEGACY / REFERENCE:
     # FRONTEND_DATA = os.path.join(os.path.dirname(BASE_DIR), "frontend/public/data")
     # FRONTEND_IMAGES = os.path.join(os.path.dirname(BASE_DIR), "frontend/public/data/images")
 
-    def __init__(self, brand_key: str):
+    def __init__(self, brand_key: str, pretty: bool = True):
         """
         Initialize builder for a specific brand.
         
         Args:
             brand_key: Brand identifier (e.g., "roland")
+            pretty: Indented vault files (False writes compact JSON)
         """
         self.brand = brand_key
+        self.pretty = pretty
         self.blueprint_file = f"backend/data/blueprints/{brand_key}_blueprint.json"
         self.products_built = []
 
@@ -73,6 +78,10 @@ class GenesisBuilder:
         Read blueprints (Global + Commercial) and construct app structure.
         Merges Halilit commercial data with Brand global content.
         
+        Commercial products stream through merge → product node → catalog
+        entry one at a time; only the brand-site records (match targets) are
+        held in memory.
+        
         Returns:
             True if successful, False otherwise
         """
@@ -83,30 +92,42 @@ class GenesisBuilder:
         global_data = []
         if os.path.exists(global_path):
             try:
-                with open(global_path, 'r') as f:
-                    global_data = json.load(f)
+                global_data = list(ProductStream(global_path))
             except Exception as e:
                 print(f"   ⚠️ Bad Global Blueprint: {e}")
 
-        commercial_data = []
+        commercial = None
         if os.path.exists(commercial_path):
             try:
-                 with open(commercial_path, 'r') as f:
-                    commercial_data = json.load(f)
+                stream = iter(ProductStream(commercial_path))
+                first = next(stream, None)
+                if first is not None:
+                    commercial = chain([first], stream)
             except Exception as e:
                 print(f"   ⚠️ Bad Commercial Blueprint: {e}")
 
-        if not global_data and not commercial_data:
+        if not global_data and commercial is None:
             print(f"⚠️  No data found for {self.brand} (checked both sources)")
             return False
 
         print(f"🏗️  Initiating Genesis for {self.brand.upper()}...")
-        print(f"   Sources: Global={len(global_data)}, Commercial={len(commercial_data)}")
+        print(f"   Sources: Global={len(global_data)}, Commercial={'streamed' if commercial is not None else 0}")
 
         # 2. Merge Logic (The "Split Source" Implementation)
-        blueprint = self._merge_catalogs(commercial_data, global_data)
+        blueprint = self._merge_catalogs(commercial, global_data)
+        
+        try:
+            self._update_catalog_index(self._build_nodes(blueprint))
+        except ValueError as e:  # Includes JSONDecodeError from a truncated commercial feed
+            print(f"   ⚠️ Bad Commercial Blueprint: {e}")
+            return False
         
-        print(f"   Processing {len(blueprint)} merged products...")
+        print(f"✨ Genesis Complete for {self.brand}: {len(self.products_built)} products.")
+        return True
+
+    def _build_nodes(self, blueprint: Iterable[Dict]) -> Iterator[Dict]:
+        """Build each merged product's node, passing the items through."""
+        print(f"   Processing merged products...")
         
         for idx, item in enumerate(blueprint, 1):
             success = self._build_node(item)
@@ -114,41 +135,28 @@ class GenesisBuilder:
                 self.products_built.append(item['id'])
             
             if idx % 10 == 0:
-                print(f"   └─ {idx}/{len(blueprint)} products constructed")
-        
-        # 3. Discover Product Relationships (Optional)
-        # If we have the relationship engine, analyze all products for connections
-        if ProductRelationshipEngine and len(blueprint) > 5:
-            print(f"   🔗 Analyzing product relationships...")
-            try:
-                engine = ProductRelationshipEngine()
-                blueprint = list(engine.analyze_all_blueprints(blueprint).values())
-                print(f"   ✅ Relationship analysis complete")
-            except Exception as e:
-                print(f"   ⚠️ Relationship analysis skipped: {e}")
-            
-        self._update_catalog_index(blueprint)
-        print(f"✨ Genesis Complete for {self.brand}: {len(self.products_built)} products.")
-        return True
+                print(f"   └─ {idx} products constructed")
+            yield item
 
-    def _merge_catalogs(self, commercial: List[Dict], global_data: List[Dict]) -> List[Dict]:
+    def _merge_catalogs(self, commercial: Optional[Iterable[Dict]], global_data: List[Dict]) -> Iterator[Dict]:
         """
         Merges the Commercial Catalog (Halilit) with the Global Catalog (Brand).
         
         IMPLEMENTS 'CHURCH AND STATE' SEPARATION:
         - official_knowledge: Strictly from Manufacturer (Global)
         - commercial_offer: Strictly from Retailer (Commercial)
-        """
-        merged = []
-        from difflib import SequenceMatcher
         
+        Yields merged items as the commercial stream is consumed.
+        """
         print("   🔄 Merging Commercial & Global data (Twin-Pipe Strategy)...")
         
         # Determine Master List
         # If commercial data exists, it drives the product list (Sales-Driven).
         # If not, we fall back to Global data (Catalog-Driven) for preview/dev.
-        master_list = commercial if commercial else global_data
-        is_sale_driven = bool(commercial)
+        is_sale_driven = commercial is not None
+        master_list = commercial if is_sale_driven else global_data
+        match_cache = MatchCache(self.brand, self.MATCH_CACHE_DIR, self.MATCH_OVERRIDES_PATH) if is_sale_driven else None
+        resolver = EntityResolver(global_data, cache=match_cache) if is_sale_driven else None
 
         for item in master_list:
             
@@ -177,20 +185,11 @@ class GenesisBuilder:
                 # If we are iterating global items, the item IS the official knowledge
                 official_knowledge = item
             else:
-                # We need to find the matching global item
-                best_match = None
-                best_score = 0.0
+                # We need to find the matching global item (SKU join, then >0.6 name similarity)
+                match_idx, _ = resolver.match(comm_item, name=match_target_name.strip())
                 
-                for glob_item in global_data:
-                    glob_name = glob_item.get('name', '').lower()
-                    if match_target_name and glob_name:
-                         ratio = SequenceMatcher(None, match_target_name, glob_name).ratio()
-                         if ratio > 0.6 and ratio > best_score:
-                             best_score = ratio
-                             best_match = glob_item
-                
-                if best_match:
-                    official_knowledge = best_match
+                if match_idx >= 0:
+                    official_knowledge = global_data[match_idx]
 
             # 3. Construct "Church and State" Object
             final_item = {
@@ -199,11 +198,12 @@ class GenesisBuilder:
                 "commercial_offer": commercial_offer
             }
             
-            merged.append(final_item)
-            
-        return merged
+            yield final_item
+        
+        if match_cache:
+            match_cache.save()
 
-    def _update_catalog_index(self, blueprint: List[Dict]):
+    def _update_catalog_index(self, blueprint: Iterable[Dict]):
         """
         Update the brand catalog file (e.g. roland.json) with new image URLs.
         Preserves existing brand identity if file exists.
@@ -216,8 +216,8 @@ class GenesisBuilder:
         
         if os.path.exists(catalog_path):
             try:
-                with open(catalog_path, 'r') as f:
-                    catalog_data = json.load(f)
+                # Brand metadata only, the previous products are replaced anyway
+                catalog_data = ProductStream(catalog_path).header()
             except:
                 pass
         
@@ -227,56 +227,57 @@ class GenesisBuilder:
                 "name": self.brand.upper()
             }
             
-        # Rebuild Products List
-        new_products = []
-        for item in blueprint:
-            safe_id = item['id']
-            
-            # ACCESS DATA STREAMS
-            official = item.get('official_knowledge', {}) or {}
-            commercial = item.get('commercial_offer', {}) or {}
-            
-            # 1. Resolve Image URL (STRICT: Official Only)
-            # We explicitly reject commercial images here.
-            public_url = "/assets/placeholder_gear.png"
+        # Rebuild Products List (streamed straight into the catalog file)
+        with CatalogStreamWriter(catalog_path, pretty=self.pretty) as writer:
+            for key, value in catalog_data.items():
+                if key != "products":
+                    writer.write_field(key, value)
+            writer.write_items("products", (self._catalog_entry(item) for item in blueprint))
+
+    def _catalog_entry(self, item: Dict) -> Dict:
+        """Flatten one merged (Church & State) item into a brand catalog product."""
+        safe_id = item['id']
+        
+        # ACCESS DATA STREAMS
+        official = item.get('official_knowledge', {}) or {}
+        commercial = item.get('commercial_offer', {}) or {}
+        
+        # 1. Resolve Image URL (STRICT: Official Only)
+        # We explicitly reject commercial images here.
+        public_url = "/assets/placeholder_gear.png"
+        
+        if official.get('image_url') and "placeholder" not in official['image_url']:
+            public_url = official['image_url']
+        elif official.get('remote_image'):
+             public_url = official['remote_image']
             
-            if official.get('image_url') and "placeholder" not in official['image_url']:
-                public_url = official['image_url']
-            elif official.get('remote_image'):
-                 public_url = official['remote_image']
-                
-            # 2. Resolve Name (Prefer Official)
-            product_name = official.get('name') or commercial.get('name') or "Unknown Model"
+        # 2. Resolve Name (Prefer Official)
+        product_name = official.get('name') or commercial.get('name') or "Unknown Model"
 
-            # 3. Smart Categorization
-            raw_cat = official.get('category', 'general')
-            final_cat = self._smart_categorize(product_name, raw_cat)
-            
-            product_entry = {
-                "id": safe_id,
-                "name": product_name,
-                "brand": self.brand,
-                "category": final_cat,
-                "image_url": public_url,
-                "description": official.get('description', ''),
-                
-                # Extended Commerce Data (Halilit Integration)
-                "pricing": {"price": commercial.get('price')},
-                "stock_status": commercial.get('in_stock'),
-                "sku": commercial.get('sku'),
-                "halilit_url": commercial.get('buy_url'),
-                
-                # Official Media Assets (From brand official sites)
-                "official_manuals": official.get('official_manuals', []),
-                "official_gallery": official.get('official_gallery', []),
-            }
+        # 3. Smart Categorization
+        raw_cat = official.get('category', 'general')
+        final_cat = self._smart_categorize(product_name, raw_cat)
+        
+        product_entry = {
+            "id": safe_id,
+            "name": product_name,
+            "brand": self.brand,
+            "category": final_cat,
+            "image_url": public_url,
+            "description": official.get('description', ''),
             
-            new_products.append(product_entry)
+            # Extended Commerce Data (Halilit Integration)
+            "pricing": {"price": commercial.get('price')},
+            "stock_status": commercial.get('in_stock'),
+            "sku": commercial.get('sku'),
+            "halilit_url": commercial.get('buy_url'),
             
-        catalog_data["products"] = new_products
+            # Official Media Assets (From brand official sites)
+            "official_manuals": official.get('official_manuals', []),
+            "official_gallery": official.get('official_gallery', []),
+        }
         
-        with open(catalog_path, 'w') as f:
-            json.dump(catalog_data, f, indent=2)
+        return product_entry
 
     def _build_node(self, item: Dict) -> bool:
         """
@@ -358,8 +359,7 @@ class GenesisBuilder:
 
             # 4. Write to Disk
             product_file_path = os.path.join(product_folder, f"{safe_id}.json")
-            with open(product_file_path, 'w') as f:
-                json.dump(product_data, f, indent=2)
+            dump_json(product_data, product_file_path, pretty=self.pretty)
             
             return True
             
@@ -379,6 +379,7 @@ class GenesisBuilder:
             True if successful, False otherwise
         """
         try:
+            import requests  # Only image downloads need it
             response = requests.get(url, timeout=5, stream=True)
             if response.status_code == 200:
                 with open(save_path, 'wb') as f:
@@ -0,0 +1,180 @@
+# backend/services/image_cache.py
+"""
+Image Cache - Source Images Keyed by URL, Stored by Content Hash
+
+VisualFactory used to decide "already processed" from the existence of
+<id>_thumb.webp alone: a changed source image was never picked up, and
+force_reprocess re-downloaded and recomputed everything.
+
+The cache keeps, per source URL, the validators the server sent (ETag,
+Last-Modified) and the SHA-256 of the bytes, and stores the bytes once per
+content hash:
+
+    data/cache/images/
+      entries/<sha256(url)>.json     {"url", "etag", "last_modified", "sha256", "size", "checked_at", "outputs"}
+      blobs/<sha[:2]>/<sha>          original image bytes (shared by URLs serving the same file)
+
+fetch() revalidates with a conditional GET (If-None-Match / If-Modified-Since);
+a 304 is answered from the blob. "outputs" remembers which source hash each
+derived asset set (thumbnail + inspection image) was rendered from, so callers
+regenerate only when the bytes actually changed.
+
+One file per URL keeps concurrent workers (services/visual_batch.py) from
+rewriting a shared index.
+
+    cache = ImageCache()
+    image = cache.fetch(url)
+    if cache.is_current(url, output_base, image.sha256): ...   # skip rendering
+    cache.mark_rendered(url, output_base, image.sha256)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("data/cache/images")
+FETCH_TIMEOUT = 10
+USER_AGENT = 'Mozilla/5.0 (Halilit Catalog Builder)'
+
+
+@dataclass
+class CachedImage:
+    """Bytes of a source image and how they were obtained."""
+    url: str
+    data: bytes
+    sha256: str
+    # "new" (first fetch), "changed" (200 with different bytes), "unchanged" (200, same bytes),
+    # "not_modified" (304), "fresh" (checked within max_age, no request), "stale" (fetch failed, cached copy)
+    status: str
+
+    @property
+    def changed(self) -> bool:
+        return self.status in ("new", "changed")
+
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class ImageCache:
+    """
+    URL -> validators + content hash, bytes stored once per hash.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_age: float = 0.0, timeout: float = FETCH_TIMEOUT):
+        self.cache_dir = Path(cache_dir)
+        # Seconds an entry is trusted without revalidating (0 = conditional GET every time)
+        self.max_age = max_age
+        self.timeout = timeout
+        self._session = None
+
+    # --- Storage ---
+
+    def _entry_path(self, url: str) -> Path:
+        return self.cache_dir / "entries" / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _blob_path(self, sha: str) -> Path:
+        return self.cache_dir / "blobs" / sha[:2] / sha
+
+    def entry(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_entry(self, url: str, entry: Dict[str, Any]):
+        _write_atomic(self._entry_path(url), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+
+    def _read_blob(self, entry: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        if not entry or not entry.get("sha256"):
+            return None
+        try:
+            return self._blob_path(entry["sha256"]).read_bytes()
+        except OSError:
+            return None
+
+    # --- Fetching ---
+
+    def _get(self, url: str, headers: Dict[str, str]):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session.get(url, headers=headers, timeout=self.timeout)
+
+    def fetch(self, url: str) -> CachedImage:
+        """
+        Source bytes for `url`, revalidated against the cached copy.
+        Raises when the image cannot be fetched and nothing is cached.
+        """
+        entry = self.entry(url)
+        cached = self._read_blob(entry)
+
+        if cached is not None and self.max_age and time.time() - entry.get("checked_at", 0) < self.max_age:
+            return CachedImage(url, cached, entry["sha256"], "fresh")
+
+        headers = {'User-Agent': USER_AGENT}
+        if cached is not None:
+            if entry.get("etag"):
+                headers['If-None-Match'] = entry["etag"]
+            if entry.get("last_modified"):
+                headers['If-Modified-Since'] = entry["last_modified"]
+
+        try:
+            response = self._get(url, headers)
+            if response.status_code == 304 and cached is not None:
+                entry["checked_at"] = time.time()
+                self._save_entry(url, entry)
+                return CachedImage(url, cached, entry["sha256"], "not_modified")
+            response.raise_for_status()
+        except Exception as e:
+            if cached is None:
+                raise
+            logger.warning(f"      ⚠️ Revalidation failed for {url}, using cached copy: {e}")
+            return CachedImage(url, cached, entry["sha256"], "stale")
+
+        data = response.content
+        sha = hashlib.sha256(data).hexdigest()
+        blob = self._blob_path(sha)
+        if not blob.exists():
+            _write_atomic(blob, data)
+
+        previous = entry or {}
+        status = "new" if cached is None else ("unchanged" if previous.get("sha256") == sha else "changed")
+        self._save_entry(url, {
+            "url": url,
+            "etag": response.headers.get('ETag'),
+            "last_modified": response.headers.get('Last-Modified'),
+            "sha256": sha,
+            "size": len(data),
+            "content_type": response.headers.get('Content-Type'),
+            "checked_at": time.time(),
+            # Renders stay valid only while they were made from these bytes
+            "outputs": previous.get("outputs", {}) if status == "unchanged" else
+                       {base: h for base, h in previous.get("outputs", {}).items() if h == sha},
+        })
+        return CachedImage(url, data, sha, status)
+
+    # --- Derived assets ---
+
+    def is_current(self, url: str, output_base: str, sha: str) -> bool:
+        """Whether the assets at `output_base` were rendered from source bytes `sha`."""
+        entry = self.entry(url)
+        return bool(entry) and entry.get("outputs", {}).get(output_base) == sha
+
+    def mark_rendered(self, url: str, output_base: str, sha: str):
+        entry = self.entry(url)
+        if entry is None:
+            return
+        entry.setdefault("outputs", {})[output_base] = sha
+        self._save_entry(url, entry)
@@ -0,0 +1,450 @@
+# backend/services/image_mirror.py
+"""
+Image Mirror - Concurrent Download of Remote Product Images
+
+The forge falls back to hotlinking `remote_image` / `image_url` from
+manufacturer CDNs, and every other image download in the backend is a serial
+blocking requests.get(): one slow CDN holds up the whole run.
+
+The mirror collects every remote image a set of catalogs references and
+downloads them concurrently on one asyncio loop:
+
+- one httpx.AsyncClient (shared connection pools, HTTP keep-alive)
+- a cap per host (PER_HOST_LIMIT) inside a global cap (MAX_CONNECTIONS), so a
+  slow or rate-limiting CDN uses its own slots and never the others'
+- resumable: finished files are recorded in a manifest and skipped next run;
+  an interrupted download continues from its .part file with a Range request
+
+and then rewrites the catalogs to the local copies:
+
+    frontend/public/data/mirror/<host>/<sha256(url)[:20]><ext>   ->   /data/mirror/<host>/...
+
+`images.original` keeps the remote URL. httpx is imported only when a mirror runs.
+
+The forge mirrors while it writes (forge_backbone.py --mirror-images, see
+mirror_stream), so brand files, list pages, detail shards, content hashes and
+the build manifest all see the local paths. Standalone, the mirror rewrites
+every file index.json lists and refreshes their sidecars; content-hashed
+(--deterministic) output is left alone, a rewrite in place would break its names.
+
+    python3 services/image_mirror.py [catalog.json ...] [--per-host 4] [--dry-run]
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from services.catalog_writer import dump_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = Path("../frontend/public/data")
+MIRROR_DIRNAME = "mirror"
+MANIFEST_NAME = "manifest.json"
+INDEX_NAME = "index.json"
+ASSET_MANIFEST_NAME = "asset-manifest.json"  # Present when the forge content-addressed its output
+PUBLIC_PREFIX = "/data"
+PER_HOST_LIMIT = 4
+MAX_CONNECTIONS = 32
+REQUEST_TIMEOUT = 20.0
+RETRIES = 2
+RETRY_STATUSES = (408, 429)  # Client errors worth retrying; other 4xx fail at once
+CHUNK_SIZE = 64 * 1024
+STREAM_BATCH = 200  # Records held per download round in mirror_stream
+USER_AGENT = 'Mozilla/5.0 (Halilit Catalog Builder)'
+
+# Catalog fields that hold an image URL (string, list of strings / {"url"} dicts, or {role: url})
+IMAGE_FIELDS = ("image_url", "image", "remote_image", "series_logo", "logo_url", "images")
+KEEP_REMOTE_KEYS = ("original",)  # images.original stays a reference to the source
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp",
+    "image/gif": ".gif", "image/svg+xml": ".svg", "image/avif": ".avif",
+}
+KNOWN_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".svg", ".avif"}
+
+
+@dataclass
+class MirrorResult:
+    """Outcome of one URL."""
+    url: str
+    status: str  # "downloaded", "resumed", "cached" (done in an earlier run), "failed"
+    path: Optional[str] = None  # Public path (/data/mirror/...)
+    size: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def _is_remote(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith(("http://", "https://"))
+
+
+def _image_refs(node: Any) -> Iterable[str]:
+    """Remote image URLs in one IMAGE_FIELDS value."""
+    if _is_remote(node):
+        yield node
+    elif isinstance(node, list):
+        for item in node:
+            yield from _image_refs(item.get("url") if isinstance(item, dict) else item)
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            if key not in KEEP_REMOTE_KEYS and _is_remote(value):
+                yield value
+
+
+def _rewrite_refs(node: Any, mapping: Dict[str, str]) -> Any:
+    if isinstance(node, str):
+        return mapping.get(node, node)
+    if isinstance(node, list):
+        out = []
+        for item in node:
+            if isinstance(item, dict) and item.get("url") in mapping:
+                item = {**item, "url": mapping[item["url"]]}
+            elif isinstance(item, str):
+                item = mapping.get(item, item)
+            out.append(item)
+        return out
+    if isinstance(node, dict):
+        return {k: v if k in KEEP_REMOTE_KEYS else mapping.get(v, v) if isinstance(v, str) else v
+                for k, v in node.items()}
+    return node
+
+
+def _records(catalog: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Dicts whose IMAGE_FIELDS are mirrored: the brand identity and every product."""
+    if isinstance(catalog.get("brand_identity"), dict):
+        yield catalog["brand_identity"]
+    for product in catalog.get("products", []):
+        if isinstance(product, dict):
+            yield product
+
+
+def collect_urls(catalog: Dict[str, Any]) -> List[str]:
+    """Remote image URLs referenced by a catalog, in first-seen order."""
+    seen: Dict[str, None] = {}
+    for record in _records(catalog):
+        for field in IMAGE_FIELDS:
+            for url in _image_refs(record.get(field)):
+                seen.setdefault(url, None)
+    return list(seen)
+
+
+def rewrite_catalog(catalog: Dict[str, Any], mapping: Dict[str, str]) -> int:
+    """Point image fields at mirrored copies (in place); returns the number of records changed."""
+    changed = 0
+    for record in _records(catalog):
+        touched = False
+        for field in IMAGE_FIELDS:
+            if field not in record:
+                continue
+            value = _rewrite_refs(record[field], mapping)
+            if value != record[field]:
+                if isinstance(record[field], dict) and _is_remote(record[field].get("main")):
+                    value.setdefault("original", record[field]["main"])
+                record[field] = value
+                touched = True
+        changed += touched
+    return changed
+
+
+class ImageMirror:
+    """
+    Downloads remote catalog images with per-host concurrency caps and rewrites the catalogs.
+    """
+
+    def __init__(self, data_dir: Path = DEFAULT_DATA_DIR, per_host: int = PER_HOST_LIMIT,
+                 max_connections: int = MAX_CONNECTIONS, timeout: float = REQUEST_TIMEOUT, retries: int = RETRIES):
+        self.data_dir = Path(data_dir)
+        self.mirror_dir = self.data_dir / MIRROR_DIRNAME
+        self.manifest_path = self.mirror_dir / MANIFEST_NAME
+        self.per_host = max(1, per_host)
+        self.max_connections = max(self.per_host, max_connections)
+        self.timeout = timeout
+        self.retries = retries
+        # url -> {"path", "size", "sha256"} of finished downloads (the resume point)
+        self.manifest: Dict[str, Dict[str, Any]] = self._load_manifest()
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._dirty = 0
+        # One run at a time per instance, so the per-host caps hold across forge threads
+        self._lock = threading.Lock()
+
+    # --- Manifest ---
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("files", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self):
+        # Forge worker processes mirror into the same directory: keep what they recorded meanwhile
+        self.manifest = {**self._load_manifest(), **self.manifest}
+        self.mirror_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"updated_at": time.time(), "files": self.manifest}, f, ensure_ascii=False)
+        os.replace(tmp, self.manifest_path)
+        self._dirty = 0
+
+    # --- Paths ---
+
+    def local_file(self, url: str, content_type: Optional[str] = None) -> Path:
+        """Mirror location: <host>/<sha256(url)[:20]><ext> (extension from the URL, else Content-Type)."""
+        parts = urlsplit(url)
+        ext = os.path.splitext(parts.path)[1].lower()
+        if ext not in KNOWN_EXTENSIONS:
+            ext = CONTENT_TYPE_EXTENSIONS.get((content_type or "").split(";")[0].strip(), ".img")
+        host = parts.hostname or "unknown-host"
+        return self.mirror_dir / host / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:20]}{ext}"
+
+    def public_path(self, path: Path) -> str:
+        return f"{PUBLIC_PREFIX}/{path.relative_to(self.data_dir).as_posix()}"
+
+    def _finished(self, url: str) -> Optional[str]:
+        entry = self.manifest.get(url)
+        if entry and (self.data_dir / entry["path"]).exists():
+            return self.public_path(self.data_dir / entry["path"])
+        return None
+
+    # --- Download ---
+
+    async def _download(self, client, url: str) -> MirrorResult:
+        """Stream `url` into <file>.part (continuing a previous .part) and move it into place."""
+        start = time.perf_counter()
+        part = self.local_file(url).with_suffix(".part")
+        part.parent.mkdir(parents=True, exist_ok=True)
+        offset = part.stat().st_size if part.exists() else 0
+        headers = {'User-Agent': USER_AGENT}
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 416:  # .part already holds the whole file
+                pass
+            elif response.status_code not in (200, 206):
+                response.raise_for_status()
+                raise RuntimeError(f"HTTP {response.status_code}")
+            else:
+                resumed = response.status_code == 206
+                with open(part, 'ab' if resumed else 'wb') as f:
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        f.write(chunk)
+                offset = offset if resumed else 0
+            content_type = response.headers.get('Content-Type')
+
+        data = part.read_bytes()
+        target = self.local_file(url, content_type)
+        os.replace(part, target)
+        self.manifest[url] = {
+            "path": target.relative_to(self.data_dir).as_posix(),
+            "size": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "content_type": content_type,
+        }
+        self._dirty += 1
+        return MirrorResult(url, "resumed" if offset else "downloaded", self.public_path(target),
+                            len(data), time.perf_counter() - start)
+
+    async def _fetch(self, client, url: str) -> MirrorResult:
+        host = urlsplit(url).hostname or ""
+        slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with slots:
+            error = None
+            for attempt in range(self.retries + 1):
+                try:
+                    return await self._download(client, url)
+                except Exception as e:
+                    error = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+                    status = getattr(getattr(e, "response", None), "status_code", None)
+                    if status and 400 <= status < 500 and status not in RETRY_STATUSES:
+                        break  # Gone / forbidden: another attempt won't help
+                    if attempt < self.retries:
+                        await asyncio.sleep(0.5 * 2 ** attempt)
+            return MirrorResult(url, "failed", error=error)
+
+    async def mirror_async(self, urls: Iterable[str]) -> Dict[str, MirrorResult]:
+        """Download every URL not already mirrored; {url: MirrorResult}."""
+        import httpx  # Only mirror runs need it
+
+        self._host_slots = {}  # Semaphores belong to this run's event loop
+        results: Dict[str, MirrorResult] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            done = self._finished(url)
+            if done:
+                results[url] = MirrorResult(url, "cached", done, self.manifest[url].get("size", 0))
+            else:
+                pending.append(url)
+        if not pending:
+            return results
+
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        async with httpx.AsyncClient(limits=limits, timeout=self.timeout, follow_redirects=True) as client:
+            tasks = [asyncio.ensure_future(self._fetch(client, url)) for url in pending]
+            for done, task in enumerate(asyncio.as_completed(tasks), 1):
+                result = await task
+                results[result.url] = result
+                if result.status == "failed":
+                    logger.warning(f"      ⚠️ {result.url}: {result.error}")
+                # Checkpoint so an interrupted run resumes from here
+                if self._dirty >= 50:
+                    self.save_manifest()
+                if done % 100 == 0:
+                    logger.info(f"      📥 {done}/{len(pending)} images")
+        self.save_manifest()
+        return results
+
+    def mirror(self, urls: Iterable[str]) -> Dict[str, MirrorResult]:
+        with self._lock:
+            return asyncio.run(self.mirror_async(urls))
+
+    def mirror_stream(self, records: Iterable[Dict[str, Any]], batch_size: int = STREAM_BATCH) -> Iterator[Dict[str, Any]]:
+        """
+        Forge stage: mirror a product stream `batch_size` records at a time and
+        yield each record with its image fields pointing at the local copies
+        (failed downloads keep the remote URL).
+        """
+        batch: List[Dict[str, Any]] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield from self._mirror_batch(batch)
+                batch = []
+        if batch:
+            yield from self._mirror_batch(batch)
+
+    def _mirror_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        catalog = {"products": batch}
+        urls = collect_urls(catalog)
+        if urls:
+            results = self.mirror(urls)
+            rewrite_catalog(catalog, {url: r.path for url, r in results.items() if r.path})
+        return batch
+
+    # --- Catalogs ---
+
+    def catalog_files(self) -> List[Path]:
+        """Every file index.json lists (brand files, list pages, detail shards), else the top-level JSON files."""
+        try:
+            with open(self.data_dir / INDEX_NAME, 'r', encoding='utf-8') as f:
+                brands = json.load(f).get("brands")
+        except (OSError, ValueError, AttributeError):
+            brands = None
+        if brands is None:
+            return sorted(self.data_dir.glob("*.json"))
+        names = []
+        for brand in brands:
+            names.extend([brand["file"]] if brand.get("file") else [])
+            names.extend(brand.get("list_files", []) + brand.get("detail_files", []))
+        return [self.data_dir / name for name in names]
+
+    def load_catalogs(self, paths: Optional[List[Path]] = None) -> Dict[Path, Dict[str, Any]]:
+        """Catalogs by path: `paths`, or every file index.json lists (index and reports skipped)."""
+        catalogs = {}
+        for path in [Path(p) for p in paths] if paths else self.catalog_files():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    catalog = json.load(f)
+            except (OSError, ValueError) as e:
+                if paths:
+                    raise
+                logger.warning(f"   ⚠️ Skipping {path.name}: {e}")
+                continue
+            if isinstance(catalog, dict) and "products" in catalog:
+                catalogs[path] = catalog
+        return catalogs
+
+    def _refresh_sidecars(self, paths: List[Path]):
+        """Recompress the .gz/.br/.zst sidecars the forge wrote for catalogs that were rewritten."""
+        from services.artifact_compressor import ArtifactCompressor, CODECS, DEFAULT_STATE_PATH
+        formats = [fmt for fmt, (suffix, _) in CODECS.items()
+                   if any(p.with_name(p.name + suffix).exists() for p in paths)]
+        if formats:
+            # The forge's compression state, so its next run sees these sidecars as current
+            ArtifactCompressor(formats, root=self.data_dir, state_path=DEFAULT_STATE_PATH).compress(paths)
+
+    def run(self, catalog_paths: Optional[List[Path]] = None, dry_run: bool = False) -> Dict[str, Any]:
+        """Mirror every remote image the catalogs reference and rewrite them to local paths."""
+        start = time.perf_counter()
+        if not dry_run and (self.data_dir / ASSET_MANIFEST_NAME).exists():
+            raise RuntimeError(f"{self.data_dir} holds content-hashed (--deterministic) output; rewriting it in place "
+                               f"breaks its file names. Mirror while forging: forge_backbone.py --mirror-images")
+        catalogs = self.load_catalogs(catalog_paths)
+
+        urls = list(dict.fromkeys(url for catalog in catalogs.values() for url in collect_urls(catalog)))
+        hosts = Counter(urlsplit(url).hostname for url in urls)
+        logger.info(f"🪞 [MIRROR] {len(urls)} remote images on {len(hosts)} hosts in {len(catalogs)} catalogs")
+        if dry_run or not urls:
+            return {"catalogs": len(catalogs), "urls": len(urls), "hosts": dict(hosts.most_common()),
+                    "wall_s": round(time.perf_counter() - start, 3)}
+
+        results = self.mirror(urls)
+        mapping = {url: r.path for url, r in results.items() if r.path}
+
+        rewritten = []
+        for path, catalog in catalogs.items():
+            if rewrite_catalog(catalog, mapping):
+                # Keep the file's layout: the forge writes compact JSON unless --pretty
+                with open(path, 'rb') as f:
+                    pretty = f.read(2) == b'{\n'
+                dump_json(catalog, path, pretty=pretty)
+                rewritten.append(path)
+        self._refresh_sidecars(rewritten)
+
+        statuses = Counter(r.status for r in results.values())
+        fetched = [r for r in results.values() if r.status in ("downloaded", "resumed")]
+        wall = time.perf_counter() - start
+        report = {
+            "catalogs": len(catalogs),
+            "catalogs_rewritten": len(rewritten),
+            "urls": len(urls),
+            "hosts": len(hosts),
+            "status": dict(statuses),
+            "bytes": sum(r.size for r in fetched),
+            "wall_s": round(wall, 3),
+            "images_per_s": round(len(fetched) / wall, 2) if wall else 0.0,
+            "failed": sorted(r.url for r in results.values() if r.status == "failed"),
+        }
+        logger.info(f"   ✅ [MIRROR] {', '.join(f'{n} {s}' for s, n in sorted(statuses.items()))} in {wall:.1f}s "
+                    f"({report['images_per_s']:.1f} images/s, {report['bytes'] / 1e6:.1f} MB); "
+                    f"{len(rewritten)} catalogs rewritten")
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mirror remote catalog images locally and rewrite the catalogs")
+    parser.add_argument("catalogs", nargs="*", help="Catalog files (default: every brand catalog in --data-dir)")
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR))
+    parser.add_argument("--per-host", type=int, default=PER_HOST_LIMIT, help="Concurrent downloads per host")
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS)
+    parser.add_argument("--dry-run", action="store_true", help="Only count the remote images per host")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # One INFO line per request otherwise
+    mirror = ImageMirror(Path(args.data_dir), per_host=args.per_host, max_connections=args.max_connections)
+    try:
+        report = mirror.run(args.catalogs or None, dry_run=args.dry_run)
+    except RuntimeError as e:
+        logger.error(f"❌ [MIRROR] {e}")
+        return 1
+    print(json.dumps({k: v for k, v in report.items() if k != "failed"}, indent=2))
+    return 1 if report.get("failed") else 0
+
+
+if __name__ == "__main__":
+    exit(main())
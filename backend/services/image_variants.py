@@ -0,0 +1,174 @@
+# backend/services/image_variants.py
+"""
+Image Variants - Responsive Widths and Formats from One Decode
+
+VisualFactory renders one 400x400 thumbnail and one inspection image of up to
+2400 px. A 160 px grid tile still downloads the full thumbnail, and a phone
+opening the inspection view pulls megabytes.
+
+For every rendered tier the generator writes a width ladder in WebP, and in
+AVIF when Pillow can encode it:
+
+    <base>_thumb-160w.webp   <base>_thumb-160w.avif   ...
+    <base>_inspect-640w.webp <base>_inspect-640w.avif ...
+
+All variants come from the image already in memory, each width resized from
+the next larger one (never from the source file again, never upscaled). The
+full-size WebP is the existing _thumb.webp / _inspect.webp. The result is a
+manifest the frontend uses to pick the smallest sufficient file, with public
+URLs relative to the web root (frontend/public -> "/"):
+
+    {"thumbnail": {"width": 400, "height": 400,
+                   "webp": {"srcset": "/data/product_images/roland/x_thumb-160w.webp 160w, ...",
+                            "files": [{"src", "width", "height", "bytes"}, ...]},
+                   "avif": {...}},
+     "inspection": {...}}
+"""
+
+import json
+import logging
+import os
+import posixpath
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote, unquote
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+    features = None
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_WIDTHS = (160, 240, 320)  # Plus the full 400 px thumbnail
+INSPECTION_WIDTHS = (640, 960, 1280, 1920)  # Plus the full inspection image
+MIN_SCALE_STEP = 0.9  # Skip a width within 10% of the one above it
+# Per format: Pillow save() arguments for variants
+ENCODERS = {
+    "webp": {"format": "WEBP", "quality": 85, "method": 6},
+    "avif": {"format": "AVIF", "quality": 60, "speed": 8},  # Same size as speed 6 here, ~4x faster
+}
+MANIFEST_SUFFIX = "_variants.json"
+DEFAULT_PUBLIC_ROOT = Path("../frontend/public")  # Served as "/": variant URLs are relative to it
+
+_warned_outside = set()  # Output directories already reported as outside the web root
+
+
+def available_formats(requested: Iterable[str] = ("webp", "avif")) -> List[str]:
+    """Requested formats this Pillow build can encode (AVIF needs Pillow >= 11.3 built with libavif)."""
+    if features is None:
+        return []
+    return [fmt for fmt in requested if fmt in ENCODERS and features.check(fmt)]
+
+
+def variant_path(output_base: str, tier: str, width: int, fmt: str) -> str:
+    return f"{output_base}_{tier}-{width}w.{fmt}"
+
+
+def public_url(path: str, public_root: Optional[Path] = None) -> Optional[str]:
+    """URL of a file under the web root ("/data/product_images/..."), or None when it is outside."""
+    rel = os.path.relpath(os.path.abspath(path), os.path.abspath(public_root or DEFAULT_PUBLIC_ROOT))
+    if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+        return None
+    return "/" + quote(Path(rel).as_posix())
+
+
+def _file_entry(path: str, image) -> Dict[str, Any]:
+    src = public_url(path)
+    if src is None:
+        # Not servable as-is (output outside the web root): keep the path so nothing is lost
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory not in _warned_outside:
+            _warned_outside.add(directory)
+            logger.warning(f"      ⚠️ {directory} is outside the web root {DEFAULT_PUBLIC_ROOT}: "
+                           f"variants recorded as file paths")
+        src = path
+    return {"src": src, "width": image.width, "height": image.height, "bytes": os.path.getsize(path)}
+
+
+def _save(image, path: str, fmt: str):
+    tmp = f"{path}.tmp"
+    image.save(tmp, **ENCODERS[fmt])
+    os.replace(tmp, path)
+
+
+def render_variants(image, output_base: str, tier: str, widths: Iterable[int], formats: Iterable[str],
+                    full_size: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Write the width ladder of `image` (PIL, already rendered) for one tier.
+
+    Args:
+        widths: Target widths; those not smaller than the image are dropped
+        full_size: {format: path} of full-size files already written (e.g. the legacy _thumb.webp)
+
+    Returns:
+        {"width", "height", <format>: {"srcset", "files": [...smallest first]}}
+    """
+    full_size = full_size or {}
+    ladder = sorted({w for w in widths if w < image.width * MIN_SCALE_STEP}, reverse=True)
+
+    # Cascade down: each width from the next larger rendition (cheaper than from full size every time)
+    renditions = [image]
+    for width in ladder:
+        previous = renditions[-1]
+        height = max(1, round(image.height * width / image.width))
+        renditions.append(previous.resize((width, height), Image.Resampling.LANCZOS))
+
+    manifest: Dict[str, Any] = {"width": image.width, "height": image.height}
+    for fmt in formats:
+        files = []
+        for rendition in reversed(renditions):
+            if rendition is image and fmt in full_size:
+                files.append(_file_entry(full_size[fmt], image))
+                continue
+            path = variant_path(output_base, tier, rendition.width, fmt)
+            _save(rendition, path, fmt)
+            files.append(_file_entry(path, rendition))
+        manifest[fmt] = {
+            "srcset": ", ".join(f"{f['src']} {f['width']}w" for f in files),
+            "files": files,
+        }
+    return manifest
+
+
+def manifest_path(output_base: str) -> Path:
+    return Path(f"{output_base}{MANIFEST_SUFFIX}")
+
+
+def save_manifest(output_base: str, variants: Dict[str, Any]):
+    path = manifest_path(output_base)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(variants, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _local_file(output_base: str, src: str) -> str:
+    """Filesystem path of a variant: every file of an asset set sits next to `output_base`."""
+    return os.path.join(os.path.dirname(output_base), posixpath.basename(unquote(src)))
+
+
+def load_manifest(output_base: str) -> Optional[Dict[str, Any]]:
+    """
+    Variants recorded for `output_base`, or None when missing, a listed file is
+    gone, or a URL no longer matches the file's place under the web root.
+    """
+    try:
+        variants = json.loads(manifest_path(output_base).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    for tier in variants.values():
+        for fmt, entry in tier.items():
+            if not isinstance(entry, dict):
+                continue
+            for f in entry["files"]:
+                path = _local_file(output_base, f["src"])
+                if not os.path.exists(path) or f["src"] != (public_url(path) or path):
+                    return None
+    return variants
+
+
+def smallest_sufficient(tier: Dict[str, Any], width: int, fmt: str = "webp") -> Optional[Dict[str, Any]]:
+    """Smallest file of `fmt` at least `width` px wide (the largest one when none is)."""
+    files = tier.get(fmt, {}).get("files", [])
+    return next((f for f in files if f["width"] >= width), files[-1] if files else None)
@@ -0,0 +1,37 @@
+# backend/services/language_filter.py
+"""
+Language Filter - Precompiled Hebrew / ASCII Classifiers
+
+Halilit records carry Hebrew names and descriptions; the UI is English-only.
+Every per-product Hebrew check in the forge goes through these helpers: one
+compiled character class scanned by the regex engine in C, instead of a
+Python-level loop over each character.
+"""
+
+import re
+from typing import Any
+
+HEBREW_RANGE = '\u0590-\u05FF'
+
+_HEBREW = re.compile(f'[{HEBREW_RANGE}]')
+_HEBREW_RUNS = re.compile(f'[{HEBREW_RANGE}]+')
+_NON_ASCII_RUNS = re.compile(r'[^\x00-\x7F]+')
+
+
+def has_hebrew(text: Any) -> bool:
+    """True if `text` is a string containing at least one Hebrew character."""
+    return isinstance(text, str) and _HEBREW.search(text) is not None
+
+
+def strip_hebrew(text: str) -> str:
+    """Remove Hebrew characters (whitespace is left for the caller to normalize)."""
+    if not text:
+        return ""
+    return _HEBREW_RUNS.sub('', text)
+
+
+def ascii_only(text: str) -> str:
+    """Keep the ASCII characters only (the English part of a mixed name)."""
+    if not text:
+        return ""
+    return _NON_ASCII_RUNS.sub('', text)
@@ -7,12 +7,20 @@ catalogs from data/catalogs_brand/ and converts them to blueprint format
 that GenesisBuilder can consume.
 
 This is much faster and reliable since your data is already rich and validated.
+Catalogs are converted as a stream, one product at a time.
 """
 
 import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.catalog_writer import dump_json_list
+from services.product_stream import ProductStream
 
 
 class LocalBlueprintLoader:
@@ -49,6 +57,24 @@ class LocalBlueprintLoader:
             print(f"❌ Error loading {catalog_path}: {e}")
             return None
 
+    def iter_products(self, brand_key: str) -> Optional[Iterator[Dict]]:
+        """
+        Stream a catalog's products without loading the whole file.
+        
+        Args:
+            brand_key: Brand identifier (e.g., "roland")
+            
+        Returns:
+            Product iterator or None if not found
+        """
+        catalog_path = os.path.join(self.catalogs_dir, f"{brand_key}.json")
+        
+        if not os.path.exists(catalog_path):
+            print(f"⚠️  Catalog not found: {catalog_path}")
+            return None
+        
+        return iter(ProductStream(catalog_path))
+
     def convert_to_blueprint(self, brand_key: str) -> Optional[str]:
         """
         Convert catalog to blueprint format.
@@ -59,15 +85,27 @@ class LocalBlueprintLoader:
         Returns:
             Path to blueprint file, or None on failure
         """
-        catalog = self.load_catalog(brand_key)
-        if not catalog:
+        products = self.iter_products(brand_key)
+        if products is None:
             return None
         
         print(f"📦 Converting {brand_key.upper()} catalog to blueprint...")
         
-        products = catalog.get("products", [])
-        blueprint = []
+        # Save blueprint (streamed)
+        output_path = f"backend/data/blueprints/{brand_key}_blueprint.json"
+        try:
+            count = dump_json_list(self._iter_blueprint(brand_key, products), output_path, pretty=True)
+        except Exception as e:
+            print(f"❌ Error converting {brand_key}: {e}")
+            return None
+        
+        print(f"   ✅ Converted {count} products")
+        print(f"   📄 Saved to: {output_path}")
         
+        return output_path
+
+    def _iter_blueprint(self, brand_key: str, products: Iterator[Dict]) -> Iterator[Dict]:
+        """Blueprint items for a catalog's products (products without id or name are dropped)."""
         for product in products:
             blueprint_item = {
                 "id": product.get("id", "").lower(),
@@ -80,17 +118,7 @@ class LocalBlueprintLoader:
             }
             
             if blueprint_item["id"] and blueprint_item["name"]:
-                blueprint.append(blueprint_item)
-        
-        # Save blueprint
-        output_path = f"backend/data/blueprints/{brand_key}_blueprint.json"
-        with open(output_path, 'w') as f:
-            json.dump(blueprint, f, indent=2)
-        
-        print(f"   ✅ Converted {len(blueprint)} products")
-        print(f"   📄 Saved to: {output_path}")
-        
-        return output_path
+                yield blueprint_item
 
     def _extract_image_url(self, product: Dict) -> str:
         """
@@ -0,0 +1,121 @@
+# backend/services/match_cache.py
+"""
+Match Cache - Persistent Commercial ↔ Official Pairings
+
+Remembers, per brand, which brand-site record each Halilit product name was
+paired with (and its score), so steady-state rebuilds skip fuzzy matching.
+
+Storage: one JSON file per brand under the cache directory, so thread and
+process forge workers never write the same file. save() drops the entries a
+run did not use, so every consumer keeps its own directory (the forge:
+data/cache/matches, GenesisBuilder: data/cache/matches/genesis).
+
+Invalidation:
+- A positive entry is reused only while both the source record and the chosen
+  target record are unchanged (fingerprint of their matching fields).
+- A negative entry ("no match") is reused only while the whole target set is
+  unchanged, since any new brand-site product could become a match.
+
+Manual corrections live in the overrides file:
+    {"roland": {"FP-30X Digital Piano": "FP-30X", "Gift Card": null}}
+A string forces the pairing with the target of that name, null forbids any match.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MATCH_FIELDS = ('name', 'sku', 'model_number')
+
+
+def record_fingerprint(record: Dict) -> str:
+    """Fingerprint of the fields the resolver actually reads."""
+    payload = json.dumps([record.get(field) for field in MATCH_FIELDS], ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def set_fingerprint(fingerprints: List[str]) -> str:
+    digest = hashlib.blake2b(digest_size=12)
+    for fp in fingerprints:
+        digest.update(fp.encode('ascii'))
+    return digest.hexdigest()
+
+
+class MatchCache:
+    """
+    On-disk match memory for one brand.
+    """
+
+    def __init__(self, brand: str, cache_dir: Path, overrides_path: Optional[Path] = None):
+        self.brand = brand
+        self.path = Path(cache_dir) / f"{brand}.json"
+        self.entries: Dict[str, Dict] = {}
+        self.overrides: Dict[str, Optional[str]] = {}
+        self._touched: set = set()
+        self._dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except Exception as e:
+                logger.warning(f"      ⚠️ Match cache for {brand} unreadable, starting fresh: {e}")
+
+        if overrides_path and Path(overrides_path).exists():
+            try:
+                with open(overrides_path, 'r', encoding='utf-8') as f:
+                    brand_overrides = json.load(f).get(brand, {})
+                self.overrides = {
+                    self._key(name): target.lower().strip() if target else None
+                    for name, target in brand_overrides.items()
+                }
+            except Exception as e:
+                logger.warning(f"      ⚠️ Match overrides unreadable: {e}")
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return (name or '').lower().strip()
+
+    def override(self, name: str) -> Tuple[bool, Optional[str]]:
+        """(has_override, forced target name or None to forbid matching)."""
+        key = self._key(name)
+        if key in self.overrides:
+            return True, self.overrides[key]
+        return False, None
+
+    def get(self, name: str, source_fp: str) -> Optional[Dict]:
+        # Keyed by name *and* source fingerprint: an edited record simply misses
+        key = f"{self._key(name)}|{source_fp}"
+        entry = self.entries.get(key)
+        if entry:
+            self._touched.add(key)
+        return entry
+
+    def put(self, name: str, source_fp: str, target_fp: Optional[str], target_name: Optional[str],
+            score: float, targets_fp: str):
+        key = f"{self._key(name)}|{source_fp}"
+        self.entries[key] = {
+            "target_fp": target_fp,
+            "target_name": target_name,
+            "score": round(score, 4),
+            # Only consulted for negative entries
+            "targets_fp": targets_fp if target_fp is None else None,
+        }
+        self._touched.add(key)
+        self._dirty = True
+
+    def save(self):
+        """Persist entries used by this run (stale names are dropped)."""
+        stale = set(self.entries) - self._touched
+        if not self._dirty and not stale:
+            return
+        for key in stale:
+            del self.entries[key]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        self._dirty = False
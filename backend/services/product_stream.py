@@ -0,0 +1,176 @@
+# backend/services/product_stream.py
+"""
+Product Stream - Constant-Memory Iteration over Catalog Files
+
+Source catalogs come in two shapes:
+- blueprint / commercial files: a top-level list of products
+- legacy catalogs (roland_blueprint.json, vault files): an object with brand
+  metadata next to a "products" list
+
+ProductStream yields the products one at a time from either shape without
+ever holding the whole file (or the whole product list) in memory. Parsing
+uses the stdlib C scanner (JSONDecoder.raw_decode) on a sliding buffer, so a
+100k-SKU feed costs the memory of one product plus one read chunk.
+
+    stream = ProductStream(path)
+    header = stream.header()      # {} for list files, brand metadata otherwise
+    for product in stream:
+        ...
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Union
+
+CHUNK_SIZE = 64 * 1024
+PRODUCTS_KEY = "products"
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _JsonCursor:
+    """Incremental reader over one JSON document, refilling its buffer on demand."""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, at_least: int = 0) -> bool:
+        """Read more text; False at end of file."""
+        if self._eof:
+            return False
+        # Drop consumed text so the buffer stays about one chunk long
+        if self._pos > self._chunk_size:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        data = self._file.read(max(self._chunk_size, at_least))
+        if not data:
+            self._eof = True
+            return False
+        self._buffer += data
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self._buffer, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Value runs past the buffer: read more (doubling, so huge values stay linear)
+                if self._fill(len(self._buffer) - self._pos):
+                    continue
+                raise
+            # A number or literal ending exactly at the buffer edge may be cut short
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Yield the elements of the array starting at the cursor."""
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self._pos += 1
+                continue
+            self.expect(']')
+            return
+
+    def skip_items(self):
+        for _ in self.items():
+            pass
+
+    def fields(self) -> Iterator[str]:
+        """Yield the keys of the object starting at the cursor; read each value before the next key."""
+        self.expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self._pos += 1
+                continue
+            self.expect('}')
+            return
+
+
+class ProductStream:
+    """
+    Iterate the products of one catalog file. Each iteration re-opens the
+    file, so a stream can be consumed more than once.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._is_list = None
+
+    def _open(self):
+        return open(self.path, 'r', encoding='utf-8')
+
+    @property
+    def is_list(self) -> bool:
+        """True for blueprint-style files (top-level product list)."""
+        if self._is_list is None:
+            with self._open() as f:
+                self._is_list = _JsonCursor(f, 1024).peek() == '['
+        return self._is_list
+
+    def header(self) -> Dict[str, Any]:
+        """Top-level fields other than "products" ({} for list files). Products are skipped, not kept."""
+        if self.is_list:
+            return {}
+        header = {}
+        with self._open() as f:
+            cursor = _JsonCursor(f, self.chunk_size)
+            for key in cursor.fields():
+                if key == PRODUCTS_KEY and cursor.peek() == '[':
+                    cursor.skip_items()
+                else:
+                    header[key] = cursor.value()
+        return header
+
+    def __iter__(self) -> Iterator[Dict]:
+        with self._open() as f:
+            cursor = _JsonCursor(f, self.chunk_size)
+            if cursor.peek() == '[':
+                yield from cursor.items()
+                return
+            for key in cursor.fields():
+                if key == PRODUCTS_KEY and cursor.peek() == '[':
+                    yield from cursor.items()
+                else:
+                    cursor.value()
+
+
+def iter_products(path: Union[str, Path]) -> Iterator[Dict]:
+    """Shorthand for iterating a catalog file's products."""
+    return iter(ProductStream(path))
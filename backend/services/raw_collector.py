@@ -1,12 +1,14 @@
 # backend/services/raw_collector.py
-import json
 import os
 from datetime import datetime
 from typing import Dict, Any
 
+from services.catalog_writer import dump_json
+
 class RawCollector:
-    def __init__(self, base_path="backend/data/raw_landing_zone"):
+    def __init__(self, base_path="backend/data/raw_landing_zone", pretty=True):
         self.base_path = base_path
+        self.pretty = pretty
 
     def save_as_is(self, brand: str, model: str, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -34,7 +36,6 @@ class RawCollector:
         safe_model = safe_model.lower().replace(' ', '_').replace('__', '_')
         
         filename = f"{safe_model}_raw.json"
-        with open(os.path.join(brand_path, filename), "w", encoding="utf-8") as f:
-            json.dump(wrapper, f, indent=2, ensure_ascii=False)
+        dump_json(wrapper, os.path.join(brand_path, filename), pretty=self.pretty)
         
         return wrapper
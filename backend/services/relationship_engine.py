@@ -93,6 +93,8 @@ class ProductRelationshipEngine:
             relationships = self.discover_relationships(product)
             
             # Enrich product with relationship data
+            # Shallow copy on purpose: relationship lists hold the *original*
+            # candidate dicts, enriching in place would create reference cycles
             enriched_product = product.copy()
             enriched_product["necessities"] = relationships["necessities"]
             enriched_product["accessories"] = relationships["accessories"]
@@ -0,0 +1,134 @@
+# backend/services/source_registry.py
+"""
+Source Registry - One Brand, One Set of Input Files
+
+The blueprint directory holds up to three kinds of file per brand:
+- <brand>_blueprint.json    Halilit catalog (or, for object-format files like
+                            roland_blueprint.json, scraped brand-site output)
+- <brand>_commercial.json   Halilit commercial feed
+- <brand>_brand.json        Brand-site data (also <brand>-brand.json)
+
+SourceRegistry scans the directory once (names only, one scandir) and groups
+the files by brand, so each brand is forged exactly once from all its inputs
+instead of every file becoming its own "brand" and every brand probing a list
+of candidate paths.
+
+Roles, decided per brand when it is forged:
+- commerce: the records that become products (prices, Halilit links). The
+  blueprint, unless it is empty or object-format brand-site output, in which
+  case the commercial feed.
+- content: brand-site records merged into them (names, descriptions, specs).
+  The _brand file, else whichever of blueprint / commercial is not commerce.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from services.product_stream import ProductStream
+
+logger = logging.getLogger(__name__)
+
+# Filename suffix -> role, most specific first
+SUFFIX_ROLES = (
+    ("_blueprint.json", "blueprint"),
+    ("_commercial.json", "commercial"),
+    ("_brand.json", "brand_site"),
+    ("-brand.json", "brand_site"),
+)
+
+
+def brand_key(filename: str) -> str:
+    """Brand part of a source filename ("roland_commercial.json" -> "roland")."""
+    for suffix, _ in SUFFIX_ROLES:
+        if filename.endswith(suffix):
+            return filename[:-len(suffix)]
+    return Path(filename).stem
+
+
+def _has_products(path: Optional[Path]) -> bool:
+    if path is None:
+        return False
+    try:
+        return next(iter(ProductStream(path)), None) is not None
+    except Exception as e:
+        logger.warning(f"      ⚠️ Unreadable source {path.name}: {e}")
+        return False
+
+
+@dataclass
+class BrandSources:
+    """The input files of one brand (any of them may be missing)."""
+    key: str
+    blueprint: Optional[Path] = None
+    commercial: Optional[Path] = None
+    brand_site: Optional[Path] = None
+    # Files that claimed a role already taken (e.g. both _brand and -brand)
+    extra: List[Path] = field(default_factory=list)
+
+    @property
+    def files(self) -> List[Path]:
+        """Every input file (hashed for incremental builds)."""
+        return [p for p in (self.blueprint, self.commercial, self.brand_site) if p is not None]
+
+    @property
+    def name(self) -> str:
+        """Stable identifier (manifest key, profiler label): the brand's primary filename."""
+        return (self.blueprint or self.commercial or self.brand_site).name
+
+    def commerce(self) -> Optional[Path]:
+        """File whose records become the brand's products."""
+        if self.blueprint is not None and self.commercial is not None:
+            # Object-format blueprints are scraped brand-site output, not Halilit data
+            if not ProductStream(self.blueprint).is_list or not _has_products(self.blueprint):
+                return self.commercial
+        return self.blueprint or self.commercial
+
+    def content(self, commerce: Optional[Path]) -> Optional[Path]:
+        """Brand-site file merged into the commerce records (never the commerce file itself)."""
+        for candidate in (self.brand_site, self.blueprint, self.commercial):
+            if candidate is not None and candidate != commerce:
+                return candidate
+        return None
+
+
+class SourceRegistry:
+    """
+    brand key -> BrandSources for one source directory.
+    """
+
+    def __init__(self, source_dir: Path):
+        self.source_dir = Path(source_dir)
+        self.brands: Dict[str, BrandSources] = {}
+
+    def scan(self) -> "SourceRegistry":
+        self.brands = {}
+        if not self.source_dir.exists():
+            return self
+        with os.scandir(self.source_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_file() and entry.name.endswith(".json"))
+        for filename in names:
+            self.add(self.source_dir / filename)
+        return self
+
+    def add(self, path: Path):
+        key = brand_key(path.name)
+        role = next((role for suffix, role in SUFFIX_ROLES if path.name.endswith(suffix)), "blueprint")
+        sources = self.brands.setdefault(key, BrandSources(key))
+        if getattr(sources, role) is None:
+            setattr(sources, role, path)
+        else:
+            sources.extra.append(path)
+            logger.debug(f"      ℹ️ {path.name}: {key} already has a {role} source, ignored")
+
+    def forgeable(self) -> List[BrandSources]:
+        """Brands with something to sell (a blueprint or commercial feed); brand-site-only groups are skipped."""
+        return [s for s in self.brands.values() if s.blueprint is not None or s.commercial is not None]
+
+    def __iter__(self) -> Iterator[BrandSources]:
+        return iter(self.brands.values())
+
+    def __len__(self) -> int:
+        return len(self.brands)
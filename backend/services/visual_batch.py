@@ -0,0 +1,180 @@
+# backend/services/visual_batch.py
+"""
+Visual Batch Engine - Parallel Product Image Processing
+
+VisualFactory.process_product_asset() runs background removal (rembg / U²-Net)
+per image. Called without a session, rembg loads the model for every image,
+and a catalog processed one product at a time leaves every other core idle.
+
+The engine fans images out to a process pool. Each worker creates ONE rembg
+session when it starts and reuses it for every image it gets. Results stream
+back as they complete (bounded number in flight, so a 10k-image brand does
+not queue 10k futures), and the run reports throughput and per-image latency.
+
+    engine = VisualBatchEngine(workers=8)
+    for result in engine.run(jobs):          # jobs: [ImageJob, ...]
+        ...
+    engine.stats()   # {"images", "failed", "wall_s", "images_per_s", "latency_ms": {...}, "per_worker": {...}}
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "u2net"
+IN_FLIGHT_PER_WORKER = 2  # Queued jobs per worker: enough to hide result hand-off, no more
+
+
+@dataclass
+class ImageJob:
+    """One product image to turn into a thumbnail + inspection asset."""
+    product_id: str
+    image_url: str
+    output_base: str
+    force: bool = False
+
+
+# --- Worker side: one VisualFactory + rembg session per process ---
+_WORKER_FACTORY = None
+
+
+def _init_visual_worker(model: str, cache_dir: Optional[str] = None, fast_background: bool = True,
+                        variant_formats: Tuple[str, ...] = ("webp", "avif")):
+    global _WORKER_FACTORY
+    from rembg import new_session
+    from services.image_cache import ImageCache
+    from services.visual_factory import VisualFactory
+    cache = ImageCache(Path(cache_dir)) if cache_dir else None
+    _WORKER_FACTORY = VisualFactory(session=new_session(model), cache=cache, fast_background=fast_background,
+                                   variant_formats=variant_formats)
+
+
+def _process_in_worker(job: ImageJob) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result = _WORKER_FACTORY.process_product_asset(job.image_url, job.output_base, force_reprocess=job.force)
+    return {
+        "product_id": job.product_id,
+        "result": result,
+        "latency_s": time.perf_counter() - start,
+        "worker": os.getpid(),
+    }
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class VisualBatchEngine:
+    """
+    Process-pool image pipeline with per-worker rembg sessions.
+    """
+
+    def __init__(self, workers: Optional[int] = None, model: str = DEFAULT_MODEL, cache_dir: Optional[str] = None,
+                 fast_background: bool = True, variant_formats: Iterable[str] = ("webp", "avif")):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.model = model
+        # Worker factories skip rembg for transparent / flat backgrounds unless False
+        self.fast_background = fast_background
+        # Responsive variant formats each worker renders (() = none)
+        self.variant_formats = tuple(variant_formats)
+        # Source image cache (services/image_cache.py) shared by all workers; None = no revalidation
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self._cache_status: Dict[str, int] = {}
+        self._backgrounds: Dict[str, int] = {}
+        self._regenerated = 0
+        self._latencies: List[float] = []
+        self._per_worker: Dict[int, int] = {}
+        self._failed = 0
+        self._wall = 0.0
+
+    def run(self, jobs: Iterable[ImageJob]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield {"product_id", "result", "latency_s", "worker"} per job, in completion order.
+        `result` is process_product_asset()'s dict, or None when the image failed.
+        """
+        start = time.perf_counter()
+        jobs = iter(jobs)
+        if self.workers == 1:
+            # Same code path without the pool: one session in this process
+            _init_visual_worker(*self._worker_args())
+            for job in jobs:
+                yield self._record(_process_in_worker(job))
+            self._wall = time.perf_counter() - start
+            return
+
+        limit = self.workers * IN_FLIGHT_PER_WORKER
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_visual_worker,
+                                 initargs=self._worker_args()) as executor:
+            pending = set()
+            for job in jobs:
+                pending.add(executor.submit(_process_in_worker, job))
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self._record(future.result())
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield self._record(future.result())
+        self._wall = time.perf_counter() - start
+
+    def _worker_args(self) -> tuple:
+        """_init_visual_worker() arguments: every worker builds its factory with the caller's settings."""
+        return (self.model, self.cache_dir, self.fast_background, self.variant_formats)
+
+    def _record(self, outcome: Dict[str, Any]) -> Dict[str, Any]:
+        self._latencies.append(outcome["latency_s"])
+        self._per_worker[outcome["worker"]] = self._per_worker.get(outcome["worker"], 0) + 1
+        result = outcome["result"]
+        if result is None:
+            self._failed += 1
+        else:
+            if result.get("cache"):
+                self._cache_status[result["cache"]] = self._cache_status.get(result["cache"], 0) + 1
+            if result.get("regenerated", True):
+                self._regenerated += 1
+            if result.get("background"):
+                self._backgrounds[result["background"]] = self._backgrounds.get(result["background"], 0) + 1
+        return outcome
+
+    def stats(self) -> Dict[str, Any]:
+        """Throughput and latency of the last run()."""
+        images = len(self._latencies)
+        return {
+            "workers": self.workers,
+            "model": self.model,
+            "images": images,
+            "failed": self._failed,
+            "wall_s": round(self._wall, 3),
+            "images_per_s": round(images / self._wall, 2) if self._wall else 0.0,
+            "latency_ms": {
+                "mean": round(1000 * sum(self._latencies) / images, 1) if images else 0.0,
+                "p50": round(1000 * _percentile(self._latencies, 50), 1),
+                "p95": round(1000 * _percentile(self._latencies, 95), 1),
+                "max": round(1000 * max(self._latencies, default=0.0), 1),
+            },
+            # Source revalidation outcomes (new / changed / unchanged / not_modified / fresh / stale)
+            "cache": dict(sorted(self._cache_status.items())),
+            "regenerated": self._regenerated,
+            # Rendered images by background class (only "complex" ran rembg)
+            "background": dict(sorted(self._backgrounds.items())),
+            # Worker pid -> images handled (shows skew / a stuck worker)
+            "per_worker": {str(pid): count for pid, count in sorted(self._per_worker.items())},
+        }
+
+    @staticmethod
+    def log_stats(stats: Dict[str, Any]):
+        latency = stats["latency_ms"]
+        logger.info(f"      🏭 {stats['images']} images ({stats['failed']} failed) in {stats['wall_s']:.1f}s "
+                    f"on {stats['workers']} workers: {stats['images_per_s']:.2f} images/s")
+        logger.info(f"      ⏱️  latency mean {latency['mean']:.0f} ms, p50 {latency['p50']:.0f} ms, "
+                    f"p95 {latency['p95']:.0f} ms, max {latency['max']:.0f} ms")
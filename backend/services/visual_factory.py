@@ -2,11 +2,24 @@ import io
 import json
 from pathlib import Path
 from PIL import Image, ImageEnhance, ImageFilter, ImageOps
-from rembg import remove  # Background removal AI
+from rembg import remove  # Background removal AI (pass a session, see __init__)
 import requests
+from services.background_classifier import COMPLEX, BackgroundInfo, classify_background, cut_out
+from services.image_variants import (INSPECTION_WIDTHS, THUMBNAIL_WIDTHS, available_formats, load_manifest,
+                                     render_variants, save_manifest)
 
 class VisualFactory:
-    def __init__(self):
+    def __init__(self, session=None, cache=None, fast_background: bool = True, variant_formats=("webp", "avif")):
+        # rembg session (rembg.new_session): the U²-Net model loads once and is reused for
+        # every image. Without one, rembg reloads the model on each remove() call.
+        self.session = session
+        # services.image_cache.ImageCache: revalidate sources and re-render only changed bytes.
+        # Without one, an existing thumbnail counts as done.
+        self.cache = cache
+        # Transparent / flat-background shots are cut out without the neural network
+        self.fast_background = fast_background
+        # Responsive width ladders next to each asset (services/image_variants.py); () = none
+        self.variant_formats = available_formats(variant_formats)
         # Enhanced Configuration for "Perfect Visual Outcome"
         self.thumb_size = (400, 400)  # Larger thumbnails for prominence
         self.detail_max_dim = 2400 
@@ -46,22 +59,51 @@ class VisualFactory:
         2. Inspection Asset (High Res, Enhanced for Detail)
         """
         try:
-            # Skip if already processed and not forcing reprocess
             thumb_path = f"{output_path_base}_thumb.webp"
-            if not force_reprocess and Path(thumb_path).exists():
-                return {
-                    "thumbnail_url": thumb_path,
-                    "inspection_url": f"{output_path_base}_inspect.webp"
-                }
+            inspect_path = f"{output_path_base}_inspect.webp"
+            source = None
+            
+            # Assets rendered before variants existed are re-rendered once
+            variants = load_manifest(output_path_base) if self.variant_formats else {}
+            
+            if self.cache is None:
+                # Skip if already processed and not forcing reprocess
+                if not force_reprocess and Path(thumb_path).exists() and variants is not None:
+                    return {
+                        "thumbnail_url": thumb_path,
+                        "inspection_url": inspect_path,
+                        "variants": variants
+                    }
+                
+                # 1. Fetch original image
+                response = requests.get(image_url, stream=True, timeout=10)
+                response.raise_for_status()
+                data = response.content
+            else:
+                # 1. Fetch original image (conditional GET against the cached copy)
+                source = self.cache.fetch(image_url)
+                data = source.data
+                # Skip only when the assets on disk were rendered from these exact bytes
+                if (not force_reprocess and self.cache.is_current(image_url, output_path_base, source.sha256)
+                        and Path(thumb_path).exists() and Path(inspect_path).exists() and variants is not None):
+                    return {
+                        "thumbnail_url": thumb_path,
+                        "inspection_url": inspect_path,
+                        "variants": variants,
+                        "source_sha256": source.sha256,
+                        "cache": source.status,
+                        "regenerated": False
+                    }
             
-            # 1. Fetch original image
-            response = requests.get(image_url, stream=True, timeout=10)
-            response.raise_for_status()
-            original = Image.open(io.BytesIO(response.content))
+            original = Image.open(io.BytesIO(data))
 
             # --- TIER 1: UI THUMBNAIL (Precise Auto-Crop & Normalize) ---
-            # Remove background for clean floating look
-            nobg = remove(original)
+            # Remove background for clean floating look (rembg only for complex backgrounds)
+            background = classify_background(original) if self.fast_background else BackgroundInfo(COMPLEX)
+            if background.kind == COMPLEX:
+                nobg = remove(original, session=self.session)
+            else:
+                nobg = cut_out(original, background)
             
             # Convert to RGBA if not already
             if nobg.mode != 'RGBA':
@@ -120,26 +162,63 @@ class VisualFactory:
             # Apply unsharp mask for clarity
             inspection = inspection.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
             
-            inspect_path = f"{output_path_base}_inspect.webp"
             inspection.save(inspect_path, format="WEBP", quality=95, method=6)
 
-            return {
+            # --- RESPONSIVE VARIANTS (smaller widths, WebP + AVIF, from the images in memory) ---
+            variants = {}
+            if self.variant_formats:
+                variants = {
+                    "thumbnail": render_variants(thumb_canvas, output_path_base, "thumb", THUMBNAIL_WIDTHS,
+                                                 self.variant_formats, full_size={"webp": thumb_path}),
+                    "inspection": render_variants(inspection, output_path_base, "inspect", INSPECTION_WIDTHS,
+                                                  self.variant_formats, full_size={"webp": inspect_path}),
+                }
+                save_manifest(output_path_base, variants)
+
+            result = {
                 "thumbnail_url": thumb_path,
                 "inspection_url": inspect_path,
+                "background": background.kind,
+                "variants": variants,
                 "dimensions": {
                     "thumb": {"width": new_w, "height": new_h},
                     "original": {"width": original.width, "height": original.height}
                 }
             }
+            if source is not None:
+                self.cache.mark_rendered(image_url, output_path_base, source.sha256)
+                result.update({"source_sha256": source.sha256, "cache": source.status, "regenerated": True})
+            return result
 
         except Exception as e:
             print(f"⚠️ Visual Factory Error for {image_url}: {e}")
             return None
     
-    def batch_reprocess_catalog(self, catalog_path: str, output_dir: str, force: bool = False):
+    @staticmethod
+    def _product_image_url(product: dict):
+        image_url = product.get('image_url') or product.get('image')
+        if not image_url:
+            return None
+        
+        # Handle images object
+        if isinstance(product.get('images'), dict):
+            image_url = product['images'].get('main') or product['images'].get('thumbnail') or image_url
+        elif isinstance(product.get('images'), list) and product['images']:
+            image_url = product['images'][0].get('url', image_url)
+        return image_url
+    
+    def batch_reprocess_catalog(self, catalog_path: str, output_dir: str, force: bool = False,
+                                workers: int = None, model: str = "u2net", cache_dir: str = "data/cache/images"):
         """
-        Reprocess all products in a catalog with normalized thumbnails
+        Reprocess all products in a catalog with normalized thumbnails.
+        
+        Images are fanned out to a process pool (services/visual_batch.py) where
+        each worker holds one rembg session; results are applied as they complete.
+        Sources are revalidated through the image cache at `cache_dir` (None disables
+        it): assets are re-rendered only when the source bytes changed, or with `force`.
         """
+        from services.visual_batch import ImageJob, VisualBatchEngine
+        
         with open(catalog_path, 'r') as f:
             catalog = json.load(f)
         
@@ -151,30 +230,31 @@ class VisualFactory:
         
         products = catalog.get('products', [])
         total = len(products)
+        # Workers build their own factories: hand them this one's settings
+        engine = VisualBatchEngine(workers=workers, model=model, cache_dir=cache_dir,
+                                   fast_background=self.fast_background, variant_formats=self.variant_formats)
         
-        print(f"\n🏭 Visual Factory: Processing {total} products...")
+        print(f"\n🏭 Visual Factory: Processing {total} products on {engine.workers} workers...")
         print(f"📁 Output: {output_dir}")
         print(f"🔄 Force reprocess: {force}\n")
         
+        jobs = []
+        by_id = {}
         for idx, product in enumerate(products, 1):
             product_id = product.get('id', f'product_{idx}')
-            image_url = product.get('image_url') or product.get('image')
+            image_url = self._product_image_url(product)
             
             if not image_url:
                 print(f"⏭️  [{idx}/{total}] {product.get('name', 'Unknown')}: No image URL")
                 continue
             
-            # Handle images object
-            if isinstance(product.get('images'), dict):
-                image_url = product['images'].get('main') or product['images'].get('thumbnail') or image_url
-            elif isinstance(product.get('images'), list) and product['images']:
-                image_url = product['images'][0].get('url', image_url)
-            
-            output_base = output_path / product_id
-            
-            print(f"🖼️  [{idx}/{total}] {product.get('name', 'Unknown')[:40]}...")
-            
-            result = self.process_product_asset(str(image_url), str(output_base), force_reprocess=force)
+            by_id[product_id] = product
+            jobs.append(ImageJob(product_id, str(image_url), str(output_path / product_id), force))
+        
+        for done, outcome in enumerate(engine.run(jobs), 1):
+            product = by_id[outcome['product_id']]
+            result = outcome['result']
+            name = product.get('name', 'Unknown')[:40]
             
             if result:
                 # Update product with new paths
@@ -182,25 +262,38 @@ class VisualFactory:
                 product['inspection_image'] = result['inspection_url']
                 if 'dimensions' in result:
                     product['image_dimensions'] = result['dimensions']
+                if result.get('variants'):
+                    product['image_variants'] = result['variants']
                 processed_count += 1
-                print(f"   ✅ Generated thumbnail & inspection image")
+                print(f"   ✅ [{done}/{len(jobs)}] {name} ({outcome['latency_s'] * 1000:.0f} ms)")
             else:
                 failed_count += 1
-                print(f"   ❌ Failed")
+                print(f"   ❌ [{done}/{len(jobs)}] {name} failed")
         
         # Save updated catalog
         output_catalog_path = output_path / 'catalog_processed.json'
         with open(output_catalog_path, 'w') as f:
             json.dump(catalog, f, indent=2)
         
+        stats = engine.stats()
+        latency = stats['latency_ms']
         print(f"\n✨ Complete!")
         print(f"   ✅ Processed: {processed_count}/{total}")
         print(f"   ❌ Failed: {failed_count}/{total}")
+        print(f"   ⚡ Throughput: {stats['images_per_s']:.2f} images/s over {stats['wall_s']:.1f}s "
+              f"(latency p50 {latency['p50']:.0f} ms, p95 {latency['p95']:.0f} ms)")
+        if stats['background']:
+            print(f"   🎭 Backgrounds: {', '.join(f'{n} {k}' for k, n in sorted(stats['background'].items()))} "
+                  f"({stats['background'].get('complex', 0)} sent to rembg)")
+        if stats['cache']:
+            print(f"   🗄️  Sources: {', '.join(f'{n} {s}' for s, n in sorted(stats['cache'].items()))}; "
+                  f"{stats['regenerated']} re-rendered")
         print(f"   📄 Updated catalog: {output_catalog_path}")
         
         return {
             "processed": processed_count,
             "failed": failed_count,
             "total": total,
-            "output_catalog": str(output_catalog_path)
+            "output_catalog": str(output_catalog_path),
+            "throughput": stats
         }